@@ -14,19 +14,331 @@ Run: python app.py
 Then open: http://localhost:5000
 """
 
-from datetime import date, timedelta
-from flask import Flask, render_template_string, request, jsonify
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from flask import Flask, Response, g, render_template_string, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.middleware.proxy_fix import ProxyFix
+import gc
+import hmac
+import logging
+import math
+import os
+import queue
 import sys
+import time
 
 sys.path.insert(0, '/home/alex/projects/fielder_project')
 
-from fielder.services import WeatherService, QualityPredictor
-from fielder.services.data_loader import DataLoader
+from fielder.services import AppServices
+from fielder.services.app_services import CatalogRejected
+from fielder.services.weather_service import OfflineWeatherProvider, OpenMeteoProvider
+from fielder.services.rate_limit import OutboundLimiter, RateLimiter, UpstreamBusy
+from fielder.services.prediction_export import PredictionExporter
+from fielder.services.http_cache import ResponseBodyCache
+from fielder.services.day_cache import DayMemo
+from fielder.services.cultivar_predictor import harvest_status, parse_fields
+from fielder.services.status_stream import StatusBroadcaster, format_sse
+from fielder.services import instrumentation, metrics, serialization
+from fielder.services.instrumentation import span
+from fielder.services.serialization import (
+    format_month,
+    format_month_day,
+    format_month_day_year,
+    format_month_year,
+)
 from fielder.models import CROP_GDD_TARGETS, get_gdd_targets
 from fielder.models.region import US_GROWING_REGIONS
 from fielder.models.cultivar_database import CultivarDatabase
 
+logger = logging.getLogger(__name__)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by the pluggable serializer (orjson when installed).
+
+    Output is equivalent to Flask's default provider: sorted keys, compact
+    unless in debug mode, dates formatted by the default hook.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return serialization.dumps(
+            obj, sort_keys=self.sort_keys, indent="indent" in kwargs, default=self.default
+        ).decode("utf-8")
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = serialization.dumps(obj, sort_keys=self.sort_keys, indent=indent, default=self.default)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
+
+
+def _negotiate_encoding(body_size: int):
+    """Pick a Content-Encoding for this request, or None to send as-is."""
+    if body_size < serialization.COMPRESS_MIN_BYTES:
+        return None
+    return request.accept_encodings.best_match(serialization.supported_encodings())
+
+
+@app.after_request
+def compress_response(response):
+    """Compress sizeable JSON/HTML bodies for clients that accept gzip/brotli."""
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code != 200
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in serialization.COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    encoding = _negotiate_encoding(len(body))
+    if not encoding:
+        return response
+
+    response.set_data(serialization.compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+
+    # The compressed bytes differ from the identity representation
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# =============================================================================
+# STAGE TIMING - Server-Timing header + optional debug field
+# =============================================================================
+# Set FIELDER_STAGE_TIMING=0 to disable. Individual requests can still opt in
+# with ?debug=timing or an "X-Fielder-Debug: timing" header.
+
+STAGE_TIMING_ENABLED = os.environ.get("FIELDER_STAGE_TIMING", "1") != "0"
+
+
+def _timing_debug_requested() -> bool:
+    """Did the client ask for stage timings in the response body?"""
+    return (
+        request.args.get("debug") == "timing"
+        or request.headers.get("X-Fielder-Debug") == "timing"
+    )
+
+
+@app.before_request
+def start_request_clock():
+    """Note when the request started, for per-route latency metrics."""
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Count the request and observe its latency under its route rule."""
+    started = g.pop("request_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.HTTP_LATENCY.observe(time.perf_counter() - started, route=route)
+        metrics.HTTP_REQUESTS.inc(route=route, method=request.method, status=str(response.status_code))
+    return response
+
+
+@app.before_request
+def start_stage_timing():
+    """Begin recording stage spans for this request."""
+    if STAGE_TIMING_ENABLED or _timing_debug_requested():
+        g.timing_token = instrumentation.start_timing()
+
+
+@app.after_request
+def add_server_timing(response):
+    """Report recorded stages in a Server-Timing header."""
+    token = g.pop("timing_token", None)
+    if token is not None:
+        timing = instrumentation.finish_timing(token)
+        if timing is not None:
+            response.headers["Server-Timing"] = timing.server_timing_header()
+    return response
+
+
+def prediction_response(payload: dict):
+    """Serialize a prediction, adding stage timings when the client asked for them."""
+    timing = instrumentation.current_timing()
+    if timing is not None and _timing_debug_requested():
+        payload["debug_timing"] = timing.as_dict()
+
+    with span("serialize"):
+        return jsonify(payload)
+
+
+# =============================================================================
+# APPLICATION SERVICES - built once per process, warmed at startup
+# =============================================================================
+# FIELDER_WEATHER_PROVIDER=offline swaps Open-Meteo for synthetic weather
+# (load tests, offline development). FIELDER_OFFLINE_WEATHER_LATENCY_MS
+# simulates upstream round-trip time for the offline provider.
+# FIELDER_WARMUP=0 skips startup warm-up (services build on first use);
+# FIELDER_WARM_CLIMATOLOGY=1 also prefetches this month's climatology.
+# FIELDER_SHARED_CULTIVAR_DB=1 packs the cultivar database into shared
+# memory - run gunicorn with --preload so workers fork after warm-up.
+# FIELDER_CATALOG_SNAPSHOT names a snapshot written by
+# build_catalog_snapshot.py; when it matches the current sources the
+# cultivar database loads from it instead of running DataLoader.
+# FIELDER_LAZY_CATALOG=1 builds each crop's catalog data on first use
+# instead of all at startup (ignored with FIELDER_SHARED_CULTIVAR_DB). It
+# needs FIELDER_CATALOG_MANIFEST, the partition manifest written by
+# build_catalog_snapshot.py; without a current one everything loads.
+# FIELDER_COMPACT_CATALOG=1 keeps catalog records in compact slotted form
+# (see compact_cultivar_database; also ignored with the shared database).
+# FIELDER_CATALOG_RELOAD_SECONDS=N checks the snapshot file every N seconds
+# and hot-swaps the cultivar database when it changes (each worker reloads
+# its own copy). FIELDER_ADMIN_TOKEN enables POST /admin/catalog/reload.
+# FIELDER_RESEARCH_DIR imports the research JSON files in that directory
+# (fielder/data/research) into the cultivar database; changed files are
+# re-imported with the same check, or on POST /admin/catalog/import.
+# FIELDER_OUTBOUND_CONCURRENCY / FIELDER_OUTBOUND_QUEUE /
+# FIELDER_OUTBOUND_WAIT_SECONDS cap concurrent upstream weather fetches
+# per process (fetches beyond the queue get an immediate 429).
+
+WEATHER_PROVIDER = os.environ.get("FIELDER_WEATHER_PROVIDER", "open-meteo")
+OFFLINE_WEATHER_LATENCY_MS = float(os.environ.get("FIELDER_OFFLINE_WEATHER_LATENCY_MS", "0"))
+SHARED_CULTIVAR_DB = os.environ.get("FIELDER_SHARED_CULTIVAR_DB") == "1"
+CATALOG_SNAPSHOT = os.environ.get("FIELDER_CATALOG_SNAPSHOT")
+LAZY_CATALOG = os.environ.get("FIELDER_LAZY_CATALOG") == "1"
+CATALOG_MANIFEST = os.environ.get("FIELDER_CATALOG_MANIFEST")
+COMPACT_CATALOG = os.environ.get("FIELDER_COMPACT_CATALOG") == "1"
+CATALOG_RELOAD_SECONDS = float(os.environ.get("FIELDER_CATALOG_RELOAD_SECONDS", "0"))
+ADMIN_TOKEN = os.environ.get("FIELDER_ADMIN_TOKEN")
+RESEARCH_DIR = os.environ.get("FIELDER_RESEARCH_DIR")
+
+outbound_limiter = OutboundLimiter(
+    max_concurrent=int(os.environ.get("FIELDER_OUTBOUND_CONCURRENCY", "8")),
+    max_waiting=int(os.environ.get("FIELDER_OUTBOUND_QUEUE", "32")),
+    wait_timeout=float(os.environ.get("FIELDER_OUTBOUND_WAIT_SECONDS", "2")),
+)
+
+services = AppServices(
+    OfflineWeatherProvider(latency_ms=OFFLINE_WEATHER_LATENCY_MS, outbound=outbound_limiter)
+    if WEATHER_PROVIDER == "offline" else OpenMeteoProvider(outbound=outbound_limiter),
+    shared_cultivar_db=SHARED_CULTIVAR_DB,
+    catalog_snapshot=CATALOG_SNAPSHOT,
+    lazy_catalog=LAZY_CATALOG,
+    catalog_manifest=CATALOG_MANIFEST,
+    compact_catalog=COMPACT_CATALOG,
+    catalog_reload_seconds=CATALOG_RELOAD_SECONDS,
+    research_dir=RESEARCH_DIR,
+)
+
+
+@app.route('/health/ready')
+def health_ready():
+    """Readiness probe: 503 until startup warm-up has finished."""
+    status = {**services.status(), "phenology_config_problems": len(PHENOLOGY_PROBLEMS)}
+    return jsonify(status), 200 if services.ready else 503
+
+
+@app.route('/admin/catalog/reload', methods=['POST'])
+def admin_reload_catalog():
+    """Rebuild the cultivar database and swap it in (X-Admin-Token must match FIELDER_ADMIN_TOKEN)."""
+    token = request.headers.get("X-Admin-Token", "")
+    if not ADMIN_TOKEN or not hmac.compare_digest(token, ADMIN_TOKEN):
+        return jsonify({"error": "Not found"}), 404
+    try:
+        return jsonify(services.reload_cultivar_database())
+    except CatalogRejected as e:
+        return jsonify({"error": str(e), "problems": e.problems}), 422
+
+
+@app.route('/admin/catalog/import', methods=['POST'])
+def admin_import_research():
+    """Apply changed research files to the cultivar database (needs FIELDER_RESEARCH_DIR and the admin token)."""
+    token = request.headers.get("X-Admin-Token", "")
+    if not ADMIN_TOKEN or not RESEARCH_DIR or not hmac.compare_digest(token, ADMIN_TOKEN):
+        return jsonify({"error": "Not found"}), 404
+    try:
+        return jsonify(services.import_research())
+    except CatalogRejected as e:
+        return jsonify({"error": str(e), "problems": e.problems}), 422
+
+
+# =============================================================================
+# ADMISSION CONTROL - per-client rate limits
+# =============================================================================
+# FIELDER_RATE_LIMIT=1 gives each client (X-API-Key header, else client
+# address) two token buckets: "upstream" for routes that fetch weather -
+# charged once per planting date on /predict/cultivar - and "cached" for
+# everything served from loaded data. Budgets are "tokens_per_second/burst"
+# in FIELDER_RATE_CACHED and FIELDER_RATE_UPSTREAM.
+#
+# Behind a load balancer every request arrives from the balancer's address,
+# so anonymous clients would share one bucket: set FIELDER_TRUSTED_PROXIES
+# to the number of proxy hops in front of the app and the client address is
+# taken from X-Forwarded-For instead (ProxyFix trusts only that many hops).
+# Off by default for that reason.
+
+RATE_LIMIT_ENABLED = os.environ.get("FIELDER_RATE_LIMIT", "0") == "1"
+TRUSTED_PROXIES = int(os.environ.get("FIELDER_TRUSTED_PROXIES", "0"))
+
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+UPSTREAM_ROUTES = {"/predict", "/predict/cultivar", "/api/export/predictions"}
+RATE_LIMIT_EXEMPT_ROUTES = {"/health/ready", "/metrics"}
+
+
+def _budget(name: str, default: str) -> tuple[float, float]:
+    rate, _, burst = os.environ.get(name, default).partition("/")
+    return float(rate), float(burst or rate)
+
+
+rate_limiter = RateLimiter({
+    "cached": _budget("FIELDER_RATE_CACHED", "20/40"),
+    "upstream": _budget("FIELDER_RATE_UPSTREAM", "2/10"),
+})
+
+
+def _too_many_requests(message: str, retry_after: float):
+    response = jsonify({"error": message, "retry_after": round(retry_after, 1)})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def _request_cost() -> int:
+    """Upstream tokens for this request: one per requested planting date."""
+    if request.url_rule.rule == "/predict/cultivar":
+        data = request.get_json(silent=True) or {}
+        planting_dates = data.get("planting_dates")
+        if isinstance(planting_dates, list):
+            return max(1, len(planting_dates))
+    return 1
+
+
+@app.before_request
+def admit_request():
+    """Reject clients that are over their budget before any work is done."""
+    if not RATE_LIMIT_ENABLED or request.url_rule is None:
+        return None
+    rule = request.url_rule.rule
+    if rule in RATE_LIMIT_EXEMPT_ROUTES:
+        return None
+
+    client = request.headers.get("X-API-Key") or request.remote_addr or "unknown"
+    budget = "upstream" if rule in UPSTREAM_ROUTES else "cached"
+    retry_after = rate_limiter.check(client, budget, _request_cost() if budget == "upstream" else 1)
+    if retry_after is not None:
+        return _too_many_requests(f"Rate limit exceeded ({budget} requests)", retry_after)
+    return None
+
+
+@app.errorhandler(UpstreamBusy)
+def handle_upstream_busy(e):
+    """The outbound weather cap is saturated: fail fast rather than queue."""
+    return _too_many_requests("Weather service busy, retry shortly", e.retry_after)
 
 
 # =============================================================================
@@ -354,39 +666,42 @@ CROP_PHENOLOGY = {
 }
 
 
+# Region -> CROP_PHENOLOGY lookup key
+REGION_HARVEST_TYPES = {
+    # Florida
+    "indian_river": "florida",
+    "central_florida": "florida",
+    "south_florida": "florida",
+    "sweet_valley": "florida",
+    # Texas
+    "texas_rgv": "texas",
+    "texas_hill_country": "texas",
+    "texas_pecan_belt": "texas",
+    # California
+    "california_central_valley": "california",
+    "california_coastal": "california",
+    "california_southern_desert": "california",
+    # Pacific NW
+    "pacific_nw_yakima": "washington",
+    "pacific_nw_wenatchee": "washington",
+    "pacific_nw_hood_river": "washington_oregon",
+    # Midwest
+    "michigan_west": "michigan",
+    "michigan_southwest": "michigan",
+    "wisconsin_door_county": "michigan",
+    # Northeast
+    "new_york_hudson_valley": "new_york",
+    "new_york_finger_lakes": "new_york",
+    "pennsylvania_adams_county": "new_york",
+    "new_jersey_pine_barrens": "new_jersey",
+    # Georgia
+    "georgia_piedmont": "georgia",
+}
+
+
 def get_region_harvest_type(region_id: str) -> str:
     """Map region_id to harvest window lookup key."""
-    region_mapping = {
-        # Florida
-        "indian_river": "florida",
-        "central_florida": "florida",
-        "south_florida": "florida",
-        "sweet_valley": "florida",
-        # Texas
-        "texas_rgv": "texas",
-        "texas_hill_country": "texas",
-        "texas_pecan_belt": "texas",
-        # California
-        "california_central_valley": "california",
-        "california_coastal": "california",
-        "california_southern_desert": "california",
-        # Pacific NW
-        "pacific_nw_yakima": "washington",
-        "pacific_nw_wenatchee": "washington",
-        "pacific_nw_hood_river": "washington_oregon",
-        # Midwest
-        "michigan_west": "michigan",
-        "michigan_southwest": "michigan",
-        "wisconsin_door_county": "michigan",
-        # Northeast
-        "new_york_hudson_valley": "new_york",
-        "new_york_finger_lakes": "new_york",
-        "pennsylvania_adams_county": "new_york",
-        "new_jersey_pine_barrens": "new_jersey",
-        # Georgia
-        "georgia_piedmont": "georgia",
-    }
-    return region_mapping.get(region_id, "default")
+    return REGION_HARVEST_TYPES.get(region_id, "default")
 
 
 def get_crop_phenology(crop_id: str, region_id: str) -> dict:
@@ -407,8 +722,7 @@ def get_crop_phenology(crop_id: str, region_id: str) -> dict:
 
         # Try first available region as fallback
         if crop_data:
-            first_key = list(crop_data.keys())[0]
-            return crop_data[first_key]
+            return next(iter(crop_data.values()))
 
     # Fallback to generic GDD targets from weather.py
     targets = get_gdd_targets(crop_id)
@@ -475,6 +789,12 @@ def get_typical_bloom_date(crop_id: str, region_id: str, year: int = None) -> da
     return date(year, month, day)
 
 
+# Base daily GDD by USDA zone, calibrated for base 50F
+ZONE_BASE_GDD_50 = {
+    5: 12.0, 6: 14.0, 7: 16.0, 8: 18.0, 9: 20.0, 10: 22.0
+}
+
+
 def estimate_avg_daily_gdd(crop_id: str, region_id: str) -> float:
     """
     Estimate average daily GDD for a crop in a region.
@@ -504,11 +824,7 @@ def estimate_avg_daily_gdd(crop_id: str, region_id: str) -> float:
     zone_num = int(usda_zone.value) if usda_zone else 7
 
     # Base daily GDD varies by zone (warmer zones = higher GDD potential)
-    # These are calibrated for base 50F
-    zone_base_gdd = {
-        5: 12.0, 6: 14.0, 7: 16.0, 8: 18.0, 9: 20.0, 10: 22.0
-    }
-    daily_gdd_50 = zone_base_gdd.get(zone_num, annual_gdd_50 / frost_free_days)
+    daily_gdd_50 = ZONE_BASE_GDD_50.get(zone_num, annual_gdd_50 / frost_free_days)
 
     # Adjust for crop base temperature
     # Each 5°F above 50 reduces effective GDD by about 5 per day
@@ -531,24 +847,159 @@ def estimate_avg_daily_gdd(crop_id: str, region_id: str) -> float:
     return max(5.0, crop_daily_gdd)  # Minimum 5 GDD/day
 
 
-def get_current_season_bloom(crop_id: str, region_id: str) -> date:
+# =============================================================================
+# RESOLVED PHENOLOGY TABLE - compiled once at startup
+# =============================================================================
+# The helpers above resolve a crop/region through several tables (harvest
+# type, region type, phenology with fallbacks, generic targets, zone-based
+# GDD rate). Every viable (crop, region) pair is resolved once here into a
+# frozen record, so request handlers do a single dict lookup. Pairs that
+# fall back to another region's data or to generic defaults, or carry
+# inconsistent thresholds, are logged (debug) when the table is built.
+
+@dataclass(frozen=True)
+class PhenologyRecord:
+    """Resolved phenology for one crop in one region."""
+    crop_id: str
+    region_id: str
+    harvest_type: str               # CROP_PHENOLOGY region key
+    region_type: str                # TYPICAL_BLOOM_DATES region class
+    # Region-specific phenology (what get_crop_phenology returns)
+    bloom: tuple[int, int]
+    gdd_base: float
+    gdd_to_maturity: int
+    gdd_to_peak: int
+    gdd_window: int
+    source: str
+    # Typical bloom + generic targets used by the season overview
+    typical_bloom: tuple[int, int]
+    season_base_temp: float
+    season_gdd_to_peak: float
+    season_gdd_window: float
+    avg_daily_gdd: float
+
+    def typical_bloom_date(self, year: int) -> date:
+        """Typical bloom date in a given year."""
+        month, day = self.typical_bloom
+        return date(year, month, day)
+
+
+def _resolve_phenology(crop_id: str, region_id: str) -> PhenologyRecord:
+    """Resolve a crop/region through the lookup helpers (uncached)."""
+    phenology = get_crop_phenology(crop_id, region_id)
+    region_type = get_region_type(region_id)
+    bloom_info = TYPICAL_BLOOM_DATES.get(crop_id, {"default": (4, 15)})
+    targets = get_gdd_targets(crop_id)
+
+    return PhenologyRecord(
+        crop_id=crop_id,
+        region_id=region_id,
+        harvest_type=get_region_harvest_type(region_id),
+        region_type=region_type,
+        bloom=phenology["bloom"],
+        gdd_base=phenology["gdd_base"],
+        gdd_to_maturity=phenology["gdd_to_maturity"],
+        gdd_to_peak=phenology["gdd_to_peak"],
+        gdd_window=phenology["gdd_window"],
+        source=phenology["source"],
+        typical_bloom=bloom_info.get(region_type, bloom_info.get("default", (4, 15))),
+        season_base_temp=targets.get("base_temp", 50.0),
+        season_gdd_to_peak=targets.get("gdd_to_peak", 2000),
+        season_gdd_window=targets.get("gdd_window", 200),
+        avg_daily_gdd=estimate_avg_daily_gdd(crop_id, region_id),
+    )
+
+
+def _phenology_problems(record: PhenologyRecord) -> list[str]:
+    """Configuration problems for one resolved pair."""
+    pair = f"{record.crop_id} @ {record.region_id}"
+    crop_data = CROP_PHENOLOGY.get(record.crop_id)
+    problems = []
+
+    if crop_data is None:
+        problems.append(f"{pair}: no CROP_PHENOLOGY entry, using generic defaults")
+    elif record.harvest_type not in crop_data:
+        problems.append(
+            f"{pair}: no '{record.harvest_type}' phenology, borrowing '{next(iter(crop_data))}'"
+        )
+    if record.crop_id not in TYPICAL_BLOOM_DATES:
+        problems.append(f"{pair}: no TYPICAL_BLOOM_DATES entry, using April 15")
+
+    for label, (month, day) in (("bloom", record.bloom), ("typical bloom", record.typical_bloom)):
+        try:
+            date(2001, month, day)  # Non-leap year: Feb 29 is not a valid every-year bloom
+        except ValueError:
+            problems.append(f"{pair}: invalid {label} date {month}/{day}")
+    if record.gdd_to_peak < record.gdd_to_maturity:
+        problems.append(
+            f"{pair}: gdd_to_peak {record.gdd_to_peak} < gdd_to_maturity {record.gdd_to_maturity}"
+        )
+    if record.gdd_window <= 0 or record.season_gdd_window <= 0:
+        problems.append(f"{pair}: GDD window must be positive")
+
+    return problems
+
+
+def compile_phenology_table() -> tuple[dict[tuple[str, str], PhenologyRecord], list[str]]:
+    """Resolve every viable (crop, region) pair. Returns (table, problems)."""
+    table = {}
+    problems = [
+        f"{region_id}: in REGION_HARVEST_TYPES but not a known region"
+        for region_id in REGION_HARVEST_TYPES
+        if region_id not in US_GROWING_REGIONS
+    ]
+
+    for region_id, region in US_GROWING_REGIONS.items():
+        if region_id not in REGION_HARVEST_TYPES:
+            problems.append(f"{region_id}: no REGION_HARVEST_TYPES entry, using 'default'")
+        for crop_id in region.viable_crops:
+            record = _resolve_phenology(crop_id, region_id)
+            problems.extend(_phenology_problems(record))
+            table[(crop_id, region_id)] = record
+
+    return table, problems
+
+
+PHENOLOGY_TABLE, PHENOLOGY_PROBLEMS = compile_phenology_table()
+
+# Mostly expected fallbacks (a region borrowing a neighbour's phenology):
+# debug detail, counted in /health/ready
+for _problem in PHENOLOGY_PROBLEMS:
+    logger.debug("Phenology config: %s", _problem)
+
+
+def lookup_phenology(crop_id: str, region_id: str) -> PhenologyRecord:
+    """Resolved phenology for a pair (resolved on the fly if not precompiled)."""
+    record = PHENOLOGY_TABLE.get((crop_id, region_id))
+    if record is None:
+        record = _resolve_phenology(crop_id, region_id)
+    return record
+
+
+def get_current_season_bloom(crop_id: str, region_id: str, as_of: date = None) -> date:
     """
     Get bloom date for the CURRENT season.
 
     For crops now being harvested, returns the bloom date that led to current harvest.
     For crops not yet in season, returns upcoming bloom.
+
+    as_of evaluates the season on another day (default today). Results are
+    memoized per day.
     """
-    today = date.today()
-    this_year_bloom = get_typical_bloom_date(crop_id, region_id, today.year)
-    last_year_bloom = get_typical_bloom_date(crop_id, region_id, today.year - 1)
+    return _season_bloom_memo(crop_id, region_id, as_of=as_of)
 
-    # Get GDD targets and realistic daily GDD for this crop/region
-    targets = get_gdd_targets(crop_id)
-    gdd_to_peak = targets.get("gdd_to_peak", 2000)
-    gdd_window = targets.get("gdd_window", 200)
 
-    # Use crop-specific GDD rate
-    avg_gdd_per_day = estimate_avg_daily_gdd(crop_id, region_id)
+def _current_season_bloom(crop_id: str, region_id: str, as_of: date) -> date:
+    """Uncached get_current_season_bloom."""
+    today = as_of
+    record = lookup_phenology(crop_id, region_id)
+    this_year_bloom = record.typical_bloom_date(today.year)
+    last_year_bloom = record.typical_bloom_date(today.year - 1)
+
+    # GDD targets and realistic (crop-specific) daily GDD for this crop/region
+    gdd_to_peak = record.season_gdd_to_peak
+    gdd_window = record.season_gdd_window
+    avg_gdd_per_day = record.avg_daily_gdd
     days_to_harvest = gdd_to_peak / avg_gdd_per_day
     days_window = gdd_window / avg_gdd_per_day
 
@@ -574,6 +1025,9 @@ def get_current_season_bloom(crop_id: str, region_id: str) -> date:
             return this_year_bloom
 
 
+_season_bloom_memo = DayMemo(_current_season_bloom, name="season_bloom")
+
+
 # HTML Template
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -1386,20 +1840,29 @@ def predict():
     if crop_id not in region.viable_crops:
         return jsonify({"error": f"{crop_id} is not grown in {region.name}"})
 
-    today = date.today()
+    return prediction_response(crop_prediction(crop_id, region_id))
+
+
+def crop_prediction(crop_id: str, region_id: str, today: date = None) -> dict:
+    """Crop-level harvest prediction for a viable (crop, region) pair as of today."""
+    region = US_GROWING_REGIONS[region_id]
+    metrics.PREDICTIONS.inc(predictor="crop")
+    if today is None:
+        today = date.today()
     current_year = today.year
 
     # =========================================================================
     # GET CROP PHENOLOGY DATA (bloom date + GDD thresholds)
     # =========================================================================
-    phenology = get_crop_phenology(crop_id, region_id)
+    with span("phenology"):
+        phenology = lookup_phenology(crop_id, region_id)
 
-    bloom_month, bloom_day = phenology["bloom"]
-    gdd_base = phenology["gdd_base"]
-    gdd_to_maturity = phenology["gdd_to_maturity"]
-    gdd_to_peak = phenology["gdd_to_peak"]
-    gdd_window = phenology["gdd_window"]
-    data_source = phenology["source"]
+    bloom_month, bloom_day = phenology.bloom
+    gdd_base = phenology.gdd_base
+    gdd_to_maturity = phenology.gdd_to_maturity
+    gdd_to_peak = phenology.gdd_to_peak
+    gdd_window = phenology.gdd_window
+    data_source = phenology.source
 
     # Determine bloom date for current growing season
     # For most crops, if we're past typical harvest, use next year's bloom
@@ -1416,40 +1879,46 @@ def predict():
     # =========================================================================
     # CALCULATE GDD FROM ACTUAL WEATHER DATA
     # =========================================================================
-    weather_service = WeatherService()
+    weather_service = services.weather_service
 
     # Only fetch weather if bloom has passed
     if bloom_date < today:
         try:
             # Fetch actual historical weather from Open-Meteo
-            observations = weather_service.provider.get_historical(
-                region_id, bloom_date, today
-            )
+            with span("weather_fetch"):
+                observations = weather_service.provider.get_historical(
+                    region_id, bloom_date, today
+                )
 
             if observations:
                 # Calculate actual GDD accumulation
                 current_gdd = sum(obs.gdd(gdd_base) for obs in observations)
                 avg_daily_gdd = current_gdd / len(observations)
-                data_source = f"{phenology['source']} + Open-Meteo weather ({len(observations)} days)"
+                data_source = f"{phenology.source} + Open-Meteo weather ({len(observations)} days)"
             else:
                 # Fallback to climatology estimate
                 days_elapsed = (today - bloom_date).days
-                climatology = weather_service.provider.get_climatology(region_id, today.month)
+                with span("climatology_fallback"):
+                    climatology = weather_service.provider.get_climatology(region_id, today.month)
                 avg_daily_gdd = climatology.get("avg_daily_gdd", 15)
                 current_gdd = days_elapsed * avg_daily_gdd
-                data_source = f"{phenology['source']} + climatology estimate"
+                data_source = f"{phenology.source} + climatology estimate"
+                metrics.WEATHER_FALLBACKS.inc(predictor="crop", path="climatology")
 
+        except UpstreamBusy:
+            raise  # Answered with 429 by handle_upstream_busy
         except Exception as e:
             # Fallback if weather fetch fails
             days_elapsed = (today - bloom_date).days
             avg_daily_gdd = 20.0  # Reasonable default
             current_gdd = days_elapsed * avg_daily_gdd
-            data_source = f"{phenology['source']} (weather unavailable)"
+            data_source = f"{phenology.source} (weather unavailable)"
+            metrics.WEATHER_FALLBACKS.inc(predictor="crop", path="unavailable")
     else:
         # Bloom hasn't happened yet
         current_gdd = 0
         avg_daily_gdd = 20.0
-        data_source = f"{phenology['source']} - awaiting bloom"
+        data_source = f"{phenology.source} - awaiting bloom"
 
     # =========================================================================
     # DETERMINE HARVEST STATUS FROM GDD ACCUMULATION
@@ -1509,7 +1978,7 @@ def predict():
     if is_off_season and is_past_season and days_past_season >= 30 and crop_id not in storage_crops:
         # Project next season: use next year's bloom date
         next_year = today.year + 1 if today.month >= bloom_date.month else today.year
-        next_bloom = get_typical_bloom_date(crop_id, region_id, next_year)
+        next_bloom = phenology.typical_bloom_date(next_year)
 
         if avg_daily_gdd > 0:
             harvest_start_date = next_bloom + timedelta(days=days_bloom_to_maturity)
@@ -1536,13 +2005,13 @@ def predict():
             if days_until <= 60:
                 harvest_window = f"Next season in {days_until} days"
             else:
-                harvest_window = f"Next season: {harvest_start_date.strftime('%B %Y')}"
+                harvest_window = f"Next season: {format_month_year(harvest_start_date)}"
         elif today < harvest_start_date:
             days_until = (harvest_start_date - today).days
             if days_until <= 30:
                 harvest_window = f"Season starts in {days_until} days"
             else:
-                harvest_window = f"Season: {harvest_start_date.strftime('%B %d')}"
+                harvest_window = f"Season: {format_month_day(harvest_start_date)}"
         else:
             harvest_window = "Off-season"
     elif is_at_peak:
@@ -1558,12 +2027,12 @@ def predict():
         else:
             harvest_window = "Harvestable now"
     else:
-        harvest_window = f"Not yet - {harvest_start_date.strftime('%B')}"
+        harvest_window = f"Not yet - {format_month(harvest_start_date)}"
 
     # =========================================================================
     # QUALITY PREDICTION - Brix and Acid based on GDD progress
     # =========================================================================
-    quality_predictor = QualityPredictor()
+    quality_predictor = services.quality_predictor
     quality_model = quality_predictor.get_model_by_crop(crop_id)
 
     # Get cultivar ceiling (max Brix potential)
@@ -1589,12 +2058,13 @@ def predict():
     # current_gdd was already calculated above from real weather
 
     # Predict quality
-    predicted_brix = quality_model.predict_sugar_content(current_gdd, cultivar_brix_ceiling)
-    predicted_acid = quality_model.predict_acid_content(current_gdd)
-    brix_acid_ratio = predicted_brix / predicted_acid if predicted_acid > 0.1 else None
+    with span("quality_model"):
+        predicted_brix = quality_model.predict_sugar_content(current_gdd, cultivar_brix_ceiling)
+        predicted_acid = quality_model.predict_acid_content(current_gdd)
+        brix_acid_ratio = predicted_brix / predicted_acid if predicted_acid > 0.1 else None
 
-    peak_brix = quality_model.predict_sugar_content(gdd_to_peak, cultivar_brix_ceiling)
-    peak_acid = quality_model.predict_acid_content(gdd_to_peak)
+        peak_brix = quality_model.predict_sugar_content(gdd_to_peak, cultivar_brix_ceiling)
+        peak_acid = quality_model.predict_acid_content(gdd_to_peak)
 
     # Quality message
     if crop_id == "pecan":
@@ -1614,20 +2084,20 @@ def predict():
     if is_at_peak:
         peak_date_display = "NOW!"
     elif today > optimal_end_date:
-        peak_date_display = f"Was {peak_center_date.strftime('%B %d')}"
+        peak_date_display = f"Was {format_month_day(peak_center_date)}"
     else:
-        peak_date_display = peak_center_date.strftime("%B %d, %Y")
+        peak_date_display = format_month_day_year(peak_center_date)
 
-    return jsonify({
+    return {
         "region": region_id,
         "region_name": region.name,
         "crop": crop_id,
         "bloom_date": bloom_date.isoformat(),
         "harvest_window": harvest_window,
-        "harvest_start_date": harvest_start_date.strftime("%B %d"),
-        "harvest_end_date": harvest_end_date.strftime("%B %d"),
-        "optimal_start_date": optimal_start_date.strftime("%B %d, %Y"),
-        "optimal_end_date": optimal_end_date.strftime("%B %d, %Y"),
+        "harvest_start_date": format_month_day(harvest_start_date),
+        "harvest_end_date": format_month_day(harvest_end_date),
+        "optimal_start_date": format_month_day_year(optimal_start_date),
+        "optimal_end_date": format_month_day_year(optimal_end_date),
         "peak_date": peak_date_display,
         "progress": round(progress, 1),
         "is_harvestable": is_harvestable,
@@ -1646,7 +2116,7 @@ def predict():
         "cultivar_ceiling": cultivar_brix_ceiling,
         "quality_message": quality_message,
         "quality_unit": "% oil" if crop_id == "pecan" else "°Brix"
-    })
+    }
 
 
 # =============================================================================
@@ -1656,17 +2126,15 @@ def predict():
 # Same cultivar grown in different regions = different harvest dates.
 # Different cultivars of same crop type = different timing (early/mid/late).
 
-# Initialize the cultivar database once at module level
-_cultivar_db = None
-
 def get_cultivar_database() -> CultivarDatabase:
-    """Get or initialize the cultivar database (lazy singleton)."""
-    global _cultivar_db
-    if _cultivar_db is None:
-        _cultivar_db = CultivarDatabase()
-        loader = DataLoader(_cultivar_db)
-        loader.load_all()
-    return _cultivar_db
+    """
+    The process-wide cultivar database (loaded during startup warm-up).
+
+    Callers keep the returned version for the whole request, even if a
+    reload swaps in a newer one meanwhile.
+    """
+    services.reload_if_stale()
+    return services.cultivar_database
 
 
 @app.route('/predict/cultivar', methods=['POST'])
@@ -1706,6 +2174,11 @@ def predict_cultivar():
     - Marked as "regional-average" in response
 
     Also accepts single "planting_date" (string) for backward compatibility.
+
+    Lightweight clients can send "fields" (array or comma-separated string,
+    also accepted as ?fields=) to receive only those keys, and
+    "compact": true (or ?compact=1) for ISO dates and a status code instead
+    of display strings. Work behind unselected fields is skipped.
     """
     data = request.json
 
@@ -1725,67 +2198,48 @@ def predict_cultivar():
 
     region = US_GROWING_REGIONS[region_id]
 
+    try:
+        fields = parse_fields(data.get('fields') or request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+    compact = bool(data.get('compact')) or request.args.get('compact') in ("1", "true")
+
     # Get cultivar and regional data from database
-    db = get_cultivar_database()
-    cultivar = db.get_cultivar(cultivar_id)
-    regional_data = db.get_regional_data(cultivar_id, region_id)
+    with span("catalog_lookup"):
+        db = get_cultivar_database()
+        cultivar = db.get_cultivar(cultivar_id)
+        regional_data = db.get_regional_data(cultivar_id, region_id)
 
     # Look up rootstock if specified
     rootstock = None
-    rootstock_brix_modifier = 0.0
     if rootstock_id:
-        rootstock = db.rootstocks.get(rootstock_id)
-        if rootstock:
-            rootstock_brix_modifier = rootstock.brix_modifier
-        else:
-            # List available rootstocks for this crop
-            available_rootstocks = [
-                rs.rootstock_id for rs in db.rootstocks.values()
-                if cultivar and cultivar.crop_type in rs.crop_types
-            ]
+        rootstock = db.get_rootstock(rootstock_id)
+        if not rootstock:
+            # List available rootstocks for this crop, in catalog order
+            # (get_rootstocks() sorts by Brix modifier)
+            available_rootstocks = []
+            if cultivar:
+                compatible = {rs.rootstock_id for rs in db.get_rootstocks(cultivar.crop_type)}
+                available_rootstocks = [rid for rid in db.rootstocks if rid in compatible]
             return jsonify({
                 "error": f"Unknown rootstock: {rootstock_id}",
                 "available_rootstocks": available_rootstocks
             })
 
-    # Calculate tree age modifier based on user's research:
-    # 0-2yr: -0.8, 3-4yr: -0.5, 5-7yr: -0.2, 8-18yr: 0.0, 19-25yr: -0.2, >25yr: -0.3
-    age_brix_modifier = 0.0
-    if tree_age is not None:
-        try:
-            age = int(tree_age)
-            if age <= 2:
-                age_brix_modifier = -0.8
-            elif age <= 4:
-                age_brix_modifier = -0.5
-            elif age <= 7:
-                age_brix_modifier = -0.2
-            elif age <= 18:
-                age_brix_modifier = 0.0
-            elif age <= 25:
-                age_brix_modifier = -0.2
-            else:
-                age_brix_modifier = -0.3
-        except (ValueError, TypeError):
-            pass  # Ignore invalid tree_age
-
     if not cultivar:
         # List available cultivars for this crop type if specified
         available = [c.cultivar_id for c in db.cultivars.values()]
         return jsonify({
             "error": f"Unknown cultivar: {cultivar_id}",
+            "suggestions": services.cultivar_search.suggest(cultivar_id),
             "available_cultivars": available[:20]  # First 20
         })
 
     if not regional_data:
         # List regions that have data for this cultivar
-        regions_for_cultivar = [
-            key.split(':')[1] for key in db.regional_data.keys()
-            if key.startswith(f"{cultivar_id}:")
-        ]
         return jsonify({
             "error": f"No regional data for {cultivar.cultivar_name} in {region.name}",
-            "available_regions": regions_for_cultivar,
+            "available_regions": db.get_regions_for_cultivar(cultivar_id),
             "cultivar_info": {
                 "name": cultivar.cultivar_name,
                 "crop_type": cultivar.crop_type,
@@ -1793,16 +2247,12 @@ def predict_cultivar():
             }
         })
 
-    today = date.today()
-    current_year = today.year
-
     # =========================================================================
     # PARSE OPTIONAL PLANTING DATES (single or multiple)
     # =========================================================================
     # If grower provides their actual planting date(s), use them for precise prediction
     # Otherwise, use regional average bloom/planting dates
     grower_planting_dates = []
-    prediction_mode = "regional-average"
 
     if planting_dates_input:
         # Normalize to list
@@ -1825,382 +2275,67 @@ def predict_cultivar():
                     "expected_format": "YYYY-MM-DD (e.g., 2024-10-15)"
                 })
 
-        prediction_mode = "grower-specific"
         grower_planting_dates.sort()  # Chronological order
 
     # =========================================================================
-    # GET PHENOLOGY FROM CULTIVAR + REGIONAL DATA
-    # =========================================================================
-    # GDD parameters from cultivar research
-    gdd_base = cultivar.gdd_base_temp or 50.0
-    gdd_to_maturity = cultivar.gdd_to_maturity or 1000
-    gdd_to_peak = cultivar.gdd_to_peak or int(gdd_to_maturity * 1.15)
-
-    # Calculate GDD window - for grower-specific, use cultivar's inherent window
-    # For regional average, use historical data if available
-    if grower_planting_dates:
-        # Grower-specific: window based on cultivar genetics, not regional spread
-        # A single planting has a tighter window than region-wide staggered plantings
-        gdd_window = int(gdd_to_peak * 0.12)  # ~12% of peak = single planting window
-    elif regional_data.historical_harvest_start_doy and regional_data.historical_harvest_end_doy:
-        # Regional average: broader window due to staggered plantings
-        avg_gdd_rate = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
-        harvest_days = regional_data.historical_harvest_end_doy - regional_data.historical_harvest_start_doy
-        if harvest_days < 0:  # Wraps around year
-            harvest_days += 365
-        gdd_window = max(100, int(harvest_days * avg_gdd_rate * 0.5))  # ~50% of season
-    else:
-        gdd_window = int(gdd_to_peak * 0.15)  # 15% of peak as default
-
-    # =========================================================================
-    # DETERMINE BLOOM/PLANTING DATE(S)
-    # =========================================================================
-    # Build list of planting dates to process (could be 1 or more)
-    if grower_planting_dates:
-        # Use grower's actual planting date(s)
-        planting_dates_to_process = grower_planting_dates
-    else:
-        # Use regional average bloom/planting date
-        bloom_doy = regional_data.avg_bloom_peak_doy or regional_data.avg_bloom_start_doy or 100
-        bloom_date = date(current_year, 1, 1) + timedelta(days=bloom_doy - 1)
-
-        # Handle bloom date relative to today
-        if bloom_date > today:
-            # Bloom hasn't happened yet this year - might be tracking last year's crop
-            last_year_bloom = date(current_year - 1, 1, 1) + timedelta(days=bloom_doy - 1)
-            if (today - last_year_bloom).days < 450:  # Max ~15 months
-                bloom_date = last_year_bloom
-
-        planting_dates_to_process = [bloom_date]
-
-    # =========================================================================
-    # PROCESS EACH PLANTING DATE
+    # PREDICT (one result per planting date, or regional average)
     # =========================================================================
-    weather_service = WeatherService()
-    quality_predictor = QualityPredictor()
-    quality_model = quality_predictor.get_model_by_crop(cultivar.crop_type)
-    cultivar_brix_ceiling = cultivar.research_peak_brix or 12.0
-
-    plantings = []
-
-    for planting_idx, planting_date in enumerate(planting_dates_to_process):
-        # Data source label
-        if grower_planting_dates:
-            data_source = f"{cultivar.cultivar_name} - Planting {planting_idx + 1} ({planting_date.strftime('%b %d, %Y')})"
-        else:
-            data_source = f"{cultivar.cultivar_name} - {regional_data.data_source or 'Research data'}"
-
-        # ---------------------------------------------------------------------
-        # CALCULATE GDD FROM ACTUAL WEATHER DATA
-        # ---------------------------------------------------------------------
-        if planting_date < today:
-            try:
-                observations = weather_service.provider.get_historical(
-                    region_id, planting_date, today
-                )
-
-                if observations:
-                    current_gdd = sum(obs.gdd(gdd_base) for obs in observations)
-                    avg_daily_gdd = current_gdd / len(observations)
-                    data_source = f"{data_source} + Open-Meteo ({len(observations)} days)"
-                else:
-                    days_elapsed = (today - planting_date).days
-                    avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
-                    current_gdd = days_elapsed * avg_daily_gdd
-                    data_source = f"{data_source} + climatology estimate"
-
-            except Exception as e:
-                days_elapsed = (today - planting_date).days
-                avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
-                current_gdd = days_elapsed * avg_daily_gdd
-                data_source = f"{data_source} (weather unavailable)"
-        else:
-            current_gdd = 0
-            avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
-            data_source = f"{data_source} - awaiting planting"
-
-        # ---------------------------------------------------------------------
-        # PROJECT HARVEST DATES - Use historical data when available
-        # ---------------------------------------------------------------------
-        # For regional-average mode (no grower planting date), historical data
-        # is more accurate than GDD calculations which require calibrated targets
-        use_historical_dates = (
-            not grower_planting_dates and
-            regional_data.historical_harvest_start_doy and
-            regional_data.historical_harvest_end_doy
-        )
+    response = services.cultivar_predictor.predict(
+        cultivar,
+        regional_data,
+        region,
+        planting_dates=grower_planting_dates,
+        rootstock=rootstock,
+        tree_age=tree_age,
+        fields=fields,
+        compact=compact,
+    )
 
-        if use_historical_dates:
-            # Use validated historical harvest windows from regional data
-            def doy_to_date(doy, ref_year):
-                """Convert day-of-year to date, handling year boundaries."""
-                if doy <= 0:
-                    doy += 365
-                    ref_year -= 1
-                return date(ref_year, 1, 1) + timedelta(days=doy - 1)
-
-            # Determine which year's season we're in
-            harvest_start_doy = regional_data.historical_harvest_start_doy
-            harvest_end_doy = regional_data.historical_harvest_end_doy
-
-            # Check if season wraps around year end (e.g., Nov-Jan)
-            if harvest_end_doy < harvest_start_doy:
-                # Season wraps year boundary
-                if today.timetuple().tm_yday >= harvest_start_doy:
-                    # We're in the first part (e.g., Nov-Dec of current year)
-                    season_year = today.year
-                    harvest_start_date = doy_to_date(harvest_start_doy, season_year)
-                    harvest_end_date = doy_to_date(harvest_end_doy, season_year + 1)
-                elif today.timetuple().tm_yday <= harvest_end_doy:
-                    # We're in the second part (e.g., Jan of current year)
-                    season_year = today.year - 1
-                    harvest_start_date = doy_to_date(harvest_start_doy, season_year)
-                    harvest_end_date = doy_to_date(harvest_end_doy, today.year)
-                else:
-                    # Off-season - show next upcoming season
-                    season_year = today.year
-                    harvest_start_date = doy_to_date(harvest_start_doy, season_year)
-                    harvest_end_date = doy_to_date(harvest_end_doy, season_year + 1)
-            else:
-                # Season within single year
-                if today.timetuple().tm_yday > harvest_end_doy:
-                    # Past this year's season, show next year
-                    season_year = today.year + 1
-                else:
-                    season_year = today.year
-                harvest_start_date = doy_to_date(harvest_start_doy, season_year)
-                harvest_end_date = doy_to_date(harvest_end_doy, season_year)
-
-            # Peak window from historical data if available
-            if regional_data.historical_peak_start_doy and regional_data.historical_peak_end_doy:
-                peak_start_doy = regional_data.historical_peak_start_doy
-                peak_end_doy = regional_data.historical_peak_end_doy
-
-                # Same year logic for peak
-                if harvest_end_doy < harvest_start_doy:
-                    # Wrapping season
-                    if peak_start_doy >= harvest_start_doy:
-                        optimal_start_date = doy_to_date(peak_start_doy, harvest_start_date.year)
-                    else:
-                        optimal_start_date = doy_to_date(peak_start_doy, harvest_end_date.year)
-
-                    if peak_end_doy >= harvest_start_doy:
-                        optimal_end_date = doy_to_date(peak_end_doy, harvest_start_date.year)
-                    else:
-                        optimal_end_date = doy_to_date(peak_end_doy, harvest_end_date.year)
-                else:
-                    optimal_start_date = doy_to_date(peak_start_doy, harvest_start_date.year)
-                    optimal_end_date = doy_to_date(peak_end_doy, harvest_start_date.year)
-
-                # Peak center is midpoint of optimal window
-                peak_center_date = optimal_start_date + (optimal_end_date - optimal_start_date) / 2
-            else:
-                # Estimate optimal as middle 50% of harvest window
-                window_days = (harvest_end_date - harvest_start_date).days
-                if window_days < 0:
-                    window_days += 365
-                optimal_offset = window_days // 4
-                optimal_start_date = harvest_start_date + timedelta(days=optimal_offset)
-                optimal_end_date = harvest_end_date - timedelta(days=optimal_offset)
-                peak_center_date = harvest_start_date + timedelta(days=window_days // 2)
-
-        elif avg_daily_gdd > 0:
-            # Calculate GDD thresholds for status
-            gdd_optimal_start = gdd_to_peak - (gdd_window / 4)
-            gdd_optimal_end = gdd_to_peak + (gdd_window / 4)
-            gdd_harvest_end = gdd_to_peak + (gdd_window / 2)
-
-            # Calculate days from planting to each milestone (grower-specific mode)
-            days_plant_to_maturity = int(gdd_to_maturity / avg_daily_gdd)
-            days_plant_to_optimal_start = int(gdd_optimal_start / avg_daily_gdd)
-            days_plant_to_peak = int(gdd_to_peak / avg_daily_gdd)
-            days_plant_to_optimal_end = int(gdd_optimal_end / avg_daily_gdd)
-            days_plant_to_harvest_end = int(gdd_harvest_end / avg_daily_gdd)
-
-            # Calculate actual dates from planting date (not from today)
-            harvest_start_date = planting_date + timedelta(days=days_plant_to_maturity)
-            optimal_start_date = planting_date + timedelta(days=days_plant_to_optimal_start)
-            peak_center_date = planting_date + timedelta(days=days_plant_to_peak)
-            optimal_end_date = planting_date + timedelta(days=days_plant_to_optimal_end)
-            harvest_end_date = planting_date + timedelta(days=days_plant_to_harvest_end)
-        else:
-            # Fallback to cultivar's days to maturity
-            harvest_start_date = planting_date + timedelta(days=cultivar.days_to_maturity or 120)
-            optimal_start_date = harvest_start_date + timedelta(days=15)
-            peak_center_date = harvest_start_date + timedelta(days=30)
-            optimal_end_date = harvest_start_date + timedelta(days=45)
-            harvest_end_date = harvest_start_date + timedelta(days=60)
-
-        # ---------------------------------------------------------------------
-        # DETERMINE HARVEST STATUS FROM DATES (works for both historical and GDD)
-        # ---------------------------------------------------------------------
-        is_off_season = today < harvest_start_date or today > harvest_end_date
-        is_harvestable = harvest_start_date <= today <= harvest_end_date
-        is_in_optimal_window = optimal_start_date <= today <= optimal_end_date
-        is_at_peak = (peak_center_date - timedelta(days=3)) <= today <= (peak_center_date + timedelta(days=3))
-        is_past_optimal = today > optimal_end_date and today <= harvest_end_date
-
-        # Calculate progress through season
-        if is_off_season and today < harvest_start_date:
-            progress = 0
-        elif is_off_season:  # Past harvest end
-            progress = 100
-        else:
-            total_days = (harvest_end_date - harvest_start_date).days or 1
-            days_into_season = (today - harvest_start_date).days
-            progress = min(100, max(0, (days_into_season / total_days) * 100))
-
-        # ---------------------------------------------------------------------
-        # FORMAT HARVEST WINDOW MESSAGE
-        # ---------------------------------------------------------------------
-        if is_off_season:
-            if today < harvest_start_date:
-                days_until = (harvest_start_date - today).days
-                if days_until <= 30:
-                    harvest_window = f"Season starts in {days_until} days"
-                else:
-                    harvest_window = f"Season: {harvest_start_date.strftime('%B %d')}"
-            else:
-                harvest_window = "Off-season"
-        elif is_at_peak:
-            harvest_window = "AT PEAK NOW!"
-        elif is_in_optimal_window:
-            harvest_window = "Optimal harvest NOW!"
-        elif is_past_optimal:
-            harvest_window = "Past peak - still good"
-        elif is_harvestable:
-            days_until_peak = (peak_center_date - today).days if today < peak_center_date else 0
-            if days_until_peak > 0:
-                harvest_window = f"Good now, peak in {days_until_peak} days"
-            else:
-                harvest_window = "Harvestable now"
-        else:
-            harvest_window = f"Not yet - {harvest_start_date.strftime('%B')}"
+    return prediction_response(response)
 
-        # ---------------------------------------------------------------------
-        # QUALITY PREDICTION
-        # ---------------------------------------------------------------------
-        # Base Brix from GDD model
-        base_predicted_brix = quality_model.predict_sugar_content(current_gdd, cultivar_brix_ceiling)
-        base_peak_brix = quality_model.predict_sugar_content(gdd_to_peak, cultivar_brix_ceiling)
 
-        # Apply rootstock and age modifiers (Peak_Brix = Scion_Base + Rootstock_Mod + Age_Mod)
-        total_brix_modifier = rootstock_brix_modifier + age_brix_modifier
-        predicted_brix = base_predicted_brix + total_brix_modifier
-        peak_brix = base_peak_brix + total_brix_modifier
+# =============================================================================
+# CATALOG ENDPOINTS - cached bodies + conditional GET
+# =============================================================================
+# Catalog data only changes when the cultivar database or region registry is
+# reloaded. Serialized bodies are cached per filter combination and keyed on
+# the data version; clients revalidate with If-None-Match / If-Modified-Since.
+# Single-crop responses key on that crop's version, so a reload leaves them
+# cached unless the crop's records changed.
 
-        predicted_acid = quality_model.predict_acid_content(current_gdd)
-        brix_acid_ratio = predicted_brix / predicted_acid if predicted_acid > 0.1 else None
+CATALOG_CACHE_MAX_AGE = 300  # Seconds browsers/CDNs may reuse without revalidating
 
-        if cultivar.crop_type == "pecan":
-            quality_message = f"Oil content: {predicted_brix:.0f}%"
-        elif is_at_peak:
-            quality_message = "At peak sweetness!"
-        elif is_in_optimal_window:
-            quality_message = "Excellent - in optimal window"
-        elif is_harvestable:
-            quality_message = "Good - ready to eat"
-        elif is_off_season:
-            quality_message = "Not in season"
-        else:
-            quality_message = "Developing"
+_catalog_cache = ResponseBodyCache(name="catalog")
 
-        if is_at_peak:
-            peak_date_display = "NOW!"
-        elif today > optimal_end_date:
-            peak_date_display = f"Was {peak_center_date.strftime('%B %d')}"
-        else:
-            peak_date_display = peak_center_date.strftime("%B %d, %Y")
-
-        # ---------------------------------------------------------------------
-        # BUILD PLANTING RESULT
-        # ---------------------------------------------------------------------
-        planting_result = {
-            "planting_date": planting_date.isoformat(),
-            "harvest_window": harvest_window,
-            "harvest_start_date": harvest_start_date.strftime("%B %d"),
-            "harvest_end_date": harvest_end_date.strftime("%B %d"),
-            "optimal_start_date": optimal_start_date.strftime("%B %d, %Y"),
-            "optimal_end_date": optimal_end_date.strftime("%B %d, %Y"),
-            "peak_date": peak_date_display,
-            "progress": round(progress, 1),
-            "current_gdd": round(current_gdd, 0),
-            "is_harvestable": is_harvestable,
-            "is_in_optimal_window": is_in_optimal_window,
-            "is_at_peak": is_at_peak,
-            "is_past_optimal": is_past_optimal,
-            "is_off_season": is_off_season,
-            "predicted_brix": round(predicted_brix, 1),
-            "predicted_acid": round(predicted_acid, 2),
-            "brix_acid_ratio": round(brix_acid_ratio, 1) if brix_acid_ratio else None,
-            "peak_brix": round(peak_brix, 1),
-            "quality_message": quality_message,
-            "data_source": data_source,
-        }
-        plantings.append(planting_result)
+# The region registry is static for the life of the process
+_REGIONS_VERSION = 1
+_REGIONS_LOADED_AT = datetime.now(timezone.utc)
 
-    # =========================================================================
-    # BUILD RESPONSE
-    # =========================================================================
-    # For single planting (regional average or single date), flatten for backward compatibility
-    # For multiple plantings, return array
-
-    response = {
-        # Cultivar info
-        "cultivar_id": cultivar_id,
-        "cultivar_name": cultivar.cultivar_name,
-        "crop_type": cultivar.crop_type,
-        "timing_class": cultivar.timing_class,
-        "quality_tier": cultivar.quality_tier.value if cultivar.quality_tier else "standard",
-        # Region info
-        "region_id": region_id,
-        "region_name": region.name,
-        # Prediction mode
-        "prediction_mode": prediction_mode,
-        "gdd_to_peak": gdd_to_peak,
-        "cultivar_ceiling": cultivar_brix_ceiling,
-        "research_sources": cultivar.research_sources,
-    }
 
-    # Add rootstock info if specified
-    if rootstock:
-        response["rootstock_id"] = rootstock.rootstock_id
-        response["rootstock_name"] = rootstock.rootstock_name
-        response["rootstock_brix_modifier"] = rootstock.brix_modifier
-        response["rootstock_notes"] = rootstock.notes
-
-    # Add tree age info if specified
-    if tree_age is not None:
-        response["tree_age"] = tree_age
-        response["age_brix_modifier"] = age_brix_modifier
-
-    # Add total modifier info for transparency
-    if rootstock or tree_age is not None:
-        response["total_brix_modifier"] = total_brix_modifier
-
-    if len(plantings) == 1:
-        # Single planting: merge into top-level for backward compatibility
-        response.update(plantings[0])
-    else:
-        # Multiple plantings: include as array + summary
-        response["plantings"] = plantings
-        response["planting_count"] = len(plantings)
+def _catalog_response(endpoint: str, filters: tuple, version, last_modified, build_payload):
+    """Serve a cached catalog body, answering 304 when the client is current."""
+    entry = _catalog_cache.get_or_build(
+        (endpoint, filters),
+        version,
+        last_modified,
+        lambda: jsonify(build_payload()).get_data()
+    )
 
-        # Summary across all plantings
-        earliest_harvest = min(p["harvest_start_date"] for p in plantings)
-        latest_harvest = max(p["harvest_end_date"] for p in plantings)
-        any_harvestable = any(p["is_harvestable"] for p in plantings)
-        any_at_peak = any(p["is_at_peak"] for p in plantings)
-        any_optimal = any(p["is_in_optimal_window"] for p in plantings)
+    response = Response(entry.body, mimetype='application/json')
+    response.set_etag(entry.etag)
+    response.vary.add('Accept-Encoding')
 
-        response["summary"] = {
-            "harvest_range": f"{earliest_harvest} - {latest_harvest}",
-            "any_harvestable_now": any_harvestable,
-            "any_at_peak_now": any_at_peak,
-            "any_in_optimal_window": any_optimal,
-        }
+    # Compressed variants are cached alongside the identity body
+    encoding = _negotiate_encoding(len(entry.body))
+    if encoding:
+        response.set_data(entry.encoded(encoding, serialization.compress))
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(entry.etag, weak=True)
 
-    return jsonify(response)
+    response.last_modified = entry.last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = CATALOG_CACHE_MAX_AGE
+    return response.make_conditional(request)
 
 
 @app.route('/api/cultivars')
@@ -2212,49 +2347,94 @@ def api_cultivars():
     crop_type = request.args.get('crop_type')
     region_id = request.args.get('region_id') or request.args.get('region')
 
-    cultivars = []
-    for cultivar in db.cultivars.values():
-        if crop_type and cultivar.crop_type != crop_type:
-            continue
+    def build_payload():
+        # Narrow candidates with the database indexes, then project
+        if region_id:
+            candidates = [db.cultivars[cid] for cid in db.get_cultivars_for_region(region_id) if cid in db.cultivars]
+            if crop_type:
+                candidates = [c for c in candidates if c.crop_type == crop_type]
+        elif crop_type:
+            candidates = db.get_cultivars_by_crop_type(crop_type)
+        else:
+            candidates = db.cultivars.values()
 
-        # Check if regional data exists for this cultivar in the requested region
-        regions_available = [
-            key.split(':')[1] for key in db.regional_data.keys()
-            if key.startswith(f"{cultivar.cultivar_id}:")
-        ]
+        cultivars = []
+        for cultivar in candidates:
+            regions_available = db.get_regions_for_cultivar(cultivar.cultivar_id)
 
-        if region_id and region_id not in regions_available:
-            continue
+            cultivars.append({
+                "cultivar_id": cultivar.cultivar_id,
+                "cultivar_name": cultivar.cultivar_name,
+                "crop_type": cultivar.crop_type,
+                "timing_class": cultivar.timing_class,
+                "quality_tier": cultivar.quality_tier.value if cultivar.quality_tier else "standard",
+                "peak_brix": cultivar.research_peak_brix,
+                "regions_available": regions_available
+            })
+
+        return {
+            "count": len(cultivars),
+            "cultivars": cultivars
+        }
+
+    return _catalog_response(
+        'cultivars', (crop_type, region_id),
+        db.version if region_id else db.crop_version(crop_type or None), db.last_modified, build_payload
+    )
 
-        cultivars.append({
-            "cultivar_id": cultivar.cultivar_id,
-            "cultivar_name": cultivar.cultivar_name,
-            "crop_type": cultivar.crop_type,
-            "timing_class": cultivar.timing_class,
-            "quality_tier": cultivar.quality_tier.value if cultivar.quality_tier else "standard",
-            "peak_brix": cultivar.research_peak_brix,
-            "regions_available": regions_available
-        })
 
+@app.route('/api/cultivars/search')
+def api_cultivars_search():
+    """Typo-tolerant cultivar search over names, aliases, crop types and flavor.
+
+    Query params:
+    - q: Search text (e.g. "honycrisp", "blood orange", "honey notes")
+    - crop_type: Only cultivars of this crop type
+    - limit: Maximum results (default 10, at most 50)
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"error": "Missing required parameter: q"})
+    try:
+        limit = min(max(int(request.args.get('limit', 10)), 1), 50)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"})
+
+    hits = services.cultivar_search.search(query, limit=limit, crop_type=request.args.get('crop_type'))
     return jsonify({
-        "count": len(cultivars),
-        "cultivars": cultivars
+        "query": query,
+        "count": len(hits),
+        "results": [
+            {
+                "cultivar_id": hit.cultivar_id,
+                "cultivar_name": hit.cultivar_name,
+                "crop_type": hit.crop_type,
+                "score": hit.score,
+                "matched_fields": list(hit.matched_fields),
+            }
+            for hit in hits
+        ]
     })
 
 
 @app.route('/api/regions')
 def api_regions():
     """API endpoint for regions with their viable crops."""
-    return jsonify({
-        region_id: {
-            "name": r.name,
-            "state": r.state,
-            "latitude": r.latitude,
-            "longitude": r.longitude,
-            "viable_crops": r.viable_crops
-        }
-        for region_id, r in US_GROWING_REGIONS.items()
-    })
+    def build_payload():
+        return {
+            region_id: {
+                "name": r.name,
+                "state": r.state,
+                "latitude": r.latitude,
+                "longitude": r.longitude,
+                "viable_crops": r.viable_crops
+            }
+            for region_id, r in US_GROWING_REGIONS.items()
+        }
+
+    return _catalog_response(
+        'regions', (), _REGIONS_VERSION, _REGIONS_LOADED_AT, build_payload
+    )
 
 
 @app.route('/api/rootstocks')
@@ -2267,49 +2447,124 @@ def api_rootstocks():
     db = get_cultivar_database()
     crop_type = request.args.get('crop_type')
 
-    rootstocks = []
-    for rs in db.rootstocks.values():
-        # Filter by crop type if specified
-        if crop_type and crop_type not in rs.crop_types:
-            continue
+    def build_payload():
+        # Already sorted by Brix modifier (high to low) for user convenience
+        rootstocks = []
+        for rs in db.get_rootstocks(crop_type or None):
+            rootstocks.append({
+                "rootstock_id": rs.rootstock_id,
+                "rootstock_name": rs.rootstock_name,
+                "crop_types": rs.crop_types,
+                "brix_modifier": rs.brix_modifier,
+                "brix_modifier_range": list(rs.brix_modifier_range) if rs.brix_modifier_range else None,
+                "vigor": rs.vigor,
+                "yield_effect": rs.yield_effect,
+                "disease_resistance": rs.disease_resistance,
+                "cold_hardy_to_f": rs.cold_hardy_to_f,
+                "drought_tolerant": rs.drought_tolerant,
+                "notes": rs.notes
+            })
 
-        rootstocks.append({
-            "rootstock_id": rs.rootstock_id,
-            "rootstock_name": rs.rootstock_name,
-            "crop_types": rs.crop_types,
-            "brix_modifier": rs.brix_modifier,
-            "brix_modifier_range": list(rs.brix_modifier_range) if rs.brix_modifier_range else None,
-            "vigor": rs.vigor,
-            "yield_effect": rs.yield_effect,
-            "disease_resistance": rs.disease_resistance,
-            "cold_hardy_to_f": rs.cold_hardy_to_f,
-            "drought_tolerant": rs.drought_tolerant,
-            "notes": rs.notes
-        })
+        return {
+            "count": len(rootstocks),
+            "rootstocks": rootstocks,
+            "filter_crop_type": crop_type
+        }
 
-    # Sort by Brix modifier (high to low) for user convenience
-    rootstocks.sort(key=lambda x: x["brix_modifier"], reverse=True)
+    return _catalog_response(
+        'rootstocks', (crop_type,), db.crop_version(crop_type or None), db.last_modified, build_payload
+    )
 
-    return jsonify({
-        "count": len(rootstocks),
-        "rootstocks": rootstocks,
-        "filter_crop_type": crop_type
-    })
+
+@app.route('/api/planning/brix-grid')
+def api_planning_brix_grid():
+    """Expected peak Brix for every cultivar x compatible rootstock x tree age bucket of a crop.
+
+    Query params:
+    - crop_type: Crop to plan (e.g. "navel_orange")
+
+    Each cultivar lists the best rootstock per age bucket and the full
+    rootstock x age bucket matrix, rows in "rootstocks" order (null where
+    the cultivar has no researched Brix).
+    """
+    crop_type = request.args.get('crop_type')
+    if not crop_type:
+        return jsonify({"error": "Missing required parameter: crop_type"})
+
+    db = get_cultivar_database()
+    grid = services.brix_planning
+    if crop_type not in grid:
+        return jsonify({
+            "error": f"Unknown crop type: {crop_type}",
+            "available_crop_types": grid.crop_types
+        })
+
+    return _catalog_response(
+        'brix_grid', (crop_type,), db.crop_version(crop_type), db.last_modified,
+        lambda: grid.crop_grid(crop_type)
+    )
 
 
 @app.route('/api/whats-in-season')
 def api_whats_in_season():
     """API endpoint showing what's currently in optimal harvest window (middle 50%)."""
-    today = date.today()
+    return jsonify(_in_season_memo())
+
+
+IN_SEASON_CALENDAR_YEARS = 10  # ?date= on the cultivar calendar may be this many years from today
+
+
+@app.route('/api/whats-in-season/cultivars')
+def api_whats_in_season_cultivars():
+    """Cultivar x region pairs whose harvest window contains a day (from the harvest calendar).
+
+    Query params:
+    - date: YYYY-MM-DD (default today)
+    - peak: 1 to list only pairs in their peak window
+    """
+    try:
+        day = date.fromisoformat(request.args['date']) if request.args.get('date') else date.today()
+    except ValueError:
+        return jsonify({"error": "date must be YYYY-MM-DD"})
+    if abs(day.year - date.today().year) > IN_SEASON_CALENDAR_YEARS:
+        return jsonify({"error": f"date must be within {IN_SEASON_CALENDAR_YEARS} years of today"})
+    peak_only = request.args.get('peak') == '1'
+
+    calendar = services.harvest_calendar(day.year)
+    cultivars = []
+    for index in calendar.rows_in_window(day, peak=peak_only):
+        row = calendar.row(index)
+        cultivars.append({
+            "cultivar_id": row["cultivar_id"],
+            "region_id": row["region_id"],
+            "season_year": row["year"],
+            "window_start": row["window_start"].isoformat(),
+            "window_end": row["window_end"].isoformat(),
+            "peak_start": row["peak_start"].isoformat(),
+            "peak_end": row["peak_end"].isoformat(),
+            "at_peak": row["peak_start"] <= day <= row["peak_end"],
+            "expected_peak_brix": row["expected_peak_brix"],
+            "quality_tier": row["quality_tier"],
+        })
+
+    return jsonify({
+        "date": day.isoformat(),
+        "count": len(cultivars),
+        "cultivars": cultivars
+    })
+
+
+def _whats_in_season(as_of: date) -> list[dict]:
+    """Crops in their optimal window on a given day (memoized per day)."""
+    today = as_of
     in_season = []
 
     for region_id, region in US_GROWING_REGIONS.items():
         for crop_id in region.viable_crops:
-            bloom_date = get_current_season_bloom(crop_id, region_id)
-            targets = get_gdd_targets(crop_id)
-            base_temp = targets.get("base_temp", 50.0)
-            gdd_to_peak = targets.get("gdd_to_peak", 2000)
-            gdd_window = targets.get("gdd_window", 200)
+            bloom_date = get_current_season_bloom(crop_id, region_id, as_of=today)
+            phenology = PHENOLOGY_TABLE[(crop_id, region_id)]
+            gdd_to_peak = phenology.season_gdd_to_peak
+            gdd_window = phenology.season_gdd_window
 
             # Middle 50% window
             middle_50_start = gdd_to_peak - (gdd_window / 4)
@@ -2319,7 +2574,7 @@ def api_whats_in_season():
             days_since_bloom = (today - bloom_date).days
             if days_since_bloom > 0:
                 # Use crop-specific GDD rate
-                avg_gdd = estimate_avg_daily_gdd(crop_id, region_id)
+                avg_gdd = phenology.avg_daily_gdd
                 estimated_gdd = days_since_bloom * avg_gdd
 
                 # Check if in optimal window
@@ -2334,7 +2589,213 @@ def api_whats_in_season():
                         "optimal_window": f"{middle_50_start:.0f}-{middle_50_end:.0f} GDD"
                     })
 
-    return jsonify(in_season)
+    return in_season
+
+
+_in_season_memo = DayMemo(_whats_in_season, name="whats_in_season")
+
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Operational metrics in Prometheus text exposition format."""
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+
+@app.route('/api/debug/stage-timings')
+def api_stage_timings():
+    """Aggregated per-stage latency histograms (milliseconds) for dashboards."""
+    return jsonify({
+        "enabled": STAGE_TIMING_ENABLED,
+        "buckets_ms": list(instrumentation.STAGE_BUCKETS_MS),
+        "stages": instrumentation.stage_histograms(),
+    })
+
+
+@app.route('/api/export/predictions')
+def api_export_predictions():
+    """
+    Stream every cultivar x region prediction as newline-delimited JSON.
+
+    The response is sent with chunked transfer encoding, one prediction per
+    line, encoded like the other API responses.
+
+    Optional query params:
+    - crop_type: Only cultivars of this crop type
+    - region_id: Only this region
+    - cultivar_id: Only this cultivar
+    - resume_token: Resume after the record carrying this token
+    - fields, compact: Sparse records, as for /predict/cultivar
+    """
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+
+    filters = {
+        "crop_type": request.args.get('crop_type'),
+        "region_id": request.args.get('region_id') or request.args.get('region'),
+        "cultivar_id": request.args.get('cultivar_id'),
+        "resume_token": request.args.get('resume_token'),
+        "fields": fields,
+        "compact": request.args.get('compact') in ("1", "true"),
+    }
+
+    exporter = PredictionExporter(get_cultivar_database(), services.cultivar_predictor)
+    lines = exporter.iter_ndjson(default=app.json.default, sort_keys=app.json.sort_keys, **filters)
+
+    # Pull the first line eagerly so a bad resume token is reported as an error
+    # instead of a truncated stream
+    try:
+        first_line = next(lines, None)
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+
+    def generate():
+        if first_line is not None:
+            yield first_line
+            yield from lines
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+# =============================================================================
+# HARVEST STATUS STREAM - push transitions instead of polling /predict
+# =============================================================================
+# The status of every crop and cultivar prediction is materialized once per
+# day; subscribers receive the entries that changed (see status_stream).
+# The table is rebuilt on the broadcaster's thread, started by the first
+# subscriber in each process, which checks for a new day every
+# STATUS_REFRESH_SECONDS.
+
+STATUS_STREAM_HEARTBEAT_SECONDS = 15
+STATUS_REFRESH_SECONDS = 60
+
+
+def _status_entry(prediction: dict) -> dict:
+    return {
+        "status": harvest_status(prediction),
+        "harvest_window": prediction["harvest_window"],
+        "peak_date": prediction["peak_date"],
+        "predicted_brix": prediction["predicted_brix"],
+    }
+
+
+def _harvest_status_table(as_of: date) -> dict[tuple[str, str, str], dict]:
+    """Status of every crop and cultivar prediction on a given day."""
+    table = {}
+    for crop_id, region_id in PHENOLOGY_TABLE:
+        table[("crop", region_id, crop_id)] = _status_entry(
+            crop_prediction(crop_id, region_id, today=as_of)
+        )
+
+    db = get_cultivar_database()
+    predictor = services.cultivar_predictor
+    for regional in db.regional_data.values():
+        cultivar = db.get_cultivar(regional.cultivar_id)
+        region = US_GROWING_REGIONS.get(regional.region_id)
+        if cultivar is None or region is None:
+            continue
+        table[("cultivar", regional.region_id, regional.cultivar_id)] = _status_entry(
+            predictor.predict(cultivar, regional, region, today=as_of)
+        )
+    return table
+
+
+status_broadcaster = StatusBroadcaster(_harvest_status_table)
+
+
+def _parse_status_keys(kind: str, value: str) -> list[tuple[str, str, str]]:
+    """Parse "region:subject,region:*" into status keys (ValueError if malformed)."""
+    keys = []
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        region_id, sep, subject_id = item.partition(":")
+        if not sep or not subject_id:
+            raise ValueError(f"Expected region:{kind}, got: {item}")
+        if region_id not in US_GROWING_REGIONS:
+            raise ValueError(f"Unknown region: {region_id}")
+        keys.append((kind, region_id, subject_id))
+    return keys
+
+
+@app.route('/api/stream/harvest-status')
+def api_harvest_status_stream():
+    """
+    Server-Sent Events stream of harvest status transitions.
+
+    Query params (comma-separated region:id pairs, "*" for every id):
+    - crops: e.g. indian_river:navel_orange,central_florida:*
+    - cultivars: e.g. indian_river:washington_navel
+
+    Sends a "status" event per matching key on connect (or once the day's
+    table has been built), then a "transition"
+    event whenever a key's status changes (at most once per day), with
+    keep-alive comments in between.
+    """
+    try:
+        keys = (
+            _parse_status_keys("crop", request.args.get('crops', ''))
+            + _parse_status_keys("cultivar", request.args.get('cultivars', ''))
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+    if not keys:
+        return jsonify({"error": "Subscribe to at least one crops= or cultivars= key"})
+
+    status_broadcaster.start(STATUS_REFRESH_SECONDS)
+    subscription = status_broadcaster.subscribe(keys)
+
+    def snapshot():
+        for entry in status_broadcaster.snapshot(subscription):
+            yield format_sse(entry, event="status", event_id=entry["as_of"])
+
+    def generate():
+        try:
+            yield from snapshot()
+            while True:
+                try:
+                    event = subscription.queue.get(timeout=STATUS_STREAM_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if subscription.needs_snapshot:
+                    # Fell behind, or connected before the first table: drop
+                    # the backlog and send current state
+                    subscription.needs_snapshot = False
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                    yield from snapshot()
+                    continue
+                if event is None:
+                    continue
+                yield format_sse(event, event="transition", event_id=event["as_of"])
+        finally:
+            status_broadcaster.unsubscribe(subscription)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# =============================================================================
+# STARTUP WARM-UP
+# =============================================================================
+# Runs at import so gunicorn workers (or the master, with --preload) are warm
+# before they accept traffic.
+
+if os.environ.get("FIELDER_WARMUP", "1") != "0":
+    services.warm_up(climatology=os.environ.get("FIELDER_WARM_CLIMATOLOGY") == "1")
+    # Today's and tomorrow's season values, so midnight rollover is warm too
+    _season_bloom_memo.warm(PHENOLOGY_TABLE, days=2)
+    _in_season_memo.warm([()], days=2)
+    if SHARED_CULTIVAR_DB:
+        # Keep the collector from touching (and un-sharing) startup objects
+        # in forked workers
+        gc.freeze()
+else:
+    services.ready = True  # Services build on first use
 
 
 if __name__ == '__main__':
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Evaluate every cultivar x region pair on observed weather in a process pool.
+
+Nightly recompute entry point. Weather is fetched once per region and
+shared with the workers; each pair is written as one compact NDJSON line
+(status, progress, GDD, Brix).
+
+Pass several worker counts to see how the run scales:
+
+Run: python batch_evaluate.py --output nightly.ndjson
+     python batch_evaluate.py --offline --workers 1,2,4,8 --scale 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from benchmark_shared_db import scaled_database
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services.batch_evaluator import BatchEvaluator
+from fielder.services.data_loader import DataLoader
+from fielder.services.weather_service import OfflineWeatherProvider, OpenMeteoProvider
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", default=str(os.cpu_count() or 1),
+                        help="Worker count, or a comma-separated list to compare")
+    parser.add_argument("--shard-size", type=int, default=64, help="Max pairs per task")
+    parser.add_argument("--offline", action="store_true",
+                        help="Synthesize weather locally instead of calling Open-Meteo")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Replicate every record N times (benchmarking)")
+    parser.add_argument("--output", "-o", help="Write results as NDJSON to this file")
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(",")]
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    db = scaled_database(db, args.scale)
+    provider = OfflineWeatherProvider() if args.offline else OpenMeteoProvider()
+
+    print("=" * 78)
+    print("  FIELDER - Batch Evaluation")
+    print("=" * 78)
+    print(f"  Pairs: {len(db.regional_data)}  Weather: {'offline' if args.offline else 'open-meteo'}")
+    print(f"  {'Workers':>8} {'Shards':>8} {'Seconds':>10} {'Pairs/s':>10} {'Speedup':>9}")
+    print("-" * 78)
+
+    baseline = None
+    results = []
+    for workers in worker_counts:
+        evaluator = BatchEvaluator(db, provider, max_workers=workers, shard_size=args.shard_size)
+        started = time.perf_counter()
+        results = evaluator.evaluate()
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"  {workers:>8} {len(evaluator.shards()):>8} {elapsed:>10.2f} "
+              f"{len(results) / elapsed:>10.1f} {baseline / elapsed:>8.2f}x")
+    print("=" * 78)
+
+    if args.output:
+        with open(args.output, "w") as out:
+            for result in results:
+                record = result._asdict()
+                record["status"] = result.status_name
+                out.write(json.dumps(record) + "\n")
+        print(f"  Wrote {len(results)} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure memory and attribute access for regular vs compact catalog records.
+
+Builds the catalog --scale times over (suffixed ids), with every record
+round-tripped through pickle so strings and lists are separate objects,
+as they are when records come from parsed research files. Then reports:
+
+- heap bytes held by the catalog (tracemalloc), total and per record
+- time to read the fields the prediction path reads, per record
+- private dirty memory of forked workers reading every record
+  (as in benchmark_shared_db.py), i.e. what each gunicorn worker adds
+
+Run: python benchmark_compact_records.py [--scale 10] [--workers 4]
+"""
+
+import argparse
+import dataclasses
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.compact_cultivar_database import CompactCultivarDatabase
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services.data_loader import DataLoader
+
+from benchmark_shared_db import run_mode
+
+
+def build(database_class, scale: int) -> CultivarDatabase:
+    source = CultivarDatabase()
+    DataLoader(source).load_all()
+    db = database_class()
+    for i in range(scale):
+        suffix = f"_{i}" if i else ""
+        for c in source.cultivars.values():
+            copy = pickle.loads(pickle.dumps(c))
+            db.add_cultivar(dataclasses.replace(copy, cultivar_id=copy.cultivar_id + suffix))
+        for r in source.regional_data.values():
+            copy = pickle.loads(pickle.dumps(r))
+            db.add_regional_data(dataclasses.replace(copy, cultivar_id=copy.cultivar_id + suffix))
+    return db
+
+
+def heap_bytes(database_class, scale: int) -> tuple[int, CultivarDatabase]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    db = build(database_class, scale)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, db
+
+
+def access_ns(db: CultivarDatabase, repeat: int = 20) -> float:
+    """Best per-record time to read the fields the prediction path reads, in nanoseconds."""
+    cultivars = list(db.cultivars.values())
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for c in cultivars:
+            c.cultivar_id; c.cultivar_name; c.crop_type; c.research_peak_brix; c.quality_tier
+            c.gdd_to_maturity; c.gdd_to_peak; c.gdd_base_temp; c.timing_class; c.research_sources
+        best = min(best, time.perf_counter() - started)
+    return best / len(cultivars) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--passes", type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"  FIELDER - Compact Records (catalog x{args.scale})")
+    print("=" * 78)
+    print(f"  {'records':<10} {'heap KB':>10} {'B/record':>10} {'read ns':>10} {'worker KB':>10}")
+    print("-" * 78)
+    for label, database_class in (("regular", CultivarDatabase), ("compact", CompactCultivarDatabase)):
+        size, db = heap_bytes(database_class, args.scale)
+        records = len(db.cultivars) + len(db.regional_data)
+        worker_kb, _ = run_mode(db, args.workers, args.passes)
+        print(f"  {label:<10} {size / 1024:>10.0f} {size / records:>10.0f} "
+              f"{access_ns(db):>10.0f} {worker_kb:>10.0f}")
+        del db
+        gc.collect()
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
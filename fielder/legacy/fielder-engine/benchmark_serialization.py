@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization and compression for prediction responses.
+
+Compares stdlib json (Flask's default encoder) against the pluggable
+serializer (orjson when installed), and reports bytes on the wire for
+identity, gzip and brotli (when installed) encodings.
+
+Payloads:
+- typical:  single regional-average /predict/cultivar response
+- multi:    one cultivar with 12 staggered planting dates
+- batch:    every cultivar x region prediction (the export payload)
+
+Weather comes from the placeholder NOAA provider (no network calls), so
+results measure serialization only.
+
+Run: python benchmark_serialization.py [--iterations 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.models.region import US_GROWING_REGIONS
+from fielder.services import serialization
+from fielder.services.cultivar_predictor import CultivarPredictor
+from fielder.services.data_loader import DataLoader
+from fielder.services.prediction_export import PredictionExporter
+from fielder.services.weather_service import NOAAWeatherProvider, WeatherService
+
+
+def build_payloads(db: CultivarDatabase) -> dict:
+    """Build representative response payloads."""
+    predictor = CultivarPredictor(weather_service=WeatherService(NOAAWeatherProvider()))
+
+    cultivar = db.get_cultivar("florida_radiance")
+    regional = db.get_regional_data("florida_radiance", "central_florida")
+    region = US_GROWING_REGIONS["central_florida"]
+
+    typical = predictor.predict(cultivar, regional, region)
+
+    first_planting = date(date.today().year, 9, 1)
+    planting_dates = [first_planting + timedelta(days=7 * i) for i in range(12)]
+    multi = predictor.predict(cultivar, regional, region, planting_dates=planting_dates)
+
+    exporter = PredictionExporter(db, predictor)
+    batch = list(exporter.iter_predictions())
+
+    return {"typical": typical, "multi": multi, "batch": batch}
+
+
+def time_it(fn, iterations: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response serialization")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    payloads = build_payloads(db)
+
+    print("=" * 78)
+    print(f"  FIELDER - Serialization Benchmark (serializer: {serialization.serializer_name()})")
+    print("=" * 78)
+    print(f"  {'Payload':<10} {'json us':>10} {'fast us':>10} {'speedup':>8} "
+          f"{'identity B':>11} {'gzip B':>8} {'br B':>8}")
+    print("-" * 78)
+
+    for name, payload in payloads.items():
+        stdlib_us = time_it(
+            lambda: json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8"),
+            args.iterations,
+        )
+        fast_us = time_it(
+            lambda: serialization.dumps(payload, sort_keys=True),
+            args.iterations,
+        )
+
+        body = serialization.dumps(payload, sort_keys=True)
+        gzip_size = len(serialization.compress(body, "gzip"))
+        if "br" in serialization.supported_encodings():
+            br_size = str(len(serialization.compress(body, "br")))
+        else:
+            br_size = "n/a"
+
+        print(f"  {name:<10} {stdlib_us:>10.1f} {fast_us:>10.1f} {stdlib_us / fast_us:>7.1f}x "
+              f"{len(body):>11} {gzip_size:>8} {br_size:>8}")
+
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
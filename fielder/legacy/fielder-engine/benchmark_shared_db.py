@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Measure per-worker memory for the regular vs shared cultivar database.
+
+Mimics gunicorn --preload: the parent loads the database, forks N
+workers, and each worker reads every record a few times (as requests
+would). Workers report private dirty memory from /proc/self/smaps_rollup,
+i.e. pages they no longer share with the parent.
+
+Modes:
+- objects: regular CultivarDatabase (reads touch refcounts, un-sharing pages)
+- shared:  SharedCultivarDatabase image in an anonymous shared mapping
+
+--scale N replicates every record N times (suffixed ids) to approximate a
+full catalog; at the current catalog size allocator noise dominates.
+
+Linux only. Run: python benchmark_shared_db.py [--workers 4] [--passes 3] [--scale 200]
+"""
+
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.models.shared_cultivar_database import SharedCultivarDatabase
+from fielder.services.data_loader import DataLoader
+
+
+def private_dirty_kb() -> int:
+    """Private_Dirty of the current process in kB."""
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1])
+    return 0
+
+
+def scaled_database(db: CultivarDatabase, scale: int) -> CultivarDatabase:
+    """Copy of db with every record replicated scale times."""
+    if scale <= 1:
+        return db
+    scaled = CultivarDatabase()
+    for i in range(scale):
+        suffix = f"_{i}" if i else ""
+        for c in db.cultivars.values():
+            scaled.add_cultivar(dataclasses.replace(c, cultivar_id=c.cultivar_id + suffix))
+        for r in db.regional_data.values():
+            scaled.add_regional_data(dataclasses.replace(r, cultivar_id=r.cultivar_id + suffix))
+        for rs in db.rootstocks.values():
+            scaled.add_rootstock(dataclasses.replace(rs, rootstock_id=rs.rootstock_id + suffix))
+    return scaled
+
+
+def read_everything(db: CultivarDatabase, passes: int) -> None:
+    for _ in range(passes):
+        for cultivar_id in db.cultivars:
+            db.get_cultivar(cultivar_id)
+            db.get_regions_for_cultivar(cultivar_id)
+        for regional in db.regional_data.values():
+            db.get_regional_data(regional.cultivar_id, regional.region_id)
+        for rootstock in db.rootstocks.values():
+            rootstock.brix_modifier
+
+
+def run_mode(db: CultivarDatabase, workers: int, passes: int) -> tuple[float, float]:
+    """Fork workers; return (mean private dirty kB, mean fork-to-ready ms)."""
+    gc.freeze()
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        started = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            ready_ms = (time.perf_counter() - started) * 1000
+            baseline = private_dirty_kb()
+            read_everything(db, passes)
+            grown = private_dirty_kb() - baseline
+            os.write(write_fd, f"{grown} {ready_ms}".encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            grown, ready_ms = pipe.read().split()
+        os.waitpid(pid, 0)
+        results.append((int(grown), float(ready_ms)))
+    gc.unfreeze()
+
+    return (
+        sum(r[0] for r in results) / len(results),
+        sum(r[1] for r in results) / len(results),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-worker memory for shared cultivar DB")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--scale", type=int, default=200)
+    args = parser.parse_args()
+
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    db = scaled_database(db, args.scale)
+    shared = SharedCultivarDatabase.from_database(db)
+
+    print("=" * 64)
+    print("  FIELDER - Shared Cultivar Database (per-worker memory)")
+    print("=" * 64)
+    print(f"  Records: {len(db.cultivars)} cultivars, {len(db.regional_data)} regional, "
+          f"{len(db.rootstocks)} rootstocks; image {shared.image_size:,} bytes")
+    print(f"  {'Mode':<10} {'private dirty kB/worker':>24} {'fork ms':>10}")
+    print("-" * 64)
+    for name, database in (("objects", db), ("shared", shared)):
+        grown_kb, ready_ms = run_mode(database, args.workers, args.passes)
+        print(f"  {name:<10} {grown_kb:>24.1f} {ready_ms:>10.2f}")
+    print("=" * 64)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Build the binary catalog snapshot the app loads at startup.
+
+Runs DataLoader.load_all() once and writes the result, stamped with a
+checksum of the catalog sources, for FIELDER_CATALOG_SNAPSHOT, plus the
+lazy catalog's partition manifest for FIELDER_CATALOG_MANIFEST. Rerun it
+whenever data_loader.py (or the record models) change - until then the
+app ignores the stale snapshot and falls back to the loader. Instances
+started with FIELDER_CATALOG_RELOAD_SECONDS pick up a rebuilt snapshot
+without a restart.
+
+Run: python build_catalog_snapshot.py [--output build/cultivar_catalog.snapshot]
+                                     [--manifest build/cultivar_catalog.manifest.json]
+     python build_catalog_snapshot.py --check   # exit 1 if either is missing or stale
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services.catalog_snapshot import build_snapshot, materialize, open_manifest, open_snapshot, write_manifest
+from fielder.services.data_loader import DataLoader
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "cultivar_catalog.snapshot")
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "cultivar_catalog.manifest.json")
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Best-of-repeat wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT)
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--check", action="store_true",
+                        help="Only report whether the snapshot is current")
+    args = parser.parse_args()
+
+    if args.check:
+        snapshot_current = open_snapshot(args.output) is not None
+        manifest_current = open_manifest(args.manifest) is not None
+        print(f"{args.output}: {'current' if snapshot_current else 'missing or stale'}")
+        print(f"{args.manifest}: {'current' if manifest_current else 'missing or stale'}")
+        return 0 if snapshot_current and manifest_current else 1
+
+    db = build_snapshot(args.output)
+    size = os.path.getsize(args.output)
+    manifest = write_manifest(args.manifest)
+
+    def load_with_loader():
+        DataLoader(CultivarDatabase()).load_all()
+
+    print("=" * 78)
+    print("  FIELDER - Catalog Snapshot")
+    print("=" * 78)
+    print(f"  Wrote {args.output} ({size:,} bytes)")
+    print(f"  Wrote {args.manifest} ({len(manifest)} partitions)")
+    print(f"  Records: {len(db.cultivars)} cultivars, {len(db.regional_data)} regional, "
+          f"{len(db.rootstocks)} rootstocks")
+    print("-" * 78)
+    print(f"  DataLoader.load_all()        {timed(load_with_loader):>8.2f} ms")
+    print(f"  Snapshot (mapped, shared)    {timed(lambda: open_snapshot(args.output)):>8.2f} ms")
+    print(f"  Snapshot (materialized)      {timed(lambda: materialize(open_snapshot(args.output))):>8.2f} ms")
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
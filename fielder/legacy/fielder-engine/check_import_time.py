@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Check how long a fresh process takes to import the engine's entry points.
+
+Each target is imported in a new interpreter (bytecode already compiled
+by an untimed first run), --repeat times, and the median wall time is
+compared with its budget. Short-lived CLI jobs and batch workers pay this
+on every spawn, so a module that starts importing something heavy at top
+level shows up here before it shows up in production.
+
+With --verbose, over-budget targets list the modules with the highest
+self time (python -X importtime) to point at the culprit.
+
+Exits 1 when any target is over budget.
+
+Run: python check_import_time.py [--repeat 7] [--scale 1.0] [--verbose]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+# Module -> budget in ms. The packages are lazy (attributes import their
+# submodule on first access), so each target pays only for what it uses.
+IMPORT_BUDGETS_MS = {
+    "fielder.models": 15,
+    "fielder.services": 15,
+    "fielder.services.quality_predictor": 80,
+    "fielder.services.cultivar_predictor": 150,
+    "fielder.services.app_services": 200,
+}
+
+_TIMED_IMPORT = (
+    "import time; started = time.perf_counter(); "
+    "import importlib; importlib.import_module({module!r}); "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def _child_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    return env
+
+
+def import_ms(module: str, env: dict) -> float:
+    """Wall time to import module in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMED_IMPORT.format(module=module)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip())
+
+
+def slowest_imports(module: str, env: dict, limit: int = 8) -> list[tuple[float, float, str]]:
+    """(self ms, cumulative ms, name) of the slowest imports under module, by self time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us) / 1000, int(cumulative_us) / 1000, name.rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="Fresh interpreters per target")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow CI hosts)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show the slowest imports of failing targets")
+    args = parser.parse_args()
+
+    env = _child_env()
+    print("=" * 78)
+    print("  FIELDER - Import Time Budget")
+    print("=" * 78)
+    print(f"  {'Module':<42} {'median':>9} {'budget':>9}")
+    print("-" * 78)
+
+    over = []
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        budget *= args.scale
+        import_ms(module, env)  # Compile bytecode outside the timed runs
+        median = statistics.median(import_ms(module, env) for _ in range(max(args.repeat, 1)))
+        status = "OK" if median <= budget else "OVER"
+        print(f"  {module:<42} {median:>6.1f} ms {budget:>6.0f} ms  {status}")
+        if median > budget:
+            over.append(module)
+
+    if over and args.verbose:
+        for module in over:
+            print("-" * 78)
+            print(f"  Slowest imports under {module} (self / cumulative ms):")
+            for self_ms, cumulative_ms, name in slowest_imports(module, env):
+                print(f"  {self_ms:>8.1f} {cumulative_ms:>8.1f}  {name}")
+    print("=" * 78)
+    if over:
+        print(f"  {len(over)} over budget: {', '.join(over)}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Export every cultivar x region prediction as newline-delimited JSON.
+
+Same output as the /api/export/predictions endpoint, without the web server.
+Predictions are written one line at a time; memory grows only with the
+number of cultivar x region pairs.
+
+Run: python export_predictions.py > predictions.ndjson
+     python export_predictions.py --crop-type strawberry --region central_florida
+     python export_predictions.py --resume-token <last token seen>
+"""
+
+import argparse
+import sys
+
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services.data_loader import DataLoader
+from fielder.services.prediction_export import PredictionExporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--crop-type", help="Only cultivars of this crop type")
+    parser.add_argument("--region", help="Only this region_id")
+    parser.add_argument("--cultivar", help="Only this cultivar_id")
+    parser.add_argument("--resume-token", help="Resume after the record carrying this token")
+    parser.add_argument("--output", "-o", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    exporter = PredictionExporter(db)
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    count = 0
+    try:
+        for line in exporter.iter_ndjson(
+            default=DefaultJSONProvider.default,  # Dates as the API formats them
+            crop_type=args.crop_type,
+            region_id=args.region,
+            cultivar_id=args.cultivar,
+            resume_token=args.resume_token,
+        ):
+            out.write(line)
+            out.flush()
+            count += 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+    print(f"Exported {count} predictions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
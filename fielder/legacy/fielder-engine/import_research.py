@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Preview what the research JSON files add to the cultivar catalog.
+
+Diffs the files in the research directory (see research_importer)
+against a freshly loaded DataLoader catalog - what an instance started
+with FIELDER_RESEARCH_DIR would import - and reports records by crop,
+curated records the import leaves alone, and files that failed to parse.
+Nothing is written; running instances pick up changed files themselves
+(FIELDER_CATALOG_RELOAD_SECONDS) or on POST /admin/catalog/import.
+
+Run: python import_research.py [--research-dir ../../data/research] [--verbose]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase, CultivarResearch
+from fielder.services.data_loader import DataLoader
+from fielder.services.research_importer import ResearchImporter
+
+DEFAULT_RESEARCH_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "data", "research"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--research-dir", default=os.path.normpath(DEFAULT_RESEARCH_DIR))
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every added record")
+    args = parser.parse_args()
+
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    importer = ResearchImporter(args.research_dir)
+    started = time.perf_counter()
+    diff = importer.diff(db)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    cultivars = [r for r in diff.added if isinstance(r, CultivarResearch)]
+    regional = [r for r in diff.added if not isinstance(r, CultivarResearch)]
+    by_crop = Counter(r.crop_type for r in cultivars)
+
+    print("=" * 78)
+    print("  FIELDER - Research Import (dry run)")
+    print("=" * 78)
+    print(f"  {args.research_dir}")
+    print(f"  Curated catalog: {len(db.cultivars)} cultivars, {len(db.regional_data)} regional")
+    print(f"  Import adds:     {len(cultivars)} cultivars, {len(regional)} regional ({elapsed:.0f} ms)")
+    print("-" * 78)
+    for crop_type, count in by_crop.most_common():
+        print(f"  {crop_type:<24} {count:>5}")
+    if diff.curated:
+        print("-" * 78)
+        print(f"  Curated records kept ({len(diff.curated)}): {', '.join(diff.curated)}")
+    if diff.skipped_crops:
+        print("-" * 78)
+        skipped = ", ".join(f"{crop} ({count})" for crop, count in sorted(diff.skipped_crops.items()))
+        print(f"  Crops the engine doesn't know, not imported: {skipped}")
+    if args.verbose:
+        print("-" * 78)
+        for record in diff.added:
+            region = f" @ {record.region_id}" if not isinstance(record, CultivarResearch) else ""
+            print(f"  + {record.cultivar_id}{region}")
+    if diff.errors:
+        print("-" * 78)
+        for file_name, error in diff.errors.items():
+            print(f"  ! {file_name}: {error}")
+    print("=" * 78)
+    return 1 if diff.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
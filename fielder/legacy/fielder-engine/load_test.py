@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Load-test the Fielder API with synthetic traffic mixes.
+
+Replays a traffic profile against /predict, /predict/cultivar,
+/api/cultivars and /api/whats-in-season and reports throughput, latency
+percentiles and upstream weather calls.
+
+By default the app runs in-process (Flask test client) with the offline
+weather provider, so results measure our code rather than Open-Meteo.
+Use --url to drive a running server instead (start it with
+FIELDER_WEATHER_PROVIDER=offline for comparable numbers).
+
+Profiles weight routes, crops and regions, and set how many cultivar
+requests carry multiple planting dates:
+
+    {
+        "routes": {"predict_cultivar": 6, "predict": 2, "cultivars": 1, "whats_in_season": 1},
+        "crops": {"navel_orange": 4, "strawberry": 3},       # default weight 1
+        "regions": {"indian_river": 3},                      # default weight 1
+        "multi_planting_ratio": 0.25,
+        "max_plantings": 8
+    }
+
+Pass a built-in name (see PROFILES) or a path to a JSON file.
+
+Regression check: --save-baseline FILE stores the report, --baseline FILE
+compares against it and exits 1 when throughput, p99 latency or upstream
+calls per request regress by more than --tolerance.
+
+Run: python load_test.py [--profile winter_citrus] [--requests 2000] [--concurrency 8]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+# Must be set before app is imported
+os.environ.setdefault("FIELDER_WEATHER_PROVIDER", "offline")
+os.environ.setdefault("FIELDER_RATE_LIMIT", "0")  # Measure the app, not the limiter
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.models.region import US_GROWING_REGIONS
+from fielder.services.data_loader import DataLoader
+
+
+PROFILES = {
+    "uniform": {
+        "routes": {"predict_cultivar": 1, "predict": 1, "cultivars": 1, "whats_in_season": 1},
+        "multi_planting_ratio": 0.1,
+    },
+    # Dec-Feb: citrus dominates lookups
+    "winter_citrus": {
+        "routes": {"predict_cultivar": 6, "predict": 2, "cultivars": 1, "whats_in_season": 1},
+        "crops": {
+            "navel_orange": 6, "valencia": 3, "valencia_orange": 3, "grapefruit": 5,
+            "tangerine": 4, "satsuma": 3, "strawberry": 3,
+        },
+        "regions": {"indian_river": 4, "central_florida": 3, "texas_rgv": 3, "california_central_valley": 2},
+        "multi_planting_ratio": 0.1,
+    },
+    # Jun-Aug: stone fruit, berries, mangos and many staggered tomato plantings
+    "summer_market": {
+        "routes": {"predict_cultivar": 5, "predict": 3, "cultivars": 1, "whats_in_season": 2},
+        "crops": {
+            "peach": 6, "sweet_cherry": 4, "blueberry": 4, "tomato": 5, "mango": 3, "strawberry": 2,
+        },
+        "regions": {"georgia_piedmont": 3, "michigan_southwest": 3, "pacific_nw_yakima": 2, "south_florida": 2},
+        "multi_planting_ratio": 0.4,
+        "max_plantings": 12,
+    },
+    # Browsing-heavy: catalog pages dominate
+    "catalog_heavy": {
+        "routes": {"predict_cultivar": 1, "predict": 1, "cultivars": 6, "whats_in_season": 4},
+        "multi_planting_ratio": 0.0,
+    },
+}
+
+
+# =============================================================================
+# TRAFFIC GENERATION
+# =============================================================================
+
+class TrafficGenerator:
+    """Draws weighted requests from a profile."""
+
+    def __init__(self, profile: dict, db: CultivarDatabase, seed: int):
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self.multi_planting_ratio = profile.get("multi_planting_ratio", 0.0)
+        self.max_plantings = profile.get("max_plantings", 6)
+
+        crop_weights = profile.get("crops", {})
+        region_weights = profile.get("regions", {})
+
+        def weight(crop_type: str, region_id: str) -> float:
+            return crop_weights.get(crop_type, 1) * region_weights.get(region_id, 1)
+
+        self.routes, self.route_weights = zip(*profile["routes"].items())
+
+        crop_pairs = [
+            (region_id, crop)
+            for region_id, region in US_GROWING_REGIONS.items()
+            for crop in region.viable_crops
+        ]
+        self.crop_pairs = crop_pairs
+        self.crop_pair_weights = [weight(crop, rid) for rid, crop in crop_pairs]
+
+        cultivar_pairs = []
+        for key, regional in db.regional_data.items():
+            cultivar = db.get_cultivar(regional.cultivar_id)
+            if cultivar and regional.region_id in US_GROWING_REGIONS:
+                cultivar_pairs.append((regional.cultivar_id, regional.region_id, cultivar.crop_type))
+        self.cultivar_pairs = cultivar_pairs
+        self.cultivar_pair_weights = [weight(crop, rid) for _cid, rid, crop in cultivar_pairs]
+
+        self.crop_types = sorted({crop for _cid, _rid, crop in cultivar_pairs})
+        self.region_ids = sorted(US_GROWING_REGIONS)
+
+    def _pick(self, items, weights):
+        return self.rng.choices(items, weights=weights, k=1)[0]
+
+    def next_request(self) -> tuple[str, str, str, dict]:
+        """(route name, method, path, json body or query args)."""
+        route = self._pick(self.routes, self.route_weights)
+
+        if route == "predict":
+            region_id, crop = self._pick(self.crop_pairs, self.crop_pair_weights)
+            return route, "POST", "/predict", {"region": region_id, "crop": crop}
+
+        if route == "predict_cultivar":
+            cultivar_id, region_id, _crop = self._pick(self.cultivar_pairs, self.cultivar_pair_weights)
+            body = {"cultivar_id": cultivar_id, "region_id": region_id}
+            if self.rng.random() < self.multi_planting_ratio:
+                first = date.today() - timedelta(days=self.rng.randint(30, 200))
+                count = self.rng.randint(2, self.max_plantings)
+                body["planting_dates"] = [
+                    (first + timedelta(days=14 * i)).isoformat() for i in range(count)
+                ]
+            return route, "POST", "/predict/cultivar", body
+
+        if route == "cultivars":
+            args = {}
+            roll = self.rng.random()
+            if roll < 0.4:
+                args["crop_type"] = self.rng.choice(self.crop_types)
+            elif roll < 0.7:
+                args["region_id"] = self.rng.choice(self.region_ids)
+            return route, "GET", "/api/cultivars", args
+
+        if route == "whats_in_season":
+            return route, "GET", "/api/whats-in-season", {}
+
+        raise ValueError(f"Unknown route in profile: {route}")
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+class InProcessTarget:
+    """Drives the app through Flask's test client."""
+
+    name = "in-process"
+
+    def __init__(self):
+        import app as app_module
+        self.app_module = app_module
+        self.metrics = app_module.metrics
+        self._local = threading.local()
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app_module.app.test_client()
+        return client
+
+    def send(self, method: str, path: str, payload: dict) -> tuple[int, bytes]:
+        client = self._client()
+        if method == "POST":
+            response = client.post(path, json=payload)
+        else:
+            response = client.get(path, query_string=payload)
+        return response.status_code, response.get_data()
+
+    def upstream_calls(self) -> int:
+        return int(self.metrics.UPSTREAM_REQUESTS.total())
+
+
+class HttpTarget:
+    """Drives a running server over HTTP."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.name = self.base_url
+
+    def send(self, method: str, path: str, payload: dict) -> tuple[int, bytes]:
+        url = self.base_url + path
+        data = None
+        headers = {}
+        if method == "POST":
+            data = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        elif payload:
+            url += "?" + urllib.parse.urlencode(payload)
+
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=60) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def upstream_calls(self) -> int:
+        """Sum fielder_upstream_requests_total from the server's /metrics."""
+        with urllib.request.urlopen(self.base_url + "/metrics", timeout=30) as response:
+            text = response.read().decode("utf-8")
+        total = 0.0
+        for line in text.splitlines():
+            if line.startswith("fielder_upstream_requests_total{"):
+                total += float(line.rsplit(" ", 1)[1])
+        return int(total)
+
+
+# =============================================================================
+# RUN + REPORT
+# =============================================================================
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: list[float]) -> dict:
+    """Latency summary in milliseconds."""
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p90_ms": round(percentile(values, 90) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+def is_error(status: int, body: bytes) -> bool:
+    """A non-200 status, or a JSON object with an "error" key (the app reports errors with 200)."""
+    if status != 200:
+        return True
+    if b'"error"' not in body:
+        return False
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return False  # Not a single JSON document (NDJSON, HTML)
+    return isinstance(data, dict) and "error" in data
+
+
+def run(target, generator: TrafficGenerator, total_requests: int, concurrency: int, warmup: int) -> dict:
+    """Send the requests and build the report."""
+    for _ in range(warmup):
+        _route, method, path, payload = generator.next_request()
+        target.send(method, path, payload)
+
+    # Draw every request up front so the mix doesn't depend on thread timing
+    planned = [generator.next_request() for _ in range(total_requests)]
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+
+    def worker(item):
+        route, method, path, payload = item
+        started = time.perf_counter()
+        try:
+            status, body = target.send(method, path, payload)
+        except Exception:
+            status, body = 0, b""
+        elapsed = time.perf_counter() - started
+        failed = is_error(status, body)
+        with lock:
+            latencies[route].append(elapsed)
+            if failed:
+                errors[route] += 1
+
+    upstream_before = target.upstream_calls()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, planned))
+    elapsed = time.perf_counter() - started
+    upstream_calls = target.upstream_calls() - upstream_before
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "target": target.name,
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total_requests / elapsed, 1) if elapsed else 0.0,
+        "latency": summarize(all_latencies),
+        "routes": {
+            route: {**summarize(values), "errors": errors[route]}
+            for route, values in sorted(latencies.items())
+        },
+        "errors": sum(errors.values()),
+        "upstream_calls": upstream_calls,
+        "upstream_calls_per_request": round(upstream_calls / total_requests, 3) if total_requests else 0.0,
+    }
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Describe every metric that regressed by more than tolerance."""
+    regressions = []
+
+    if report["throughput_rps"] < baseline["throughput_rps"] * (1 - tolerance):
+        regressions.append(
+            f"throughput {report['throughput_rps']} rps < baseline {baseline['throughput_rps']} rps"
+        )
+    if report["latency"]["p99_ms"] > baseline["latency"]["p99_ms"] * (1 + tolerance):
+        regressions.append(
+            f"p99 {report['latency']['p99_ms']} ms > baseline {baseline['latency']['p99_ms']} ms"
+        )
+    if report["upstream_calls_per_request"] > baseline["upstream_calls_per_request"] * (1 + tolerance):
+        regressions.append(
+            f"upstream calls/request {report['upstream_calls_per_request']} "
+            f"> baseline {baseline['upstream_calls_per_request']}"
+        )
+    for route, stats in report["routes"].items():
+        base = baseline.get("routes", {}).get(route)
+        if base and stats["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{route} p99 {stats['p99_ms']} ms > baseline {base['p99_ms']} ms")
+
+    return regressions
+
+
+def print_report(profile_name: str, report: dict):
+    print("=" * 78)
+    print(f"  FIELDER - Load Test ({profile_name}, {report['target']})")
+    print("=" * 78)
+    print(f"  Requests: {report['requests']}  Concurrency: {report['concurrency']}  "
+          f"Elapsed: {report['elapsed_s']}s  Errors: {report['errors']}")
+    print(f"  Throughput: {report['throughput_rps']} req/s")
+    print(f"  Upstream weather calls: {report['upstream_calls']} "
+          f"({report['upstream_calls_per_request']}/request)")
+    print("-" * 78)
+    print(f"  {'Route':<18} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'err':>5}")
+    rows = list(report["routes"].items()) + [("ALL", {**report["latency"], "errors": report["errors"]})]
+    for route, stats in rows:
+        print(f"  {route:<18} {stats['count']:>7} {stats['p50_ms']:>9.2f} {stats['p90_ms']:>9.2f} "
+              f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f} {stats['errors']:>5}")
+    print("=" * 78)
+
+
+def load_profile(name_or_path: str) -> dict:
+    if name_or_path in PROFILES:
+        return PROFILES[name_or_path]
+    with open(name_or_path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Fielder API")
+    parser.add_argument("--profile", default="uniform",
+                        help=f"Built-in profile ({', '.join(PROFILES)}) or path to a JSON profile")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--upstream-latency-ms", type=float, default=0.0,
+                        help="Simulated upstream latency for the in-process offline provider")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the report as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative regression vs baseline (default 0.15)")
+    args = parser.parse_args()
+
+    profile = load_profile(args.profile)
+
+    if args.url:
+        target = HttpTarget(args.url)
+    else:
+        os.environ["FIELDER_OFFLINE_WEATHER_LATENCY_MS"] = str(args.upstream_latency_ms)
+        target = InProcessTarget()
+
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    generator = TrafficGenerator(profile, db, args.seed)
+
+    report = run(target, generator, args.requests, args.concurrency, args.warmup)
+    report["profile"] = args.profile
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(args.profile, report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("REGRESSIONS vs baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            return 1
+        print("No regressions vs baseline.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,49 @@
-"""Data models for Fielder."""
-
-from .crop import Crop, Cultivar, CropCategory
-from .region import GrowingRegion, USDAZone
-from .harvest import HarvestWindow, SeasonalAvailability
-from .farm import Farm, FarmCrop
-from .weather import DailyWeather, GDDAccumulation, CROP_GDD_TARGETS, get_gdd_targets
-from .quality import SHAREQualityPrediction, CropMaturityType
-from .prediction import PredictionRange, DateRange, HarvestPrediction, DataQuality
-from .cultivar_database import CultivarDatabase, CultivarResearch, RegionalBloomData
-
-__all__ = [
-    "Crop",
-    "Cultivar",
-    "CropCategory",
-    "GrowingRegion",
-    "USDAZone",
-    "HarvestWindow",
-    "SeasonalAvailability",
-    "Farm",
-    "FarmCrop",
-    "DailyWeather",
-    "GDDAccumulation",
-    "CROP_GDD_TARGETS",
-    "get_gdd_targets",
-    "SHAREQualityPrediction",
-    "CropMaturityType",
-    "PredictionRange",
-    "DateRange",
-    "HarvestPrediction",
-    "DataQuality",
-    "CultivarDatabase",
-    "CultivarResearch",
-    "RegionalBloomData",
-]
+"""
+Data models for Fielder.
+
+Names are imported from their submodules on first access (see
+fielder.services).
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "Crop": ".crop",
+    "Cultivar": ".crop",
+    "CropCategory": ".crop",
+    "GrowingRegion": ".region",
+    "USDAZone": ".region",
+    "HarvestWindow": ".harvest",
+    "SeasonalAvailability": ".harvest",
+    "Farm": ".farm",
+    "FarmCrop": ".farm",
+    "DailyWeather": ".weather",
+    "GDDAccumulation": ".weather",
+    "CROP_GDD_TARGETS": ".weather",
+    "get_gdd_targets": ".weather",
+    "SHAREQualityPrediction": ".quality",
+    "CropMaturityType": ".quality",
+    "PredictionRange": ".prediction",
+    "DateRange": ".prediction",
+    "HarvestPrediction": ".prediction",
+    "DataQuality": ".prediction",
+    "CultivarDatabase": ".cultivar_database",
+    "CultivarResearch": ".cultivar_database",
+    "RegionalBloomData": ".cultivar_database",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,147 @@
+"""
+Compact Cultivar Database - Slotted, interned records for the hot read path.
+
+CultivarResearch and RegionalBloomData are plain dataclasses: every
+instance carries a __dict__, every list field is its own list object, and
+strings repeated across the catalog (crop types, zones, source names,
+region ids) are separate copies whenever the data comes from parsed
+files. Per-record memory is dominated by that overhead rather than by the
+research values themselves.
+
+CompactCultivarDatabase stores the same records as:
+
+- __slots__ classes (no per-instance __dict__, faster attribute reads)
+- strings interned, so each distinct value exists once per process
+- tuples instead of lists, with equal tuples shared between records
+
+Enum fields keep their members: a member is a process-wide singleton, so
+a slot pointing at it costs no more than one holding a small int, and
+reads skip the decode.
+
+Records keep the CultivarResearch / RegionalBloomData attribute API
+(list fields read back as tuples) and are treated as read-only.
+to_record() converts one back to its dataclass.
+
+    db = CompactCultivarDatabase()
+    DataLoader(db).load_all()  # records are compacted as they are added
+"""
+
+import sys
+from dataclasses import fields
+from types import MappingProxyType
+
+from .cultivar_database import (
+    INDEX_NAMES,
+    CultivarDatabase,
+    CultivarResearch,
+    RegionalBloomData,
+)
+
+
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Equal tuples share one object (most records repeat a few small ones).
+# Keyed with item types too, so (0, 0) and (0.0, 0.0) stay distinct.
+_tuples: dict[tuple, tuple] = {}
+
+
+def _compact(value):
+    """Interned / shared immutable form of a field value."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        value = tuple(_compact(item) for item in value)
+        return _tuples.setdefault((value, tuple(map(type, value))), value)
+    if isinstance(value, dict):
+        return MappingProxyType({_compact(k): _compact(v) for k, v in value.items()}) if value else _EMPTY_MAPPING
+    return value
+
+
+class _CompactRecord:
+    """Slotted read-only copy of a record dataclass."""
+
+    __slots__ = ()
+    _record_type = None
+    _field_names: tuple[str, ...] = ()
+
+    def __init__(self, record):
+        for name in self._field_names:
+            setattr(self, name, _compact(getattr(record, name)))
+
+    def to_record(self):
+        """The equivalent dataclass (list and dict fields copied back to lists and dicts)."""
+        values = {}
+        for f in fields(self._record_type):
+            value = getattr(self, f.name)
+            if f.default_factory is list:
+                value = list(value)
+            elif f.default_factory is dict:
+                value = dict(value)
+            values[f.name] = value
+        return self._record_type(**values)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in fields(self._record_type))
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return type(self), (self.to_record(),)
+
+
+class CompactCultivar(_CompactRecord):
+    """CultivarResearch with slots, interned strings and shared tuples."""
+
+    _record_type = CultivarResearch
+    _field_names = tuple(f.name for f in fields(CultivarResearch))
+    __slots__ = _field_names
+
+
+class CompactRegionalData(_CompactRecord):
+    """RegionalBloomData with slots and interned strings."""
+
+    _record_type = RegionalBloomData
+    _field_names = tuple(f.name for f in fields(RegionalBloomData))
+    __slots__ = _field_names
+
+
+class CompactCultivarDatabase(CultivarDatabase):
+    """
+    CultivarDatabase that stores cultivars and regional data compactly.
+
+    Queries, indexes and lazy partitions behave exactly as in the base
+    class; only the stored record objects differ.
+    """
+
+    def add_cultivar(self, cultivar) -> None:
+        if not isinstance(cultivar, CompactCultivar):
+            cultivar = CompactCultivar(cultivar)
+        super().add_cultivar(cultivar)
+
+    def add_regional_data(self, data) -> None:
+        if not isinstance(data, CompactRegionalData):
+            data = CompactRegionalData(data)
+        super().add_regional_data(data)
+
+    @classmethod
+    def from_database(cls, db: CultivarDatabase) -> "CompactCultivarDatabase":
+        """Compact copy of db, keeping its indexes, version and last_modified."""
+        compact = cls()
+        for cultivar in db.cultivars.values():
+            compact.add_cultivar(cultivar)
+        for regional in db.regional_data.values():
+            compact.add_regional_data(regional)
+        for rootstock in db.rootstocks.values():
+            compact.add_rootstock(rootstock)
+        for name in INDEX_NAMES:
+            setattr(compact, name, {key: list(ids) for key, ids in getattr(db, name).items()})
+        compact.version = db.version
+        compact.last_modified = db.last_modified
+        compact.crop_versions = dict(db.crop_versions)
+        return compact
@@ -17,9 +17,12 @@ This is the data we can compile from:
 - Historical records
 """
 
+import hashlib
+import threading
+from bisect import insort
 from dataclasses import dataclass, field
-from datetime import date
-from typing import Optional
+from datetime import date, datetime, timezone
+from typing import Callable, Optional
 from enum import Enum
 
 
@@ -171,6 +174,44 @@ class RootstockResearch:
     research_sources: list[str] = field(default_factory=list)
 
 
+# Cultivar indexes: attribute -> the keys a cultivar is filed under.
+# Composite keys are "crop_type:value", like regional_data keys.
+_CULTIVAR_INDEXES: dict[str, Callable[[CultivarResearch], tuple[str, ...]]] = {
+    "_cultivars_by_crop_type": lambda c: (c.crop_type,),
+    "_cultivars_by_quality_tier": lambda c: (f"{c.crop_type}:{getattr(c.quality_tier, 'value', None)}",),
+    "_heritage_cultivars_by_crop_type": lambda c: (c.crop_type,) if c.is_heritage or c.is_heirloom else (),
+    "_cultivars_by_timing_class": lambda c: (f"{c.crop_type}:{c.timing_class}",),
+    "_cultivars_by_usda_zone": lambda c: tuple(dict.fromkeys(c.optimal_usda_zones)),
+}
+
+# Every index the add_* methods maintain (id lists in insertion order,
+# except rootstocks, which are kept sorted by brix_modifier, highest first)
+INDEX_NAMES = (
+    "_regions_by_cultivar",
+    "_cultivars_by_region",
+    *_CULTIVAR_INDEXES,
+    "_rootstocks_by_crop_type",
+    "_rootstocks_by_brix",
+)
+
+
+@dataclass(frozen=True)
+class CatalogPartition:
+    """
+    A slice of the catalog loaded on first access.
+
+    load(db) adds the slice's records to db; kind says which records it
+    holds ("cultivars", "regional_data" or "rootstocks"), crop_types which
+    crops they belong to and ids their keys in that mapping (a lookup only
+    loads the partitions holding its id).
+    """
+    name: str
+    kind: str
+    crop_types: tuple[str, ...]
+    load: Callable[["CultivarDatabase"], object]
+    ids: frozenset[str] = frozenset()
+
+
 class CultivarDatabase:
     """
     Database of cultivar research data.
@@ -184,29 +225,269 @@ class CultivarDatabase:
     Phase 1: Build with research data (Brix studies, maturity data)
     Phase 2: Enhance with actual measurements from farm network
     Phase 3: Create comprehensive quality database
+
+    Records can also come from lazy partitions (register_partition): a
+    partition is loaded the first time a lookup needs it - a crop's
+    cultivars when that crop is queried, the partitions listing an id when
+    it is looked up (none for an unknown id), everything when a whole
+    mapping is read. Loaded partitions are replayed in registration order,
+    so contents and ordering always match loading everything up front, and
+    each load bumps version. load_partitions() loads the rest eagerly
+    (before forking workers, say).
     """
 
+    # Lazy partitions not yet loaded (instances without partitions share this)
+    _pending: tuple = ()
+
     def __init__(self):
-        self.cultivars: dict[str, CultivarResearch] = {}
-        self.regional_data: dict[str, RegionalBloomData] = {}
-        self.rootstocks: dict[str, RootstockResearch] = {}
+        self._cultivars: dict[str, CultivarResearch] = {}
+        self._regional_data: dict[str, RegionalBloomData] = {}
+        self._rootstocks: dict[str, RootstockResearch] = {}
+
+        # Indexes maintained by the add_* methods (see INDEX_NAMES)
+        self._regions_by_cultivar: dict[str, list[str]] = {}
+        self._cultivars_by_region: dict[str, list[str]] = {}
+        self._cultivars_by_crop_type: dict[str, list[str]] = {}
+        self._cultivars_by_quality_tier: dict[str, list[str]] = {}
+        self._heritage_cultivars_by_crop_type: dict[str, list[str]] = {}
+        self._cultivars_by_timing_class: dict[str, list[str]] = {}
+        self._cultivars_by_usda_zone: dict[str, list[str]] = {}
+        self._rootstocks_by_crop_type: dict[str, list[str]] = {}
+        self._rootstocks_by_brix: dict[str, list[str]] = {}  # Single key "" (all rootstocks)
+
+        # Bumped on every change so caches and ETags can key on it
+        self.version: int = 0
+        self.last_modified: datetime = datetime.now(timezone.utc)
+        # Per-crop versions carried over by a reload (see crop_version)
+        self.crop_versions: dict[str, int] = {}
+
+        # (rank, partition) still to load; (rank, records) of loaded ones
+        self._pending: list[tuple[int, CatalogPartition]] = []
+        self._staged: list[tuple[int, CultivarDatabase]] = []
+        self._partition_lock = threading.Lock()
+
+    # Whole mappings: reading one loads every pending partition of its kind
+
+    @property
+    def cultivars(self) -> dict[str, CultivarResearch]:
+        if self._pending:
+            self.load_partitions("cultivars")
+        return self._cultivars
+
+    @cultivars.setter
+    def cultivars(self, value) -> None:
+        self._cultivars = value
+
+    @property
+    def regional_data(self) -> dict[str, RegionalBloomData]:
+        if self._pending:
+            self.load_partitions("regional_data")
+        return self._regional_data
+
+    @regional_data.setter
+    def regional_data(self, value) -> None:
+        self._regional_data = value
+
+    @property
+    def rootstocks(self) -> dict[str, RootstockResearch]:
+        if self._pending:
+            self.load_partitions("rootstocks")
+        return self._rootstocks
+
+    @rootstocks.setter
+    def rootstocks(self, value) -> None:
+        self._rootstocks = value
+
+    def _touch(self) -> None:
+        """Record that the database contents changed."""
+        self.version += 1
+        self.last_modified = datetime.now(timezone.utc)
+        if self.crop_versions:
+            self.crop_versions = {}  # Any crop may have changed
+
+    # =========================================================================
+    # LAZY PARTITIONS
+    # =========================================================================
+
+    def register_partition(self, partition: CatalogPartition) -> None:
+        """Register a partition to load on first access (before adding any records)."""
+        with self._partition_lock:
+            if (self._cultivars or self._regional_data or self._rootstocks) and not self._staged:
+                raise ValueError("Partitions must be registered before records are added")
+            rank = len(self._pending) + len(self._staged)
+            self._pending.append((rank, partition))
+
+    @property
+    def pending_partitions(self) -> list[str]:
+        """Names of registered partitions not loaded yet."""
+        return [partition.name for _, partition in self._pending]
+
+    def load_partitions(self, kind: Optional[str] = None, crop_type: Optional[str] = None) -> int:
+        """
+        Load pending partitions now: all of them, or those of one kind and/or crop type.
+
+        Returns the number loaded.
+        """
+        if not self._pending:
+            return 0
+        loaded = 0
+        with self._partition_lock:  # Concurrent first accesses wait for one load
+            try:
+                for rank, partition in list(self._pending):
+                    if kind is not None and partition.kind != kind:
+                        continue
+                    if crop_type is not None and crop_type not in partition.crop_types:
+                        continue
+                    self._stage(rank, partition)
+                    loaded += 1
+            finally:
+                if loaded:
+                    self._replay_staged()
+        return loaded
+
+    def _load_until(self, kind: str, mapping: str, key: str) -> None:
+        """Load the pending partitions of a kind whose ids include key (none when no partition lists it)."""
+        if not self._pending or key in getattr(self, mapping):
+            return
+        with self._partition_lock:
+            loaded = 0
+            try:
+                # Every holder, not just the first: later partitions replace
+                # earlier records, as they would in a full load
+                for rank, partition in list(self._pending):
+                    if partition.kind == kind and key in partition.ids:
+                        self._stage(rank, partition)
+                        loaded += 1
+            finally:
+                if loaded:
+                    self._replay_staged()
+
+    def _stage(self, rank: int, partition: CatalogPartition) -> "CultivarDatabase":
+        """Run a partition's loader into a staging database (call with the lock held)."""
+        staging = CultivarDatabase()
+        partition.load(staging)
+        self._staged.append((rank, staging))
+        self._pending.remove((rank, partition))
+        return staging
+
+    def _replay_staged(self) -> None:
+        """Rebuild the records and indexes from the loaded partitions, in registration order."""
+        merged = type(self)()
+        for _, staging in sorted(self._staged, key=lambda item: item[0]):
+            for cultivar in staging._cultivars.values():
+                merged.add_cultivar(cultivar)
+            for regional in staging._regional_data.values():
+                merged.add_regional_data(regional)
+            for rootstock in staging._rootstocks.values():
+                merged.add_rootstock(rootstock)
+
+        # Swap whole maps so concurrent readers never see one mid-update
+        self._cultivars = merged._cultivars
+        self._regional_data = merged._regional_data
+        self._rootstocks = merged._rootstocks
+        for name in INDEX_NAMES:
+            setattr(self, name, getattr(merged, name))
+        if not self._pending:
+            self._staged = []
+        self._touch()  # Caches keyed on version see the new records
+
+    # =========================================================================
+    # RECORDS
+    # =========================================================================
 
     def add_cultivar(self, cultivar: CultivarResearch) -> None:
         """Add a cultivar to the database."""
-        self.cultivars[cultivar.cultivar_id] = cultivar
+        if self._pending:
+            self.load_partitions()
+        cultivar_id = cultivar.cultivar_id
+        previous = self._cultivars.get(cultivar_id)
+        self._cultivars[cultivar_id] = cultivar
+
+        # A replaced cultivar keeps its place under keys it is still filed under
+        for name, keys_of in _CULTIVAR_INDEXES.items():
+            index = getattr(self, name)
+            keys = keys_of(cultivar)
+            if previous:
+                for key in keys_of(previous):
+                    if key not in keys:
+                        index[key].remove(cultivar_id)
+            for key in keys:
+                ids = index.setdefault(key, [])
+                if cultivar_id not in ids:
+                    ids.append(cultivar_id)
+        self._touch()
 
     def add_regional_data(self, data: RegionalBloomData) -> None:
         """Add regional bloom/harvest data."""
+        if self._pending:
+            self.load_partitions()
         key = f"{data.cultivar_id}:{data.region_id}"
-        self.regional_data[key] = data
+        if key not in self._regional_data:
+            self._regions_by_cultivar.setdefault(data.cultivar_id, []).append(data.region_id)
+            self._cultivars_by_region.setdefault(data.region_id, []).append(data.cultivar_id)
+        self._regional_data[key] = data
+        self._touch()
 
     def add_rootstock(self, rootstock: RootstockResearch) -> None:
         """Add a rootstock to the database."""
-        self.rootstocks[rootstock.rootstock_id] = rootstock
+        if self._pending:
+            self.load_partitions()
+        rootstock_id = rootstock.rootstock_id
+        previous = self._rootstocks.get(rootstock_id)
+        self._rootstocks[rootstock_id] = rootstock
+
+        if (
+            previous is None
+            or previous.brix_modifier != rootstock.brix_modifier
+            or previous.crop_types != rootstock.crop_types
+        ):
+            if previous:
+                for crop_type in previous.crop_types:
+                    self._rootstocks_by_crop_type[crop_type].remove(rootstock_id)
+                self._rootstocks_by_brix[""].remove(rootstock_id)
+            # Ties keep insertion order
+            by_brix = lambda rid: -self._rootstocks[rid].brix_modifier
+            for crop_type in dict.fromkeys(rootstock.crop_types):
+                insort(self._rootstocks_by_crop_type.setdefault(crop_type, []), rootstock_id, key=by_brix)
+            insort(self._rootstocks_by_brix.setdefault("", []), rootstock_id, key=by_brix)
+        self._touch()
+
+    def remove_regional_data(self, cultivar_id: str, region_id: str) -> None:
+        """Remove one cultivar's regional data for a region (no-op if absent)."""
+        if self._pending:
+            self.load_partitions()
+        if self._regional_data.pop(f"{cultivar_id}:{region_id}", None) is None:
+            return
+        for index, key, value in (
+            (self._regions_by_cultivar, cultivar_id, region_id),
+            (self._cultivars_by_region, region_id, cultivar_id),
+        ):
+            index[key].remove(value)
+            if not index[key]:
+                del index[key]
+        self._touch()
+
+    def remove_cultivar(self, cultivar_id: str) -> None:
+        """Remove a cultivar and its regional data (no-op if absent)."""
+        if self._pending:
+            self.load_partitions()
+        for region_id in list(self._regions_by_cultivar.get(cultivar_id, ())):
+            self.remove_regional_data(cultivar_id, region_id)
+        cultivar = self._cultivars.pop(cultivar_id, None)
+        if cultivar is None:
+            return
+        for name, keys_of in _CULTIVAR_INDEXES.items():
+            index = getattr(self, name)
+            for key in keys_of(cultivar):
+                index[key].remove(cultivar_id)
+                if not index[key]:
+                    del index[key]
+        self._touch()
 
     def get_cultivar(self, cultivar_id: str) -> Optional[CultivarResearch]:
         """Get cultivar research data."""
-        return self.cultivars.get(cultivar_id)
+        self._load_until("cultivars", "_cultivars", cultivar_id)
+        return self._cultivars.get(cultivar_id)
 
     def get_regional_data(
         self,
@@ -215,21 +496,111 @@ class CultivarDatabase:
     ) -> Optional[RegionalBloomData]:
         """Get regional bloom/harvest data for a cultivar."""
         key = f"{cultivar_id}:{region_id}"
-        return self.regional_data.get(key)
+        self._load_until("regional_data", "_regional_data", key)
+        return self._regional_data.get(key)
+
+    def get_rootstock(self, rootstock_id: str) -> Optional[RootstockResearch]:
+        """Get rootstock research data."""
+        self._load_until("rootstocks", "_rootstocks", rootstock_id)
+        return self._rootstocks.get(rootstock_id)
+
+    def get_regions_for_cultivar(self, cultivar_id: str) -> list[str]:
+        """Get region IDs that have regional data for a cultivar."""
+        if self._pending:
+            self.load_partitions("regional_data")
+        return list(self._regions_by_cultivar.get(cultivar_id, ()))
+
+    def get_cultivars_for_region(self, region_id: str) -> list[str]:
+        """Get cultivar IDs that have regional data for a region."""
+        if self._pending:
+            self.load_partitions("regional_data")
+        return list(self._cultivars_by_region.get(region_id, ()))
+
+    def get_cultivars_by_crop_type(self, crop_type: str) -> list[CultivarResearch]:
+        """Get all cultivars of a crop type."""
+        if self._pending:
+            self.load_partitions("cultivars", crop_type)
+        cultivars = self._cultivars
+        return [cultivars[cid] for cid in self._cultivars_by_crop_type.get(crop_type, ())]
+
+    def _indexed_cultivars(self, index: str, key: str, crop_type: Optional[str]) -> list[CultivarResearch]:
+        if self._pending:
+            self.load_partitions("cultivars", crop_type)
+        cultivars = self._cultivars
+        return [cultivars[cid] for cid in getattr(self, index).get(key, ())]
+
+    def get_cultivars_by_quality_tier(self, crop_type: str, quality_tier: QualityTier) -> list[CultivarResearch]:
+        """Get cultivars of a crop type in one quality tier."""
+        return self._indexed_cultivars(
+            "_cultivars_by_quality_tier", f"{crop_type}:{quality_tier.value}", crop_type
+        )
 
     def get_premium_cultivars(self, crop_type: str) -> list[CultivarResearch]:
         """Get cultivars with premium quality genetics."""
-        return [
-            c for c in self.cultivars.values()
-            if c.crop_type == crop_type and c.quality_tier == QualityTier.PREMIUM
-        ]
+        return self.get_cultivars_by_quality_tier(crop_type, QualityTier.PREMIUM)
 
     def get_heritage_cultivars(self, crop_type: str) -> list[CultivarResearch]:
         """Get heritage/heirloom cultivars."""
-        return [
-            c for c in self.cultivars.values()
-            if c.crop_type == crop_type and (c.is_heritage or c.is_heirloom)
-        ]
+        return self._indexed_cultivars("_heritage_cultivars_by_crop_type", crop_type, crop_type)
+
+    def get_cultivars_by_timing_class(self, crop_type: str, timing_class: str) -> list[CultivarResearch]:
+        """Get cultivars of a crop type by harvest timing ("early", "mid", "late")."""
+        return self._indexed_cultivars(
+            "_cultivars_by_timing_class", f"{crop_type}:{timing_class}", crop_type
+        )
+
+    def get_cultivars_for_usda_zone(self, zone: str) -> list[CultivarResearch]:
+        """Get cultivars with a USDA zone (e.g. "9b") among their optimal zones."""
+        return self._indexed_cultivars("_cultivars_by_usda_zone", zone, None)
+
+    def get_rootstocks(self, crop_type: Optional[str] = None) -> list[RootstockResearch]:
+        """Get rootstocks (compatible with crop_type, if given), highest brix_modifier first."""
+        if self._pending:
+            self.load_partitions("rootstocks", crop_type)
+        rootstocks = self._rootstocks
+        if crop_type is None:
+            ids = self._rootstocks_by_brix.get("", ())
+        else:
+            ids = self._rootstocks_by_crop_type.get(crop_type, ())
+        return [rootstocks[rid] for rid in ids]
+
+    # =========================================================================
+    # VERSIONS
+    # =========================================================================
+
+    def crop_version(self, crop_type: Optional[str] = None) -> int:
+        """
+        Version of one crop's records (of the whole database without crop_type).
+
+        Equals version unless a reload found the crop unchanged and kept its
+        previous version, so caches keyed on it stay warm.
+        """
+        if crop_type is None:
+            return self.version
+        return self.crop_versions.get(crop_type, self.version)
+
+    def crop_fingerprints(self) -> dict[str, str]:
+        """Digest of each crop's cultivars (with their regions), regional data and rootstocks."""
+        digests = {}
+
+        def digest(crop_type: str):
+            return digests.setdefault(crop_type, hashlib.blake2b(digest_size=16))
+
+        cultivars = self.cultivars
+        for cultivar in cultivars.values():
+            h = digest(cultivar.crop_type)
+            h.update(repr(cultivar).encode("utf-8"))
+            h.update(repr(self.get_regions_for_cultivar(cultivar.cultivar_id)).encode("utf-8"))
+        for regional in self.regional_data.values():
+            cultivar = cultivars.get(regional.cultivar_id)
+            if cultivar is not None:
+                digest(cultivar.crop_type).update(repr(regional).encode("utf-8"))
+        rootstock_crops = dict.fromkeys(ct for rs in self.rootstocks.values() for ct in rs.crop_types)
+        for crop_type in rootstock_crops:
+            h = digest(crop_type)
+            for rootstock in self.get_rootstocks(crop_type):
+                h.update(repr(rootstock).encode("utf-8"))
+        return {crop_type: h.hexdigest() for crop_type, h in digests.items()}
 
     def predict_harvest_window(
         self,
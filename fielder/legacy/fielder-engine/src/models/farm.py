@@ -11,6 +11,7 @@ from typing import Optional
 from enum import Enum
 
 from .region import Location
+from .tree_age import age_brix_modifier
 
 
 class FarmStatus(Enum):
@@ -112,24 +113,7 @@ class FarmCrop:
         - 19-25 yrs: -0.2
         - >25 yrs: -0.3
         """
-        # Age modifier
-        age_mod = 0.0
-        if self.tree_age_years is not None:
-            age = self.tree_age_years
-            if age <= 2:
-                age_mod = -0.8
-            elif age <= 4:
-                age_mod = -0.5
-            elif age <= 7:
-                age_mod = -0.2
-            elif age <= 18:
-                age_mod = 0.0  # Prime
-            elif age <= 25:
-                age_mod = -0.2
-            else:
-                age_mod = -0.3
-
-        return cultivar_base_brix + rootstock_modifier + age_mod
+        return cultivar_base_brix + rootstock_modifier + age_brix_modifier(self.tree_age_years)
 
 
 @dataclass
@@ -0,0 +1,274 @@
+"""
+Shared Cultivar Database - A packed, read-only image for multi-worker deployments.
+
+Under gunicorn every worker used to run DataLoader.load_all() and keep its
+own object graph of every CultivarResearch, RegionalBloomData and
+RootstockResearch. Even when the master loads once before forking
+(--preload), reading Python objects bumps their refcounts, which writes to
+their pages and slowly un-shares them in every worker.
+
+Instead the master packs the database into one flat byte image - placed
+in an anonymous shared mapping before fork, or in a file that workers
+mmap - and workers read it through SharedCultivarDatabase:
+
+- Lookups binary-search a sorted key table inside the image
+- Records are decoded on access into short-lived, per-request objects
+- No long-lived Python object per record exists, so nothing in the image
+  is ever refcount-touched and its pages stay shared
+
+Image layout (little-endian):
+
+    header   magic(8) | version u64 | last_modified f64 | section count u32
+    sections (count, entries offset, order offset) per section, u64 each
+    entries  per record: key offset, key length, value offset, value length (u32)
+             stored in original insertion order
+    order    u32 entry indexes sorted by key, for binary search
+    blobs    UTF-8 keys and pickled record field tuples
+
+Reads trade a dict lookup for a binary search plus a small unpickle; use
+the regular CultivarDatabase where per-process copies are fine.
+"""
+
+import mmap
+import pickle
+import struct
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional, Union
+
+from .cultivar_database import (
+    INDEX_NAMES,
+    CultivarDatabase,
+    CultivarResearch,
+    RegionalBloomData,
+    RootstockResearch,
+)
+
+
+IMAGE_MAGIC = b"FCDBIMG1"
+
+_HEADER = struct.Struct("<8sQdI")
+_SECTION = struct.Struct("<QQQ")
+_ENTRY = struct.Struct("<IIII")
+_ORDER = struct.Struct("<I")
+
+# Section order in the image
+_SECTIONS = ("cultivars", "regional_data", "rootstocks", *INDEX_NAMES)
+
+_RECORD_TYPES = {
+    "cultivars": CultivarResearch,
+    "regional_data": RegionalBloomData,
+    "rootstocks": RootstockResearch,
+}
+
+
+def _record_values(record, record_type) -> tuple:
+    """Field values in declaration order (shallow, unlike dataclasses.astuple)."""
+    if not isinstance(record, record_type):
+        record = record.to_record()  # Compact records (see compact_cultivar_database)
+    return tuple(getattr(record, f.name) for f in fields(record_type))
+
+
+def pack_database(db: CultivarDatabase) -> bytes:
+    """Pack a CultivarDatabase into a shareable image."""
+    db.load_partitions()
+    sections = []
+    for name in _SECTIONS:
+        mapping = getattr(db, name)
+        record_type = _RECORD_TYPES.get(name)
+        items = [
+            (
+                key.encode("utf-8"),
+                pickle.dumps(
+                    _record_values(value, record_type) if record_type else list(value),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                ),
+            )
+            for key, value in mapping.items()
+        ]
+        sections.append(items)
+
+    tables_start = _HEADER.size + _SECTION.size * len(sections)
+    tables_size = sum(
+        len(items) * (_ENTRY.size + _ORDER.size) for items in sections
+    )
+    blob_offset = tables_start + tables_size
+
+    header = _HEADER.pack(
+        IMAGE_MAGIC, db.version, db.last_modified.timestamp(), len(sections)
+    )
+    section_table = bytearray()
+    tables = bytearray()
+    blobs = bytearray()
+
+    for items in sections:
+        entries_offset = tables_start + len(tables)
+        for key, value in items:
+            key_offset = blob_offset + len(blobs)
+            blobs += key
+            value_offset = blob_offset + len(blobs)
+            blobs += value
+            tables += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+
+        order_offset = tables_start + len(tables)
+        for index in sorted(range(len(items)), key=lambda i: items[i][0]):
+            tables += _ORDER.pack(index)
+
+        section_table += _SECTION.pack(len(items), entries_offset, order_offset)
+
+    return header + bytes(section_table) + bytes(tables) + bytes(blobs)
+
+
+def write_image(db: CultivarDatabase, path: str) -> int:
+    """Write a packed image to path. Returns its size in bytes."""
+    image = pack_database(db)
+    with open(path, "wb") as f:
+        f.write(image)
+    return len(image)
+
+
+class _PackedSection(Mapping):
+    """Read-only mapping over one section of an image."""
+
+    def __init__(self, buffer, count: int, entries_offset: int, order_offset: int, decode: Callable):
+        self._buffer = buffer
+        self._count = count
+        self._entries_offset = entries_offset
+        self._order_offset = order_offset
+        self._decode = decode
+
+    def _entry(self, index: int) -> tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(self._buffer, self._entries_offset + index * _ENTRY.size)
+
+    def _key_bytes(self, index: int) -> bytes:
+        key_offset, key_length, _, _ = self._entry(index)
+        # bytes() so memoryview buffers (e.g. SharedMemory.buf) compare and decode too
+        return bytes(self._buffer[key_offset:key_offset + key_length])
+
+    def _value(self, index: int):
+        _, _, value_offset, value_length = self._entry(index)
+        return self._decode(pickle.loads(self._buffer[value_offset:value_offset + value_length]))
+
+    def _find(self, key) -> Optional[int]:
+        if not isinstance(key, str):
+            return None
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            (index,) = _ORDER.unpack_from(self._buffer, self._order_offset + mid * _ORDER.size)
+            probe = self._key_bytes(index)
+            if probe == target:
+                return index
+            if probe < target:
+                low = mid + 1
+            else:
+                high = mid
+        return None
+
+    def __getitem__(self, key):
+        index = self._find(key)
+        if index is None:
+            raise KeyError(key)
+        return self._value(index)
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key_bytes(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def values(self) -> "_SectionView":
+        """Records in insertion order, decoded one at a time as iterated."""
+        return _SectionView(self, self._value)
+
+    def items(self) -> "_SectionView":
+        return _SectionView(
+            self, lambda index: (self._key_bytes(index).decode("utf-8"), self._value(index))
+        )
+
+
+class _SectionView:
+    """Re-iterable, lazily decoded view (keeps only one record alive at a time)."""
+
+    def __init__(self, section: _PackedSection, read: Callable[[int], object]):
+        self._section = section
+        self._read = read
+
+    def __iter__(self):
+        for index in range(len(self._section)):
+            yield self._read(index)
+
+    def __len__(self) -> int:
+        return len(self._section)
+
+
+class SharedCultivarDatabase(CultivarDatabase):
+    """
+    Read-only CultivarDatabase backed by a packed image.
+
+    Supports the full read API of CultivarDatabase (the cultivars,
+    regional_data and rootstocks attributes are read-only mappings).
+    The add_* and remove_* methods raise TypeError.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap, memoryview]):
+        magic, version, last_modified, section_count = _HEADER.unpack_from(buffer, 0)
+        if magic != IMAGE_MAGIC:
+            raise ValueError("Not a cultivar database image")
+        if section_count != len(_SECTIONS):
+            raise ValueError(f"Unsupported image: {section_count} sections")
+
+        self._buffer = buffer
+        self.version = version
+        self.last_modified = datetime.fromtimestamp(last_modified, timezone.utc)
+        self.crop_versions = {}
+
+        for i, name in enumerate(_SECTIONS):
+            count, entries_offset, order_offset = _SECTION.unpack_from(
+                buffer, _HEADER.size + i * _SECTION.size
+            )
+            record_type = _RECORD_TYPES.get(name)
+            decode = (lambda values, cls=record_type: cls(*values)) if record_type else list
+            setattr(self, name, _PackedSection(buffer, count, entries_offset, order_offset, decode))
+
+    @classmethod
+    def from_database(cls, db: CultivarDatabase, shared: bool = True) -> "SharedCultivarDatabase":
+        """
+        Pack db into memory.
+
+        With shared=True the image lives in an anonymous shared mapping, so
+        processes forked afterwards read the same physical pages.
+        """
+        image = pack_database(db)
+        if not shared:
+            return cls(image)
+        buffer = mmap.mmap(-1, len(image))
+        buffer.write(image)
+        return cls(buffer)
+
+    @classmethod
+    def open(cls, path: str) -> "SharedCultivarDatabase":
+        """Memory-map an image written by write_image()."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    @property
+    def image_size(self) -> int:
+        """Bytes in the underlying image."""
+        return len(self._buffer)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("SharedCultivarDatabase is read-only")
+
+    add_cultivar = _read_only
+    add_regional_data = _read_only
+    add_rootstock = _read_only
+    remove_cultivar = _read_only
+    remove_regional_data = _read_only
@@ -0,0 +1,58 @@
+"""
+Tree Age - The Brix modifier ladder for tree crops.
+
+Trees shift from vegetative to reproductive energy allocation as they
+mature, and decline again with age:
+
+- 0-2 yrs: -0.8 (vegetative phase)
+- 3-4 yrs: -0.5 (transition)
+- 5-7 yrs: -0.2 (canopy completion)
+- 8-18 yrs: 0.0 (prime - genetic potential realized)
+- 19-25 yrs: -0.2
+- >25 yrs: -0.3
+
+Every Brix prediction (cultivar predictor, HarvestPredictor, FarmCrop,
+the planning grid) reads the ladder from here.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TreeAgeBucket:
+    """A range of tree ages sharing one Brix modifier."""
+    label: str
+    min_age: int
+    max_age: Optional[int]  # None for the open-ended oldest bucket
+    brix_modifier: float
+
+
+TREE_AGE_BUCKETS = (
+    TreeAgeBucket("0-2", 0, 2, -0.8),
+    TreeAgeBucket("3-4", 3, 4, -0.5),
+    TreeAgeBucket("5-7", 5, 7, -0.2),
+    TreeAgeBucket("8-18", 8, 18, 0.0),
+    TreeAgeBucket("19-25", 19, 25, -0.2),
+    TreeAgeBucket("26+", 26, None, -0.3),
+)
+
+_MAX_AGES = [bucket.max_age for bucket in TREE_AGE_BUCKETS[:-1]]
+
+
+def tree_age_bucket(tree_age) -> Optional[int]:
+    """Index into TREE_AGE_BUCKETS for an age in years (None when unknown or invalid)."""
+    if tree_age is None:
+        return None
+    try:
+        age = int(tree_age)
+    except (ValueError, TypeError):
+        return None
+    return bisect_left(_MAX_AGES, age)
+
+
+def age_brix_modifier(tree_age) -> float:
+    """Brix modifier for a tree age (0.0 when unknown: assume prime)."""
+    bucket = tree_age_bucket(tree_age)
+    return 0.0 if bucket is None else TREE_AGE_BUCKETS[bucket].brix_modifier
@@ -1,22 +1,47 @@
-"""Services for Fielder business logic."""
-
-from .harvest_predictor import HarvestPredictor
-from .crop_engine import CropPossibilityEngine
-from .geo_search import GeoSearchService
-from .weather_service import WeatherService
-from .quality_predictor import QualityPredictor
-from .data_loader import DataLoader
-from .feedback_loop import FeedbackCollector, PredictionCalibrator
-from .discovery import DiscoveryService
-
-__all__ = [
-    "HarvestPredictor",
-    "CropPossibilityEngine",
-    "GeoSearchService",
-    "WeatherService",
-    "QualityPredictor",
-    "DataLoader",
-    "FeedbackCollector",
-    "PredictionCalibrator",
-    "DiscoveryService",
-]
+"""
+Services for Fielder business logic.
+
+Names are imported from their submodules on first access, so importing
+one service (fielder.services.quality_predictor) or the package doesn't
+pull in the others - the weather client's HTTP stack, the data loader,
+the batch evaluator's process pool. check_import_time.py holds the
+startup budget.
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "HarvestPredictor": ".harvest_predictor",
+    "CropPossibilityEngine": ".crop_engine",
+    "GeoSearchService": ".geo_search",
+    "WeatherService": ".weather_service",
+    "QualityPredictor": ".quality_predictor",
+    "DataLoader": ".data_loader",
+    "FeedbackCollector": ".feedback_loop",
+    "PredictionCalibrator": ".feedback_loop",
+    "DiscoveryService": ".discovery",
+    "CultivarPredictor": ".cultivar_predictor",
+    "PredictionExporter": ".prediction_export",
+    "AppServices": ".app_services",
+    "BatchEvaluator": ".batch_evaluator",
+    "HarvestCalendar": ".harvest_calendar",
+    "BrixPlanningGrid": ".brix_planning",
+    "CultivarSearchIndex": ".cultivar_search",
+    "ResearchImporter": ".research_importer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,475 @@
+"""
+Application Services - Shared, pre-warmed service instances.
+
+Request handlers used to construct a WeatherService (and with it a fresh
+OpenMeteoProvider whose climatology cache died with the request) and a
+QualityPredictor with ten model objects on every call, and the cultivar
+database was loaded by whichever request happened to need it first.
+
+AppServices owns one instance of each per process. warm_up() builds them
+all up front and marks the container ready, so the first request costs
+the same as every other one; anything not yet built when it is asked for
+(warm-up disabled, or a request racing it) is built on demand.
+
+Thread safety: the instances are shared by every request thread. They
+keep no per-request state; the climatology cache is only written with
+single dict assignments (two threads missing the same month both compute
+the same result). Construction is serialized by a lock so each service is
+built exactly once.
+
+With shared_cultivar_db=True the loaded database is packed into a
+SharedCultivarDatabase image in shared memory, so workers forked after
+warm-up (gunicorn --preload) share one copy.
+
+With catalog_snapshot set, the database comes from that snapshot file
+when it matches the current sources (see catalog_snapshot), skipping
+DataLoader entirely.
+
+With lazy_catalog=True (and no snapshot) DataLoader only registers its
+per-crop partitions, and each crop is built the first time a request
+looks it up - an instance serving a few crops never builds the rest.
+Lookups are routed by the partition manifest at catalog_manifest (written
+by build_catalog_snapshot.py); without a current one the whole catalog is
+loaded up front. Not combined with shared_cultivar_db, which needs the
+whole catalog before workers fork.
+
+With compact_catalog=True a regular (not shared) database stores its
+records in the slotted, interned form of CompactCultivarDatabase.
+
+reload_cultivar_database() replaces the database without a restart: a new
+version is built the same way, validated, then swapped in with a single
+assignment while the old one keeps serving; requests already holding it
+finish on it. Crops whose records did not change keep their crop_version,
+so catalog caches keyed on it stay warm. With catalog_reload_seconds set,
+reload_if_stale() starts a background reload whenever the snapshot file
+changes (a rebuilt snapshot goes live without a deploy).
+
+With research_dir set, every build also imports the research JSON files
+there (see research_importer; lazy_catalog is ignored, since the import
+needs every record). import_research() applies only what changed in those
+files since the database in service was built, to a copy that is swapped
+in the same way; reload_if_stale() starts one when a file changes.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Callable, Optional
+
+from . import metrics
+from .cultivar_predictor import CultivarPredictor
+from .catalog_snapshot import materialize, open_manifest, open_snapshot
+from .brix_planning import BrixPlanningGrid
+from .cultivar_search import CultivarSearchIndex
+from .harvest_calendar import HarvestCalendar
+from .data_loader import DataLoader
+from .research_importer import ResearchImporter
+from .quality_predictor import QualityPredictor
+from .weather_service import WeatherProvider, WeatherService
+from ..models.compact_cultivar_database import CompactCultivarDatabase
+from ..models.cultivar_database import CultivarDatabase
+from ..models.shared_cultivar_database import SharedCultivarDatabase
+from ..models.region import US_GROWING_REGIONS
+
+logger = logging.getLogger(__name__)
+
+HARVEST_CALENDAR_YEARS = 4  # Calendars kept per database version (oldest-built dropped first)
+
+
+class CatalogRejected(Exception):
+    """Raised when a reloaded catalog fails validation; the current version stays in service."""
+
+    def __init__(self, problems: list[str]):
+        super().__init__(f"Catalog rejected: {'; '.join(problems[:5])}")
+        self.problems = problems
+
+
+def catalog_problems(db: CultivarDatabase) -> list[str]:
+    """Reasons a loaded catalog is unfit to serve (empty when it is fine)."""
+    problems = []
+    if not db.cultivars:
+        problems.append("no cultivars")
+    for cultivar in db.cultivars.values():
+        if not cultivar.crop_type:
+            problems.append(f"cultivar {cultivar.cultivar_id} has no crop type")
+        if cultivar.research_peak_brix is not None and cultivar.research_peak_brix <= 0:
+            problems.append(f"cultivar {cultivar.cultivar_id} has peak Brix {cultivar.research_peak_brix}")
+    for key, regional in db.regional_data.items():
+        if regional.cultivar_id not in db.cultivars:
+            problems.append(f"regional data {key} names unknown cultivar {regional.cultivar_id}")
+    for rootstock in db.rootstocks.values():
+        if not rootstock.crop_types:
+            problems.append(f"rootstock {rootstock.rootstock_id} has no crop types")
+    return problems
+
+
+class AppServices:
+    """Process-wide container for the services request handlers share."""
+
+    def __init__(
+        self,
+        weather_provider: Optional[WeatherProvider] = None,
+        shared_cultivar_db: bool = False,
+        catalog_snapshot: Optional[str] = None,
+        lazy_catalog: bool = False,
+        catalog_manifest: Optional[str] = None,
+        compact_catalog: bool = False,
+        catalog_reload_seconds: Optional[float] = None,
+        research_dir: Optional[str] = None
+    ):
+        self._weather_provider = weather_provider
+        self._shared_cultivar_db = shared_cultivar_db
+        self._catalog_snapshot = catalog_snapshot
+        self._lazy_catalog = lazy_catalog and not shared_cultivar_db and not research_dir
+        self._catalog_manifest = catalog_manifest
+        self._compact_catalog = compact_catalog and not shared_cultivar_db
+        self._catalog_reload_seconds = catalog_reload_seconds
+        self._research_importer = ResearchImporter(research_dir) if research_dir else None
+        self.cultivar_db_source: Optional[str] = None
+        self._instances: dict[str, object] = {}
+        self._lock = threading.RLock()
+
+        # Reloads and imports run one at a time; file mtimes tell when to run one
+        self._reload_lock = threading.Lock()
+        self._snapshot_mtime: Optional[float] = None
+        self._research_mtime: Optional[float] = None
+        self._next_snapshot_check = 0.0
+        self.reload_error: Optional[str] = None
+        self.research_import_errors: dict[str, str] = {}
+
+        self.ready = False
+        self.warmup_seconds: Optional[float] = None
+        self.warmup_error: Optional[str] = None
+
+    def _get(self, name: str, build: Callable[[], object]):
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = build()
+                    self._instances[name] = instance
+        return instance
+
+    @property
+    def weather_service(self) -> WeatherService:
+        return self._get("weather_service", lambda: WeatherService(self._weather_provider))
+
+    @property
+    def quality_predictor(self) -> QualityPredictor:
+        return self._get("quality_predictor", QualityPredictor)
+
+    @property
+    def cultivar_database(self) -> CultivarDatabase:
+        return self._get("cultivar_database", self._load_cultivar_database)
+
+    @property
+    def cultivar_search(self) -> CultivarSearchIndex:
+        """Search index over the cultivar database, rebuilt when its version changes."""
+        db = self.cultivar_database
+        index = self._instances.get("cultivar_search")
+        if index is None or index.version != db.version:
+            index = CultivarSearchIndex.build(db)
+            self._instances["cultivar_search"] = index
+        return index
+
+    @property
+    def brix_planning(self) -> BrixPlanningGrid:
+        """Cultivar x rootstock x tree age Brix grid, rebuilt when the database version changes."""
+        db = self.cultivar_database
+        grid = self._instances.get("brix_planning")
+        if grid is None or grid.version != db.version:
+            grid = BrixPlanningGrid.build(db)
+            self._instances["brix_planning"] = grid
+        return grid
+
+    def harvest_calendar(self, year: int) -> HarvestCalendar:
+        """
+        Harvest calendar for year and the year before (whose windows can run
+        into it). Calendars are cached by (database version, year), keeping
+        the HARVEST_CALENDAR_YEARS most recently built, so requests for
+        different years don't rebuild each other's.
+        """
+        db = self.cultivar_database
+        key = (db.version, year)
+        calendars = self._get("harvest_calendars", dict)
+        calendar = calendars.get(key)
+        if calendar is None:
+            calendar = HarvestCalendar.build(db, [year - 1, year])
+            with self._lock:
+                for stale in [k for k in calendars if k[0] != db.version]:
+                    del calendars[stale]
+                calendars[key] = calendar
+                while len(calendars) > HARVEST_CALENDAR_YEARS:
+                    del calendars[next(iter(calendars))]
+        return calendar
+
+    @property
+    def cultivar_predictor(self) -> CultivarPredictor:
+        return self._get(
+            "cultivar_predictor",
+            lambda: CultivarPredictor(self.weather_service, self.quality_predictor)
+        )
+
+    def _load_cultivar_database(self) -> CultivarDatabase:
+        started = time.perf_counter()
+        self._snapshot_mtime = self._snapshot_file_mtime()
+        self._research_mtime = self._research_files_mtime()
+        db, self.cultivar_db_source = self._build_cultivar_database()
+        self._record_cultivar_db_metrics(db, time.perf_counter() - started)
+        return db
+
+    def _build_cultivar_database(self) -> tuple[CultivarDatabase, str]:
+        """A freshly built database and where it came from."""
+        importer = self._research_importer
+        db = open_snapshot(self._catalog_snapshot) if self._catalog_snapshot else None
+        if db is not None:
+            source = "snapshot"
+            if self._compact_catalog:
+                db = CompactCultivarDatabase.from_database(db)
+            elif not self._shared_cultivar_db or importer is not None:
+                db = materialize(db)  # Otherwise the mapped snapshot is already shareable
+        else:
+            source = "loader"
+            db = CompactCultivarDatabase() if self._compact_catalog else CultivarDatabase()
+            manifest = open_manifest(self._catalog_manifest) if self._lazy_catalog and self._catalog_manifest else None
+            if manifest is not None:
+                DataLoader(db).register_partitions(manifest)
+                return db, "lazy"
+            if self._lazy_catalog:
+                logger.warning("No current catalog manifest at %s; loading the whole catalog", self._catalog_manifest)
+            DataLoader(db).load_all()
+
+        if importer is not None:
+            self.research_import_errors = importer.apply(db).errors
+        if self._shared_cultivar_db and not isinstance(db, SharedCultivarDatabase):
+            db = SharedCultivarDatabase.from_database(db)
+        return db, source
+
+    def _record_cultivar_db_metrics(self, db: CultivarDatabase, seconds: float) -> None:
+        if self._shared_cultivar_db:
+            metrics.CULTIVAR_DB_IMAGE_BYTES.set(db.image_size)
+
+        metrics.CULTIVAR_DB_LOAD_SECONDS.set(seconds)
+        metrics.CULTIVAR_DB_VERSION.set(db.version)
+        if db.pending_partitions:
+            return  # Counting records would load every partition
+        metrics.CULTIVAR_DB_RECORDS.set(len(db.cultivars), kind="cultivars")
+        metrics.CULTIVAR_DB_RECORDS.set(len(db.regional_data), kind="regional_data")
+        metrics.CULTIVAR_DB_RECORDS.set(len(db.rootstocks), kind="rootstocks")
+
+    def _research_files_mtime(self) -> Optional[float]:
+        if self._research_importer is None:
+            return None
+        mtimes = []
+        for path in self._research_importer.source_paths():
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                pass
+        return max(mtimes, default=None)
+
+    def _snapshot_file_mtime(self) -> Optional[float]:
+        if not self._catalog_snapshot:
+            return None
+        try:
+            return os.stat(self._catalog_snapshot).st_mtime
+        except OSError:
+            return None
+
+    # =========================================================================
+    # RELOAD
+    # =========================================================================
+
+    def reload_cultivar_database(self) -> dict:
+        """
+        Build, validate and swap in a new version of the cultivar database.
+
+        The new version is loaded completely (lazy partitions included) so
+        validation sees every record. It is only swapped in when some crop's
+        records changed; its version is above the current one and unchanged
+        crops keep their crop_version. Returns a summary of the reload.
+
+        Raises CatalogRejected (the current version keeps serving) when the
+        new catalog fails catalog_problems().
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            current = self.cultivar_database
+            # Even a rejected file is not retried until it changes again
+            self._snapshot_mtime = self._snapshot_file_mtime()
+            self._research_mtime = self._research_files_mtime()
+            try:
+                db, source = self._build_cultivar_database()
+                db.load_partitions()
+            except Exception as e:
+                self.reload_error = str(e)
+                metrics.CULTIVAR_DB_RELOADS.inc(outcome="failed")
+                raise
+            return self._swap_in(current, db, source, started, metrics.CULTIVAR_DB_RELOADS)
+
+    def import_research(self) -> dict:
+        """
+        Apply what changed in the research files since the last import.
+
+        Only records whose content hash differs are applied, to a copy of
+        the database in service, which then goes through the same
+        validation and swap as a reload. Returns the import summary (see
+        ImportDiff.summary) with the swap result.
+
+        Raises CatalogRejected when the result fails catalog_problems().
+        """
+        if self._research_importer is None:
+            raise RuntimeError("No research directory configured")
+        with self._reload_lock:
+            started = time.perf_counter()
+            current = self.cultivar_database
+            self._research_mtime = self._research_files_mtime()
+            try:
+                diff = self._research_importer.diff(current)
+                self.research_import_errors = diff.errors
+                if not diff.changes:
+                    metrics.CULTIVAR_DB_IMPORTS.inc(outcome="unchanged")
+                    return {"swapped": False, "version": current.version, "changed_crops": [], **diff.summary()}
+                if self._compact_catalog:
+                    db = CompactCultivarDatabase.from_database(current)
+                else:
+                    db = materialize(current)
+                diff.apply(db)
+                if self._shared_cultivar_db:
+                    db = SharedCultivarDatabase.from_database(db)
+            except Exception as e:
+                self.reload_error = str(e)
+                metrics.CULTIVAR_DB_IMPORTS.inc(outcome="failed")
+                raise
+            result = self._swap_in(current, db, self.cultivar_db_source, started, metrics.CULTIVAR_DB_IMPORTS)
+            return {**result, **diff.summary()}
+
+    def _swap_in(self, current: CultivarDatabase, db: CultivarDatabase, source: str, started: float, outcomes) -> dict:
+        """Validate db and make it the database in service if any crop changed (reload lock held)."""
+        problems = catalog_problems(db)
+        if problems:
+            error = CatalogRejected(problems)
+            self.reload_error = str(error)
+            outcomes.inc(outcome="rejected")
+            raise error
+
+        self.reload_error = None
+        previous = current.crop_fingerprints()
+        fingerprints = db.crop_fingerprints()
+        changed = sorted(
+            crop_type for crop_type in previous.keys() | fingerprints.keys()
+            if previous.get(crop_type) != fingerprints.get(crop_type)
+        )
+        if not changed:
+            outcomes.inc(outcome="unchanged")
+            return {"swapped": False, "version": current.version, "source": source, "changed_crops": []}
+
+        db.version = max(db.version, current.version + 1)
+        db.last_modified = datetime.now(timezone.utc)
+        db.crop_versions = {
+            crop_type: db.version if crop_type in changed else current.crop_version(crop_type)
+            for crop_type in fingerprints
+        }
+
+        search = CultivarSearchIndex.build(db)
+
+        # Readers get the old or the new database, never a mix
+        self._instances["cultivar_database"] = db
+        self._instances["cultivar_search"] = search
+        self.cultivar_db_source = source
+        self._record_cultivar_db_metrics(db, time.perf_counter() - started)
+        outcomes.inc(outcome="swapped")
+        return {"swapped": True, "version": db.version, "source": source, "changed_crops": changed}
+
+    def reload_in_background(self) -> threading.Thread:
+        """Run reload_cultivar_database() on a daemon thread (errors land in reload_error)."""
+        return self._run_in_background(self.reload_cultivar_database, "catalog-reload")
+
+    def import_in_background(self) -> threading.Thread:
+        """Run import_research() on a daemon thread (errors land in reload_error)."""
+        return self._run_in_background(self.import_research, "research-import")
+
+    @staticmethod
+    def _run_in_background(work: Callable[[], object], name: str) -> threading.Thread:
+        def run():
+            try:
+                work()
+            except Exception:
+                pass  # Recorded in reload_error and the reload/import metrics
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def reload_if_stale(self) -> bool:
+        """
+        Start a background reload if the catalog snapshot file changed, or
+        a background import if a research file did.
+
+        Looks at the files at most every catalog_reload_seconds, so it is
+        cheap enough to call on every request. Returns True when a reload
+        or import was started.
+        """
+        if not self._catalog_reload_seconds or not (self._catalog_snapshot or self._research_importer):
+            return False
+        now = time.monotonic()
+        if now < self._next_snapshot_check:
+            return False
+        self._next_snapshot_check = now + self._catalog_reload_seconds
+        if self._reload_lock.locked():
+            return False
+        mtime = self._snapshot_file_mtime()
+        if mtime is not None and mtime != self._snapshot_mtime:
+            self.reload_in_background()  # Also re-imports the research files
+            return True
+        research_mtime = self._research_files_mtime()
+        if research_mtime is not None and research_mtime != self._research_mtime:
+            self.import_in_background()
+            return True
+        return False
+
+    def warm_up(self, climatology: bool = False) -> None:
+        """
+        Build every service and prime the caches requests rely on.
+
+        With climatology=True, also fetches this month's climatology for
+        every region (several upstream calls per region, so off by default).
+        Failures are recorded in warmup_error; the container still becomes
+        ready since every service can be built on demand.
+        """
+        started = time.perf_counter()
+        try:
+            db = self.cultivar_database
+            if not db.pending_partitions:  # Indexing would load every cultivar partition
+                self.cultivar_search
+                self.brix_planning
+            self.cultivar_predictor  # Also builds weather service + quality predictor
+
+            if climatology:
+                provider = self.weather_service.provider
+                month = date.today().month
+                for region_id in US_GROWING_REGIONS:
+                    provider.get_climatology(region_id, month)
+        except Exception as e:
+            self.warmup_error = str(e)
+
+        self.warmup_seconds = time.perf_counter() - started
+        self.ready = True
+
+    def status(self) -> dict:
+        """Readiness summary for health checks."""
+        db = self._instances.get("cultivar_database")
+        return {
+            "ready": self.ready,
+            "warmup_seconds": round(self.warmup_seconds, 3) if self.warmup_seconds is not None else None,
+            "warmup_error": self.warmup_error,
+            "cultivar_db_source": self.cultivar_db_source,
+            "cultivar_db_version": db.version if db is not None else None,
+            "cultivar_db_reload_error": self.reload_error,
+            "research_import_errors": self.research_import_errors,
+            "cultivar_db_pending_partitions": len(db.pending_partitions) if db is not None else None,
+            "services": sorted(self._instances),
+        }
@@ -0,0 +1,308 @@
+"""
+Batch Evaluator - Full-catalog predictions on observed weather, across processes.
+
+The nightly recompute evaluates every cultivar x region pair against real
+weather. Run serially (PredictionExporter) that is one upstream archive
+call per pair and a pure-Python GDD loop per pair on a single core.
+
+BatchEvaluator splits the work up:
+
+- Weather is fetched once per region in the parent, for the whole window
+  any regional-average prediction can look back over
+- Those observations are packed into one shared memory block as flat
+  float64 records (ordinal, high, low, precip); the cultivar database goes
+  into a second block as a packed image (see shared_cultivar_database)
+- Pairs are sharded by region (large regions split into several shards)
+  and evaluated by a ProcessPoolExecutor; workers attach to both blocks
+  instead of receiving pickled copies, so per-task IPC is just the keys
+- Each pair comes back as a compact EvaluationResult tuple rather than
+  the full prediction dict with its formatted strings
+
+Workers share nothing else, so throughput scales with worker count until
+the parent's weather fetch dominates.
+
+    evaluator = BatchEvaluator(db, weather_provider, max_workers=8)
+    results = evaluator.evaluate()
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+from ..models.cultivar_database import CultivarDatabase
+from ..models.region import US_GROWING_REGIONS
+from ..models.shared_cultivar_database import SharedCultivarDatabase, pack_database
+from .cultivar_predictor import HARVEST_STATUSES, CultivarPredictor
+from .quality_predictor import QualityPredictor
+from .weather_service import (
+    OpenMeteoProvider,
+    WeatherForecast,
+    WeatherObservation,
+    WeatherProvider,
+    WeatherService,
+)
+
+
+# Regional-average predictions look back at most ~15 months (bloom last year)
+WEATHER_HISTORY_DAYS = 450
+
+# Prediction fields workers need (everything else is skipped in the kernel)
+_RESULT_FIELDS = frozenset({"status", "progress", "current_gdd", "predicted_brix", "peak_brix", "data_source"})
+
+_RECORD = struct.Struct("<dddd")  # ordinal, temp_high, temp_low, precip_inches
+
+
+class EvaluationResult(NamedTuple):
+    """Compact per-pair result returned by workers."""
+    cultivar_id: str
+    region_id: str
+    status: int  # index into HARVEST_STATUSES
+    progress: float
+    current_gdd: float
+    predicted_brix: Optional[float]
+    peak_brix: Optional[float]
+    data_source: str
+
+    @property
+    def status_name(self) -> str:
+        return HARVEST_STATUSES[self.status]
+
+
+# =============================================================================
+# SHARED WEATHER
+# =============================================================================
+
+class SharedWeather:
+    """
+    Daily observations for many regions in one shared memory block.
+
+    Each region's observations are a contiguous, date-sorted run of
+    records; index maps region_id -> (first record, record count) and is
+    small enough to pass to workers directly.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, index: dict[str, tuple[int, int]]):
+        self.shm = shm
+        self.index = index
+        self._values = shm.buf.cast("d")
+
+    @classmethod
+    def create(cls, observations: dict[str, list[WeatherObservation]]) -> "SharedWeather":
+        """Pack observations into a new block (the caller must close() and unlink())."""
+        index = {}
+        total = 0
+        for region_id, region_obs in observations.items():
+            index[region_id] = (total, len(region_obs))
+            total += len(region_obs)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(total, 1) * _RECORD.size)
+        for region_id, region_obs in observations.items():
+            first, _ = index[region_id]
+            for i, obs in enumerate(sorted(region_obs, key=lambda o: o.date)):
+                _RECORD.pack_into(
+                    shm.buf, (first + i) * _RECORD.size,
+                    obs.date.toordinal(), obs.temp_high, obs.temp_low, obs.precip_inches
+                )
+        return cls(shm, index)
+
+    @classmethod
+    def attach(cls, name: str, index: dict[str, tuple[int, int]]) -> "SharedWeather":
+        return cls(shared_memory.SharedMemory(name=name), index)
+
+    def _ordinal(self, record: int) -> int:
+        return int(self._values[record * 4])
+
+    def _bisect(self, first: int, count: int, ordinal: int) -> int:
+        """First record in [first, first + count) dated on or after ordinal."""
+        low, high = first, first + count
+        while low < high:
+            mid = (low + high) // 2
+            if self._ordinal(mid) < ordinal:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def observations(self, region_id: str, start_date: date, end_date: date) -> list[WeatherObservation]:
+        """Observations for region_id between start_date and end_date inclusive."""
+        if region_id not in self.index:
+            return []
+        first, count = self.index[region_id]
+        start = self._bisect(first, count, start_date.toordinal())
+        end = self._bisect(first, count, end_date.toordinal() + 1)
+
+        values = self._values
+        return [
+            WeatherObservation(
+                date=date.fromordinal(int(values[i * 4])),
+                location_id=region_id,
+                temp_high=values[i * 4 + 1],
+                temp_low=values[i * 4 + 2],
+                precip_inches=values[i * 4 + 3],
+            )
+            for i in range(start, end)
+        ]
+
+    def close(self) -> None:
+        self._values.release()
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+
+class SharedWeatherProvider(WeatherProvider):
+    """
+    Serves historical weather from a SharedWeather block.
+
+    Forecasts are not available in batch runs; climatology falls back to
+    the built-in defaults, as it does when Open-Meteo is unreachable.
+    """
+
+    def __init__(self, weather: SharedWeather):
+        self.weather = weather
+        self._defaults = OpenMeteoProvider()
+
+    def get_historical(self, location_id: str, start_date: date, end_date: date) -> list[WeatherObservation]:
+        return self.weather.observations(location_id, start_date, end_date)
+
+    def get_forecast(self, location_id: str, days_ahead: int = 7) -> list[WeatherForecast]:
+        return []
+
+    def get_climatology(self, location_id: str, month: int) -> dict:
+        return self._defaults._get_default_climatology(location_id, month)
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+# Per-process state set up by _init_worker
+_worker: dict = {}
+
+
+def _init_worker(weather_name: str, weather_index: dict, db_name: str, db_size: int) -> None:
+    weather = SharedWeather.attach(weather_name, weather_index)
+    db_shm = shared_memory.SharedMemory(name=db_name)
+    _worker["blocks"] = (weather, db_shm)  # keep the mappings alive
+    _worker["db"] = SharedCultivarDatabase(db_shm.buf[:db_size])
+    _worker["predictor"] = CultivarPredictor(
+        WeatherService(SharedWeatherProvider(weather)), QualityPredictor()
+    )
+
+
+def evaluate_shard(
+    db: CultivarDatabase,
+    predictor: CultivarPredictor,
+    keys: list[str],
+    today: date
+) -> list[EvaluationResult]:
+    """Evaluate the regional-average prediction for each "cultivar_id:region_id" key."""
+    results = []
+    for key in keys:
+        regional = db.regional_data.get(key)
+        if regional is None:
+            continue
+        cultivar = db.get_cultivar(regional.cultivar_id)
+        region = US_GROWING_REGIONS.get(regional.region_id)
+        if cultivar is None or region is None:
+            continue
+
+        prediction = predictor.predict(cultivar, regional, region, today=today, fields=_RESULT_FIELDS)
+        results.append(EvaluationResult(
+            cultivar_id=regional.cultivar_id,
+            region_id=regional.region_id,
+            status=HARVEST_STATUSES.index(prediction["status"]),
+            progress=prediction["progress"],
+            current_gdd=prediction["current_gdd"],
+            predicted_brix=prediction["predicted_brix"],
+            peak_brix=prediction["peak_brix"],
+            data_source=prediction["data_source"],
+        ))
+    return results
+
+
+def _evaluate_in_worker(keys: list[str], today_ordinal: int) -> list[EvaluationResult]:
+    return evaluate_shard(
+        _worker["db"], _worker["predictor"], keys, date.fromordinal(today_ordinal)
+    )
+
+
+# =============================================================================
+# EVALUATOR
+# =============================================================================
+
+class BatchEvaluator:
+    """Evaluates every cultivar x region pair in a process pool."""
+
+    def __init__(
+        self,
+        database: CultivarDatabase,
+        weather_provider: Optional[WeatherProvider] = None,
+        max_workers: Optional[int] = None,
+        shard_size: int = 64
+    ):
+        self.db = database
+        self.provider = weather_provider or OpenMeteoProvider()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_size = max(1, shard_size)
+
+    def shards(self) -> list[list[str]]:
+        """regional_data keys grouped by region, split into at most shard_size keys each."""
+        by_region: dict[str, list[str]] = {}
+        for key, regional in self.db.regional_data.items():
+            by_region.setdefault(regional.region_id, []).append(key)
+
+        shards = []
+        for region_id in sorted(by_region):
+            keys = sorted(by_region[region_id])
+            for i in range(0, len(keys), self.shard_size):
+                shards.append(keys[i:i + self.shard_size])
+        return shards
+
+    def fetch_weather(self, region_ids, today: date) -> dict[str, list[WeatherObservation]]:
+        """One historical fetch per region covering WEATHER_HISTORY_DAYS up to today."""
+        start = today - timedelta(days=WEATHER_HISTORY_DAYS)
+        return {
+            region_id: self.provider.get_historical(region_id, start, today)
+            for region_id in region_ids
+            if region_id in US_GROWING_REGIONS
+        }
+
+    def evaluate(self, today: Optional[date] = None) -> list[EvaluationResult]:
+        """Evaluate the whole catalog; results are sorted by (cultivar_id, region_id)."""
+        if today is None:
+            today = date.today()
+        shards = self.shards()
+        if not shards:
+            return []
+
+        region_ids = sorted({self.db.regional_data[shard[0]].region_id for shard in shards})
+        weather = SharedWeather.create(self.fetch_weather(region_ids, today))
+        image = pack_database(self.db)
+        db_shm = shared_memory.SharedMemory(create=True, size=len(image))
+        try:
+            db_shm.buf[:len(image)] = image
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(shards)),
+                initializer=_init_worker,
+                initargs=(weather.shm.name, weather.index, db_shm.name, len(image)),
+            ) as pool:
+                results = [
+                    result
+                    for shard_results in pool.map(
+                        _evaluate_in_worker, shards, [today.toordinal()] * len(shards)
+                    )
+                    for result in shard_results
+                ]
+        finally:
+            weather.close()
+            weather.unlink()
+            db_shm.close()
+            db_shm.unlink()
+
+        results.sort(key=lambda r: (r.cultivar_id, r.region_id))
+        return results
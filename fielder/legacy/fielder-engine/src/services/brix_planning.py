@@ -0,0 +1,198 @@
+"""
+Brix Planning - Expected peak Brix for every cultivar x rootstock x tree age.
+
+Peak Brix = Cultivar Base + Rootstock Modifier + Age Modifier. The
+predictors apply that to one (cultivar, rootstock, age) per call; grower
+planning asks for all of them at once ("which rootstock, and what Brix
+while the block is young vs. in its prime?"), so BrixPlanningGrid
+precomputes, per crop type:
+
+- modifiers: rootstock x age bucket -> rootstock + age Brix modifier,
+  over the rootstocks compatible with the crop (own roots when none are)
+  and the TREE_AGE_BUCKETS ladder
+- expected: cultivar x rootstock x age bucket -> expected peak Brix (NaN
+  when the cultivar has no researched peak Brix)
+- best: cultivar x age bucket -> index of the rootstock with the highest
+  expected Brix
+
+The tensors are flat stdlib arrays in row-major order, built once per
+database version (AppServices rebuilds the grid when the version changes).
+
+    grid = BrixPlanningGrid.build(db)
+    grid.modifier("washington_navel", "sour_orange", tree_age=4)  # rootstock - 0.5
+    grid.best_rootstock("washington_navel", tree_age=10)          # "carrizo"
+    payload = grid.crop_grid("navel_orange")
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+from ..models.cultivar_database import CultivarDatabase
+from ..models.tree_age import TREE_AGE_BUCKETS, tree_age_bucket
+
+
+# Stand-in rootstock for crops without rootstock research (modifier 0.0)
+OWN_ROOTS = (None, "Own roots", 0.0)
+
+# Age bucket for an unknown tree age (the predictors assume prime)
+PRIME_BUCKET = next(i for i, bucket in enumerate(TREE_AGE_BUCKETS) if bucket.brix_modifier == 0.0)
+
+
+@dataclass
+class CropBrixGrid:
+    """Precomputed tensors for one crop type (see module docstring)."""
+    crop_type: str
+    cultivars: list[tuple[str, str, Optional[float]]]  # (id, name, research_peak_brix)
+    rootstocks: list[tuple[Optional[str], str, float]]  # (id, name, brix_modifier)
+    recommended: list[list[str]]  # recommended_rootstocks per cultivar
+    modifiers: array  # rootstock x age
+    expected: array  # cultivar x rootstock x age
+    best: array  # cultivar x age -> rootstock index
+
+
+def _build_crop(crop_type: str, cultivars: list, rootstocks: list) -> CropBrixGrid:
+    ages = len(TREE_AGE_BUCKETS)
+    rootstock_rows = [(rs.rootstock_id, rs.rootstock_name, rs.brix_modifier) for rs in rootstocks] or [OWN_ROOTS]
+
+    modifiers = array("d", (
+        rootstock_modifier + bucket.brix_modifier
+        for _, _, rootstock_modifier in rootstock_rows
+        for bucket in TREE_AGE_BUCKETS
+    ))
+
+    expected = array("d")
+    best = array("i")
+    for cultivar in cultivars:
+        base = cultivar.research_peak_brix
+        expected.extend(
+            base + modifier if base is not None else math.nan
+            for modifier in modifiers
+        )
+        # The highest modifier wins; same base, so also the highest Brix
+        for a in range(ages):
+            best.append(max(range(len(rootstock_rows)), key=lambda r: (modifiers[r * ages + a], -r)))
+
+    return CropBrixGrid(
+        crop_type=crop_type,
+        cultivars=[(c.cultivar_id, c.cultivar_name, c.research_peak_brix) for c in cultivars],
+        rootstocks=rootstock_rows,
+        recommended=[list(c.recommended_rootstocks) for c in cultivars],
+        modifiers=modifiers,
+        expected=expected,
+        best=best,
+    )
+
+
+def _round(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(value, 2)
+
+
+class BrixPlanningGrid:
+    """Brix modifier and expected peak Brix tensors for one database version."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self._crops: dict[str, CropBrixGrid] = {}
+        self._positions: dict[str, tuple[str, int]] = {}  # cultivar_id -> (crop_type, row)
+
+    @classmethod
+    def build(cls, db: CultivarDatabase) -> "BrixPlanningGrid":
+        """Grid for every crop type in db (loads any pending cultivar partitions)."""
+        grid = cls(db.version)
+        by_crop: dict[str, list] = {}
+        for cultivar in db.cultivars.values():
+            by_crop.setdefault(cultivar.crop_type, []).append(cultivar)
+        for crop_type, cultivars in by_crop.items():
+            crop = _build_crop(crop_type, cultivars, db.get_rootstocks(crop_type))
+            grid._crops[crop_type] = crop
+            for row, (cultivar_id, _, _) in enumerate(crop.cultivars):
+                grid._positions[cultivar_id] = (crop_type, row)
+        return grid
+
+    @property
+    def crop_types(self) -> list[str]:
+        return sorted(self._crops)
+
+    def __contains__(self, crop_type: str) -> bool:
+        return crop_type in self._crops
+
+    def _locate(self, cultivar_id: str, tree_age) -> Optional[tuple[CropBrixGrid, int, int]]:
+        position = self._positions.get(cultivar_id)
+        if position is None:
+            return None
+        bucket = tree_age_bucket(tree_age)
+        crop_type, row = position
+        return self._crops[crop_type], row, PRIME_BUCKET if bucket is None else bucket
+
+    def modifier(self, cultivar_id: str, rootstock_id: Optional[str], tree_age=None) -> Optional[float]:
+        """Rootstock + age Brix modifier (None for unknown or incompatible rootstocks)."""
+        located = self._locate(cultivar_id, tree_age)
+        if located is None:
+            return None
+        crop, _, bucket = located
+        for r, (candidate_id, _, _) in enumerate(crop.rootstocks):
+            if candidate_id == rootstock_id:
+                return crop.modifiers[r * len(TREE_AGE_BUCKETS) + bucket]
+        return None
+
+    def best_rootstock(self, cultivar_id: str, tree_age=None) -> Optional[str]:
+        """Compatible rootstock with the highest expected Brix at tree_age (None: own roots)."""
+        located = self._locate(cultivar_id, tree_age)
+        if located is None:
+            return None
+        crop, row, bucket = located
+        return crop.rootstocks[crop.best[row * len(TREE_AGE_BUCKETS) + bucket]][0]
+
+    def crop_grid(self, crop_type: str) -> Optional[dict]:
+        """JSON-ready planning grid for a crop type (None when it has no cultivars)."""
+        crop = self._crops.get(crop_type)
+        if crop is None:
+            return None
+
+        ages = len(TREE_AGE_BUCKETS)
+        per_cultivar = len(crop.rootstocks) * ages
+        cultivars = []
+        for row, (cultivar_id, cultivar_name, peak_brix) in enumerate(crop.cultivars):
+            expected = crop.expected[row * per_cultivar:(row + 1) * per_cultivar]
+            best = []
+            for a, bucket in enumerate(TREE_AGE_BUCKETS):
+                r = crop.best[row * ages + a]
+                best.append({
+                    "age_bucket": bucket.label,
+                    "rootstock_id": crop.rootstocks[r][0],
+                    "total_brix_modifier": round(crop.modifiers[r * ages + a], 2),
+                    "expected_peak_brix": _round(expected[r * ages + a]),
+                })
+            cultivars.append({
+                "cultivar_id": cultivar_id,
+                "cultivar_name": cultivar_name,
+                "research_peak_brix": peak_brix,
+                "recommended_rootstocks": crop.recommended[row],
+                "best": best,
+                # One row per entry of "rootstocks", one column per age bucket
+                "expected_peak_brix": [
+                    [_round(value) for value in expected[r * ages:(r + 1) * ages]]
+                    for r in range(len(crop.rootstocks))
+                ],
+            })
+
+        return {
+            "crop_type": crop_type,
+            "age_buckets": [
+                {
+                    "label": bucket.label,
+                    "min_age": bucket.min_age,
+                    "max_age": bucket.max_age,
+                    "age_brix_modifier": bucket.brix_modifier,
+                }
+                for bucket in TREE_AGE_BUCKETS
+            ],
+            "rootstocks": [
+                {"rootstock_id": rootstock_id, "rootstock_name": name, "brix_modifier": modifier}
+                for rootstock_id, name, modifier in crop.rootstocks
+            ],
+            "count": len(cultivars),
+            "cultivars": cultivars,
+        }
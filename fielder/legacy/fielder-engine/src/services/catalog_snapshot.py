@@ -0,0 +1,207 @@
+"""
+Catalog Snapshot - Load the research catalog without running DataLoader.
+
+DataLoader builds every cultivar, rootstock and regional record imperatively
+in Python, so startup cost grows with every crop we add. A snapshot is the
+result of DataLoader.load_all() written once by a build step
+(build_catalog_snapshot.py) in the packed image format used for shared
+databases, behind a small header:
+
+    magic(8) | source checksum (sha256, 32) | image digest (sha256, 32) | image
+
+The source checksum covers the Python sources that define the catalog (the
+loader and the crop/region models it uses, the record dataclasses and
+enums, the compact records and the image format). A snapshot built
+from different sources is ignored and the loader runs instead, so a stale
+snapshot can never serve outdated research data. The image digest
+rejects a truncated or corrupted file before any record is read.
+
+    image = open_snapshot("build/cultivar_catalog.snapshot")  # None if stale
+    db = materialize(image) if image else None
+
+The same build step writes the lazy catalog's manifest: for each
+DataLoader partition, the crops and record ids its loader produces, so a
+lazy database loads exactly the partitions a lookup needs (see
+CultivarDatabase.register_partition). It carries the same checksum and is
+ignored when stale.
+
+    manifest = open_manifest("build/cultivar_catalog.manifest.json")
+    if manifest is not None:
+        DataLoader(db).register_partitions(manifest)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+from ..models.cultivar_database import INDEX_NAMES, CultivarDatabase
+from ..models.shared_cultivar_database import SharedCultivarDatabase, pack_database
+from .data_loader import CATALOG_PARTITIONS, DataLoader
+
+
+SNAPSHOT_MAGIC = b"FCDBSNP2"
+
+_SNAPSHOT_HEADER = struct.Struct("<8s32s32s")
+
+_SRC = Path(__file__).resolve().parent.parent
+
+# Sources whose contents determine the snapshot: the loader, every module
+# whose types it builds records from or that end up in the pickled records,
+# and the code that packs them
+SNAPSHOT_SOURCES = (
+    _SRC / "services" / "data_loader.py",
+    _SRC / "models" / "crop.py",
+    _SRC / "models" / "region.py",
+    _SRC / "models" / "cultivar_database.py",
+    _SRC / "models" / "compact_cultivar_database.py",
+    _SRC / "models" / "shared_cultivar_database.py",
+)
+
+
+def source_checksum() -> bytes:
+    """sha256 over the catalog's defining sources."""
+    digest = hashlib.sha256()
+    for path in SNAPSHOT_SOURCES:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def write_snapshot(db: CultivarDatabase, path: str) -> int:
+    """Write db as a snapshot stamped with the current source checksum. Returns bytes written."""
+    image = pack_database(db)
+    data = _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, source_checksum(), hashlib.sha256(image).digest()) + image
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)  # Readers never see a partial file
+    return len(data)
+
+
+def build_snapshot(path: str) -> CultivarDatabase:
+    """Run the full loader and write its result to path."""
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    write_snapshot(db, path)
+    return db
+
+
+def build_manifest() -> dict:
+    """
+    Run each lazy partition's loader on its own and record what it holds.
+
+    Returns {partition name: {"kind", "crop_types", "ids"}}; ids are keys
+    of the partition's mapping (cultivar_id, "cultivar:region" or
+    rootstock_id). Regional partitions take their crops from the cultivars
+    they refer to.
+    """
+    staged = []
+    for method, kind in CATALOG_PARTITIONS:
+        db = CultivarDatabase()
+        getattr(DataLoader(db), method)()
+        staged.append((method[len("load_"):], kind, db))
+
+    crop_by_cultivar = {
+        cultivar_id: cultivar.crop_type
+        for _, _, db in staged
+        for cultivar_id, cultivar in db.cultivars.items()
+    }
+    manifest = {}
+    for name, kind, db in staged:
+        if kind == "cultivars":
+            crop_types = {cultivar.crop_type for cultivar in db.cultivars.values()}
+        elif kind == "regional_data":
+            crop_types = {
+                crop_by_cultivar[regional.cultivar_id]
+                for regional in db.regional_data.values()
+                if regional.cultivar_id in crop_by_cultivar
+            }
+        else:
+            crop_types = {crop_type for rootstock in db.rootstocks.values() for crop_type in rootstock.crop_types}
+        manifest[name] = {"kind": kind, "crop_types": sorted(crop_types), "ids": list(getattr(db, kind))}
+    return manifest
+
+
+def write_manifest(path: str, manifest: Optional[dict] = None) -> dict:
+    """Write the partition manifest (built now unless given), stamped with the source checksum."""
+    if manifest is None:
+        manifest = build_manifest()
+    data = json.dumps({"source_checksum": source_checksum().hex(), "partitions": manifest}, indent=1)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def open_manifest(path: str) -> Optional[dict]:
+    """
+    The partition manifest at path.
+
+    Returns None when the file is missing or unreadable, was built from
+    different sources, or doesn't list every partition.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data["source_checksum"] != source_checksum().hex():
+            return None
+        manifest = data["partitions"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if any(method[len("load_"):] not in manifest for method, _ in CATALOG_PARTITIONS):
+        return None
+    return manifest
+
+
+def open_snapshot(path: str) -> Optional[SharedCultivarDatabase]:
+    """
+    Memory-map a snapshot as a read-only database.
+
+    Returns None when the file is missing, not a snapshot, was built
+    from different sources, or its image doesn't match its digest.
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # Missing, unreadable or empty
+        return None
+
+    if len(buffer) < _SNAPSHOT_HEADER.size:
+        return None
+    magic, checksum, image_digest = _SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC or checksum != source_checksum():
+        return None
+    image = memoryview(buffer)[_SNAPSHOT_HEADER.size:]
+    if hashlib.sha256(image).digest() != image_digest:
+        return None
+    try:
+        return SharedCultivarDatabase(image)
+    except (ValueError, struct.error):
+        return None
+
+
+def materialize(image: CultivarDatabase) -> CultivarDatabase:
+    """Copy a (read-only) database into a regular, mutable CultivarDatabase."""
+    db = CultivarDatabase()
+    for cultivar in image.cultivars.values():
+        db.add_cultivar(cultivar)
+    for regional in image.regional_data.values():
+        db.add_regional_data(regional)
+    for rootstock in image.rootstocks.values():
+        db.add_rootstock(rootstock)
+    # Restore the relation indexes as written: their order reflects the
+    # loader's add/replace history, which replaying the final records loses
+    for name in INDEX_NAMES:
+        setattr(db, name, {key: list(ids) for key, ids in getattr(image, name).items()})
+    db.version = image.version
+    db.last_modified = image.last_modified
+    db.crop_versions = dict(image.crop_versions)
+    return db
+
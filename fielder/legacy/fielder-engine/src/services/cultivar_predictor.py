@@ -0,0 +1,578 @@
+"""
+Cultivar-Level Prediction Service.
+
+Predictions happen at the CULTIVAR level, not crop level:
+- Same cultivar grown in different regions = different harvest dates
+- Different cultivars of same crop type = different timing (early/mid/late)
+- For annual crops, growers can specify their actual planting date(s)
+
+This is the prediction kernel behind the /predict/cultivar endpoint.
+It is kept free of any web framework so the same code can serve
+single requests, full-catalog exports and batch jobs.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from ..models.cultivar_database import (
+    CultivarResearch,
+    RegionalBloomData,
+    RootstockResearch,
+)
+from ..models.region import GrowingRegion
+from ..models.tree_age import age_brix_modifier as tree_age_brix_modifier
+from .weather_service import WeatherService
+from .quality_predictor import QualityPredictor
+from . import metrics
+from .instrumentation import span
+from .rate_limit import UpstreamBusy
+from .serialization import (
+    format_month,
+    format_month_day,
+    format_month_day_year,
+    format_short_month_day_year,
+)
+
+
+# Harvest status codes, in season order
+HARVEST_STATUSES = ("off_season", "harvestable", "optimal", "at_peak", "past_optimal")
+
+# Fields predict() can return: top level, then per planting (flattened into
+# the top level for single plantings). "status" is only sent when selected.
+RESPONSE_FIELDS = frozenset({
+    "cultivar_id", "cultivar_name", "crop_type", "timing_class", "quality_tier",
+    "region_id", "region_name", "prediction_mode", "gdd_to_peak", "cultivar_ceiling",
+    "research_sources", "rootstock_id", "rootstock_name", "rootstock_brix_modifier",
+    "rootstock_notes", "tree_age", "age_brix_modifier", "total_brix_modifier",
+    "plantings", "planting_count", "summary",
+})
+PLANTING_FIELDS = frozenset({
+    "planting_date", "harvest_window", "harvest_start_date", "harvest_end_date",
+    "optimal_start_date", "optimal_end_date", "peak_date", "progress", "current_gdd",
+    "is_harvestable", "is_in_optimal_window", "is_at_peak", "is_past_optimal",
+    "is_off_season", "predicted_brix", "predicted_acid", "brix_acid_ratio",
+    "peak_brix", "quality_message", "data_source", "status",
+})
+_DEFAULT_FIELDS = (RESPONSE_FIELDS | PLANTING_FIELDS) - {"status"}
+
+# Default selection in compact mode (mobile widgets)
+COMPACT_FIELDS = frozenset({
+    "cultivar_id", "region_id", "status", "peak_date", "progress",
+    "predicted_brix", "peak_brix", "plantings", "summary",
+})
+
+# Planting fields that need observed GDD / the quality model
+_GDD_FIELDS = frozenset({"current_gdd", "predicted_brix", "predicted_acid", "brix_acid_ratio", "quality_message", "data_source"})
+_QUALITY_FIELDS = frozenset({"predicted_brix", "predicted_acid", "brix_acid_ratio", "peak_brix", "quality_message"})
+
+
+def parse_fields(value) -> Optional[frozenset]:
+    """
+    Parse a fields= selector (comma-separated string or list) into a field set.
+
+    Returns None when no selector was given. Raises ValueError for unknown
+    field names.
+    """
+    if not value:
+        return None
+    names = value.split(",") if isinstance(value, str) else value
+    fields = frozenset(str(name).strip() for name in names if str(name).strip())
+    unknown = fields - RESPONSE_FIELDS - PLANTING_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields or None
+
+
+def _status(is_at_peak: bool, is_in_optimal_window: bool, is_past_optimal: bool, is_harvestable: bool) -> str:
+    if is_at_peak:
+        return "at_peak"
+    if is_in_optimal_window:
+        return "optimal"
+    if is_past_optimal:
+        return "past_optimal"
+    if is_harvestable:
+        return "harvestable"
+    return "off_season"
+
+
+def harvest_status(prediction: dict) -> str:
+    """Single status for a (flattened) prediction's harvest flags."""
+    if "status" in prediction:
+        return prediction["status"]
+    return _status(
+        prediction.get("is_at_peak"),
+        prediction.get("is_in_optimal_window"),
+        prediction.get("is_past_optimal"),
+        prediction.get("is_harvestable"),
+    )
+
+
+def _doy_to_date(doy: int, ref_year: int) -> date:
+    """Convert day-of-year to date, handling year boundaries."""
+    if doy <= 0:
+        doy += 365
+        ref_year -= 1
+    return date(ref_year, 1, 1) + timedelta(days=doy - 1)
+
+
+class CultivarPredictor:
+    """
+    Predicts harvest windows and quality for a cultivar in a region.
+
+    Uses GDD calculated from actual weather data when a planting/bloom
+    date has passed, and validated historical harvest windows for
+    regional-average predictions when they are available.
+    """
+
+    def __init__(
+        self,
+        weather_service: Optional[WeatherService] = None,
+        quality_predictor: Optional[QualityPredictor] = None
+    ):
+        self.weather_service = weather_service or WeatherService()
+        self.quality_predictor = quality_predictor or QualityPredictor()
+
+    def predict(
+        self,
+        cultivar: CultivarResearch,
+        regional_data: RegionalBloomData,
+        region: GrowingRegion,
+        planting_dates: Optional[list[date]] = None,
+        rootstock: Optional[RootstockResearch] = None,
+        tree_age=None,
+        today: Optional[date] = None,
+        fields: Optional[frozenset] = None,
+        compact: bool = False
+    ) -> dict:
+        """
+        Predict harvest timing and quality for a cultivar in a region.
+
+        When planting_dates is provided, returns a prediction for EACH
+        planting date ("grower-specific"). Otherwise uses the regional
+        average bloom/planting date ("regional-average").
+
+        fields limits the response to those keys (see parse_fields), and
+        work only they depend on - the weather fetch, the quality model,
+        display strings - is skipped. compact=True returns dates as ISO
+        strings instead of display text and defaults fields to
+        COMPACT_FIELDS.
+
+        Returns the response dict served by /predict/cultivar.
+        """
+        if today is None:
+            today = date.today()
+        current_year = today.year
+        metrics.PREDICTIONS.inc(predictor="cultivar")
+
+        if compact and fields is None:
+            fields = COMPACT_FIELDS
+        want = (fields if fields is not None else _DEFAULT_FIELDS).__contains__
+        want_gdd = any(map(want, _GDD_FIELDS))
+        want_quality = any(map(want, _QUALITY_FIELDS))
+        format_day = date.isoformat if compact else format_month_day
+        format_day_year = date.isoformat if compact else format_month_day_year
+
+        grower_planting_dates = sorted(planting_dates) if planting_dates else []
+        prediction_mode = "grower-specific" if grower_planting_dates else "regional-average"
+
+        rootstock_brix_modifier = rootstock.brix_modifier if rootstock else 0.0
+        age_brix_modifier = tree_age_brix_modifier(tree_age)
+
+        # =====================================================================
+        # GET PHENOLOGY FROM CULTIVAR + REGIONAL DATA
+        # =====================================================================
+        # GDD parameters from cultivar research
+        gdd_base = cultivar.gdd_base_temp or 50.0
+        gdd_to_maturity = cultivar.gdd_to_maturity or 1000
+        gdd_to_peak = cultivar.gdd_to_peak or int(gdd_to_maturity * 1.15)
+
+        # Calculate GDD window - for grower-specific, use cultivar's inherent window
+        # For regional average, use historical data if available
+        if grower_planting_dates:
+            # Grower-specific: window based on cultivar genetics, not regional spread
+            # A single planting has a tighter window than region-wide staggered plantings
+            gdd_window = int(gdd_to_peak * 0.12)  # ~12% of peak = single planting window
+        elif regional_data.historical_harvest_start_doy and regional_data.historical_harvest_end_doy:
+            # Regional average: broader window due to staggered plantings
+            avg_gdd_rate = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
+            harvest_days = regional_data.historical_harvest_end_doy - regional_data.historical_harvest_start_doy
+            if harvest_days < 0:  # Wraps around year
+                harvest_days += 365
+            gdd_window = max(100, int(harvest_days * avg_gdd_rate * 0.5))  # ~50% of season
+        else:
+            gdd_window = int(gdd_to_peak * 0.15)  # 15% of peak as default
+
+        # =====================================================================
+        # DETERMINE BLOOM/PLANTING DATE(S)
+        # =====================================================================
+        # Build list of planting dates to process (could be 1 or more)
+        if grower_planting_dates:
+            # Use grower's actual planting date(s)
+            planting_dates_to_process = grower_planting_dates
+        else:
+            # Use regional average bloom/planting date
+            bloom_doy = regional_data.avg_bloom_peak_doy or regional_data.avg_bloom_start_doy or 100
+            bloom_date = date(current_year, 1, 1) + timedelta(days=bloom_doy - 1)
+
+            # Handle bloom date relative to today
+            if bloom_date > today:
+                # Bloom hasn't happened yet this year - might be tracking last year's crop
+                last_year_bloom = date(current_year - 1, 1, 1) + timedelta(days=bloom_doy - 1)
+                if (today - last_year_bloom).days < 450:  # Max ~15 months
+                    bloom_date = last_year_bloom
+
+            planting_dates_to_process = [bloom_date]
+
+        # =====================================================================
+        # PROCESS EACH PLANTING DATE
+        # =====================================================================
+        quality_model = self.quality_predictor.get_model_by_crop(cultivar.crop_type)
+        cultivar_brix_ceiling = cultivar.research_peak_brix or 12.0
+        total_brix_modifier = rootstock_brix_modifier + age_brix_modifier
+
+        # For regional-average mode (no grower planting date), historical data
+        # is more accurate than GDD calculations which require calibrated targets
+        use_historical_dates = (
+            not grower_planting_dates and
+            regional_data.historical_harvest_start_doy and
+            regional_data.historical_harvest_end_doy
+        )
+
+        plantings = []
+
+        for planting_idx, planting_date in enumerate(planting_dates_to_process):
+            # Data source label
+            if not want("data_source"):
+                data_source = None
+            elif grower_planting_dates:
+                data_source = f"{cultivar.cultivar_name} - Planting {planting_idx + 1} ({format_short_month_day_year(planting_date)})"
+            else:
+                data_source = f"{cultivar.cultivar_name} - {regional_data.data_source or 'Research data'}"
+
+            # -----------------------------------------------------------------
+            # CALCULATE GDD FROM ACTUAL WEATHER DATA
+            # -----------------------------------------------------------------
+            if planting_date < today and use_historical_dates and not want_gdd:
+                # Dates come from history and no requested field needs GDD
+                current_gdd = 0
+                avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
+            elif planting_date < today:
+                try:
+                    with span("weather_fetch"):
+                        observations = self.weather_service.provider.get_historical(
+                            region.id, planting_date, today
+                        )
+
+                    if observations:
+                        current_gdd = sum(obs.gdd(gdd_base) for obs in observations)
+                        avg_daily_gdd = current_gdd / len(observations)
+                        data_source = f"{data_source} + Open-Meteo ({len(observations)} days)"
+                    else:
+                        days_elapsed = (today - planting_date).days
+                        avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
+                        current_gdd = days_elapsed * avg_daily_gdd
+                        data_source = f"{data_source} + climatology estimate"
+                        metrics.WEATHER_FALLBACKS.inc(predictor="cultivar", path="climatology")
+
+                except UpstreamBusy:
+                    raise  # Admission control: the caller answers 429
+                except Exception:
+                    days_elapsed = (today - planting_date).days
+                    avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
+                    current_gdd = days_elapsed * avg_daily_gdd
+                    data_source = f"{data_source} (weather unavailable)"
+                    metrics.WEATHER_FALLBACKS.inc(predictor="cultivar", path="unavailable")
+            else:
+                current_gdd = 0
+                avg_daily_gdd = regional_data.avg_gdd_per_day_bloom_to_harvest or 15.0
+                data_source = f"{data_source} - awaiting planting"
+
+            # -----------------------------------------------------------------
+            # PROJECT HARVEST DATES - Use historical data when available
+            # -----------------------------------------------------------------
+            if use_historical_dates:
+                # Determine which year's season we're in
+                harvest_start_doy = regional_data.historical_harvest_start_doy
+                harvest_end_doy = regional_data.historical_harvest_end_doy
+
+                # Check if season wraps around year end (e.g., Nov-Jan)
+                if harvest_end_doy < harvest_start_doy:
+                    # Season wraps year boundary
+                    if today.timetuple().tm_yday >= harvest_start_doy:
+                        # We're in the first part (e.g., Nov-Dec of current year)
+                        season_year = today.year
+                        harvest_start_date = _doy_to_date(harvest_start_doy, season_year)
+                        harvest_end_date = _doy_to_date(harvest_end_doy, season_year + 1)
+                    elif today.timetuple().tm_yday <= harvest_end_doy:
+                        # We're in the second part (e.g., Jan of current year)
+                        season_year = today.year - 1
+                        harvest_start_date = _doy_to_date(harvest_start_doy, season_year)
+                        harvest_end_date = _doy_to_date(harvest_end_doy, today.year)
+                    else:
+                        # Off-season - show next upcoming season
+                        season_year = today.year
+                        harvest_start_date = _doy_to_date(harvest_start_doy, season_year)
+                        harvest_end_date = _doy_to_date(harvest_end_doy, season_year + 1)
+                else:
+                    # Season within single year
+                    if today.timetuple().tm_yday > harvest_end_doy:
+                        # Past this year's season, show next year
+                        season_year = today.year + 1
+                    else:
+                        season_year = today.year
+                    harvest_start_date = _doy_to_date(harvest_start_doy, season_year)
+                    harvest_end_date = _doy_to_date(harvest_end_doy, season_year)
+
+                # Peak window from historical data if available
+                if regional_data.historical_peak_start_doy and regional_data.historical_peak_end_doy:
+                    peak_start_doy = regional_data.historical_peak_start_doy
+                    peak_end_doy = regional_data.historical_peak_end_doy
+
+                    # Same year logic for peak
+                    if harvest_end_doy < harvest_start_doy:
+                        # Wrapping season
+                        if peak_start_doy >= harvest_start_doy:
+                            optimal_start_date = _doy_to_date(peak_start_doy, harvest_start_date.year)
+                        else:
+                            optimal_start_date = _doy_to_date(peak_start_doy, harvest_end_date.year)
+
+                        if peak_end_doy >= harvest_start_doy:
+                            optimal_end_date = _doy_to_date(peak_end_doy, harvest_start_date.year)
+                        else:
+                            optimal_end_date = _doy_to_date(peak_end_doy, harvest_end_date.year)
+                    else:
+                        optimal_start_date = _doy_to_date(peak_start_doy, harvest_start_date.year)
+                        optimal_end_date = _doy_to_date(peak_end_doy, harvest_start_date.year)
+
+                    # Peak center is midpoint of optimal window
+                    peak_center_date = optimal_start_date + (optimal_end_date - optimal_start_date) / 2
+                else:
+                    # Estimate optimal as middle 50% of harvest window
+                    window_days = (harvest_end_date - harvest_start_date).days
+                    if window_days < 0:
+                        window_days += 365
+                    optimal_offset = window_days // 4
+                    optimal_start_date = harvest_start_date + timedelta(days=optimal_offset)
+                    optimal_end_date = harvest_end_date - timedelta(days=optimal_offset)
+                    peak_center_date = harvest_start_date + timedelta(days=window_days // 2)
+
+            elif avg_daily_gdd > 0:
+                # Calculate GDD thresholds for status
+                gdd_optimal_start = gdd_to_peak - (gdd_window / 4)
+                gdd_optimal_end = gdd_to_peak + (gdd_window / 4)
+                gdd_harvest_end = gdd_to_peak + (gdd_window / 2)
+
+                # Calculate days from planting to each milestone (grower-specific mode)
+                days_plant_to_maturity = int(gdd_to_maturity / avg_daily_gdd)
+                days_plant_to_optimal_start = int(gdd_optimal_start / avg_daily_gdd)
+                days_plant_to_peak = int(gdd_to_peak / avg_daily_gdd)
+                days_plant_to_optimal_end = int(gdd_optimal_end / avg_daily_gdd)
+                days_plant_to_harvest_end = int(gdd_harvest_end / avg_daily_gdd)
+
+                # Calculate actual dates from planting date (not from today)
+                harvest_start_date = planting_date + timedelta(days=days_plant_to_maturity)
+                optimal_start_date = planting_date + timedelta(days=days_plant_to_optimal_start)
+                peak_center_date = planting_date + timedelta(days=days_plant_to_peak)
+                optimal_end_date = planting_date + timedelta(days=days_plant_to_optimal_end)
+                harvest_end_date = planting_date + timedelta(days=days_plant_to_harvest_end)
+            else:
+                # Fallback to cultivar's days to maturity
+                harvest_start_date = planting_date + timedelta(days=cultivar.days_to_maturity or 120)
+                optimal_start_date = harvest_start_date + timedelta(days=15)
+                peak_center_date = harvest_start_date + timedelta(days=30)
+                optimal_end_date = harvest_start_date + timedelta(days=45)
+                harvest_end_date = harvest_start_date + timedelta(days=60)
+
+            # -----------------------------------------------------------------
+            # DETERMINE HARVEST STATUS FROM DATES (works for both historical and GDD)
+            # -----------------------------------------------------------------
+            is_off_season = today < harvest_start_date or today > harvest_end_date
+            is_harvestable = harvest_start_date <= today <= harvest_end_date
+            is_in_optimal_window = optimal_start_date <= today <= optimal_end_date
+            is_at_peak = (peak_center_date - timedelta(days=3)) <= today <= (peak_center_date + timedelta(days=3))
+            is_past_optimal = today > optimal_end_date and today <= harvest_end_date
+
+            # Calculate progress through season
+            if is_off_season and today < harvest_start_date:
+                progress = 0
+            elif is_off_season:  # Past harvest end
+                progress = 100
+            else:
+                total_days = (harvest_end_date - harvest_start_date).days or 1
+                days_into_season = (today - harvest_start_date).days
+                progress = min(100, max(0, (days_into_season / total_days) * 100))
+
+            # -----------------------------------------------------------------
+            # FORMAT HARVEST WINDOW MESSAGE
+            # -----------------------------------------------------------------
+            if not want("harvest_window"):
+                harvest_window = None
+            elif is_off_season:
+                if today < harvest_start_date:
+                    days_until = (harvest_start_date - today).days
+                    if days_until <= 30:
+                        harvest_window = f"Season starts in {days_until} days"
+                    else:
+                        harvest_window = f"Season: {format_month_day(harvest_start_date)}"
+                else:
+                    harvest_window = "Off-season"
+            elif is_at_peak:
+                harvest_window = "AT PEAK NOW!"
+            elif is_in_optimal_window:
+                harvest_window = "Optimal harvest NOW!"
+            elif is_past_optimal:
+                harvest_window = "Past peak - still good"
+            elif is_harvestable:
+                days_until_peak = (peak_center_date - today).days if today < peak_center_date else 0
+                if days_until_peak > 0:
+                    harvest_window = f"Good now, peak in {days_until_peak} days"
+                else:
+                    harvest_window = "Harvestable now"
+            else:
+                harvest_window = f"Not yet - {format_month(harvest_start_date)}"
+
+            # -----------------------------------------------------------------
+            # QUALITY PREDICTION
+            # -----------------------------------------------------------------
+            predicted_brix = predicted_acid = brix_acid_ratio = peak_brix = None
+            if want_quality:
+                with span("quality_model"):
+                    # Base Brix from GDD model
+                    base_predicted_brix = quality_model.predict_sugar_content(current_gdd, cultivar_brix_ceiling)
+                    base_peak_brix = quality_model.predict_sugar_content(gdd_to_peak, cultivar_brix_ceiling)
+
+                    # Apply rootstock and age modifiers (Peak_Brix = Scion_Base + Rootstock_Mod + Age_Mod)
+                    predicted_brix = base_predicted_brix + total_brix_modifier
+                    peak_brix = base_peak_brix + total_brix_modifier
+
+                    predicted_acid = quality_model.predict_acid_content(current_gdd)
+                    brix_acid_ratio = predicted_brix / predicted_acid if predicted_acid > 0.1 else None
+
+            if not want("quality_message"):
+                quality_message = None
+            elif cultivar.crop_type == "pecan":
+                quality_message = f"Oil content: {predicted_brix:.0f}%"
+            elif is_at_peak:
+                quality_message = "At peak sweetness!"
+            elif is_in_optimal_window:
+                quality_message = "Excellent - in optimal window"
+            elif is_harvestable:
+                quality_message = "Good - ready to eat"
+            elif is_off_season:
+                quality_message = "Not in season"
+            else:
+                quality_message = "Developing"
+
+            if not want("peak_date"):
+                peak_date_display = None
+            elif compact:
+                peak_date_display = peak_center_date.isoformat()
+            elif is_at_peak:
+                peak_date_display = "NOW!"
+            elif today > optimal_end_date:
+                peak_date_display = f"Was {format_month_day(peak_center_date)}"
+            else:
+                peak_date_display = format_month_day_year(peak_center_date)
+
+            # -----------------------------------------------------------------
+            # BUILD PLANTING RESULT
+            # -----------------------------------------------------------------
+            planting_result = {
+                "planting_date": planting_date.isoformat(),
+                "harvest_window": harvest_window,
+                "harvest_start_date": format_day(harvest_start_date),
+                "harvest_end_date": format_day(harvest_end_date),
+                "optimal_start_date": format_day_year(optimal_start_date) if want("optimal_start_date") else None,
+                "optimal_end_date": format_day_year(optimal_end_date) if want("optimal_end_date") else None,
+                "peak_date": peak_date_display,
+                "progress": round(progress, 1),
+                "current_gdd": round(current_gdd, 0),
+                "is_harvestable": is_harvestable,
+                "is_in_optimal_window": is_in_optimal_window,
+                "is_at_peak": is_at_peak,
+                "is_past_optimal": is_past_optimal,
+                "is_off_season": is_off_season,
+                "predicted_brix": round(predicted_brix, 1) if want_quality else None,
+                "predicted_acid": round(predicted_acid, 2) if want_quality else None,
+                "brix_acid_ratio": round(brix_acid_ratio, 1) if brix_acid_ratio else None,
+                "peak_brix": round(peak_brix, 1) if want_quality else None,
+                "quality_message": quality_message,
+                "data_source": data_source,
+            }
+            if want("status"):
+                planting_result["status"] = _status(
+                    is_at_peak, is_in_optimal_window, is_past_optimal, is_harvestable
+                )
+            plantings.append(planting_result)
+
+        # =====================================================================
+        # BUILD RESPONSE
+        # =====================================================================
+        # For single planting (regional average or single date), flatten for backward compatibility
+        # For multiple plantings, return array
+
+        response = {
+            # Cultivar info
+            "cultivar_id": cultivar.cultivar_id,
+            "cultivar_name": cultivar.cultivar_name,
+            "crop_type": cultivar.crop_type,
+            "timing_class": cultivar.timing_class,
+            "quality_tier": cultivar.quality_tier.value if cultivar.quality_tier else "standard",
+            # Region info
+            "region_id": region.id,
+            "region_name": region.name,
+            # Prediction mode
+            "prediction_mode": prediction_mode,
+            "gdd_to_peak": gdd_to_peak,
+            "cultivar_ceiling": cultivar_brix_ceiling,
+            "research_sources": cultivar.research_sources,
+        }
+
+        # Add rootstock info if specified
+        if rootstock:
+            response["rootstock_id"] = rootstock.rootstock_id
+            response["rootstock_name"] = rootstock.rootstock_name
+            response["rootstock_brix_modifier"] = rootstock.brix_modifier
+            response["rootstock_notes"] = rootstock.notes
+
+        # Add tree age info if specified
+        if tree_age is not None:
+            response["tree_age"] = tree_age
+            response["age_brix_modifier"] = age_brix_modifier
+
+        # Add total modifier info for transparency
+        if rootstock or tree_age is not None:
+            response["total_brix_modifier"] = total_brix_modifier
+
+        if len(plantings) == 1:
+            # Single planting: merge into top-level for backward compatibility
+            response.update(plantings[0])
+        else:
+            # Multiple plantings: include as array + summary
+            response["plantings"] = plantings
+            response["planting_count"] = len(plantings)
+
+            # Summary across all plantings
+            earliest_harvest = min(p["harvest_start_date"] for p in plantings)
+            latest_harvest = max(p["harvest_end_date"] for p in plantings)
+            any_harvestable = any(p["is_harvestable"] for p in plantings)
+            any_at_peak = any(p["is_at_peak"] for p in plantings)
+            any_optimal = any(p["is_in_optimal_window"] for p in plantings)
+
+            response["summary"] = {
+                "harvest_range": f"{earliest_harvest} - {latest_harvest}",
+                "any_harvestable_now": any_harvestable,
+                "any_at_peak_now": any_at_peak,
+                "any_in_optimal_window": any_optimal,
+            }
+
+        if fields is not None:
+            # Drop unselected keys (placeholders for work that was skipped)
+            response = {key: value for key, value in response.items() if want(key)}
+            if "plantings" in response:
+                response["plantings"] = [
+                    {key: value for key, value in planting.items() if want(key)}
+                    for planting in plantings
+                ]
+
+        return response
@@ -0,0 +1,214 @@
+"""
+Cultivar Search - Typo-tolerant lookup by name, alias, crop or flavor.
+
+Clients used to need exact cultivar_ids ("florida_radiance"). The index
+lets them search the way people type: "florida radience", "honycrisp",
+"murcott", "blood orange", "honey notes".
+
+Every searchable field is split into words, and every distinct word (a
+term) into padded trigrams ("$ho", "hon", ..., "sp$"). Two posting lists
+answer a query:
+
+- trigram -> terms containing it; a query word is compared only with the
+  terms sharing one of its trigrams, scored by Dice similarity of the
+  trigram sets (a prefix of a term scores at least PREFIX_SIMILARITY)
+- term -> for each field, the cultivars whose field contains the term
+
+A cultivar's score averages, over the query words, the best
+similarity x field weight among its terms, scaled to 0-1. Names and
+aliases outweigh crop types, which outweigh flavor text.
+
+Aliases are the words of the cultivar_id and the parenthesized parts of
+the name ("Honey Tangerine (Murcott)" -> "murcott").
+
+    index = CultivarSearchIndex.build(db)
+    index.search("honycrisp")          # [SearchHit(cultivar_id="honeycrisp", ...)]
+    index.suggest("florida_radience")  # ["florida_radiance", ...]
+"""
+
+import heapq
+import re
+import unicodedata
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Optional
+
+from ..models.cultivar_database import CultivarDatabase
+
+
+# Field weights (names and aliases matter most)
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "alias": 3.0,
+    "crop_type": 2.0,
+    "flavor": 1.0,
+}
+_MAX_WEIGHT = max(FIELD_WEIGHTS.values())
+
+MIN_SIMILARITY = 0.4     # Terms less similar to a query word are ignored
+PREFIX_SIMILARITY = 0.8  # Floor for a query word that begins a term
+SUGGESTION_MIN_SCORE = 0.3
+
+_WORD = re.compile(r"[a-z0-9]+")
+_PARENTHESIZED = re.compile(r"\(([^)]*)\)")
+
+
+def _words(text: Optional[str]) -> list[str]:
+    """Lowercase ASCII words ("O'Henry" -> ["ohenry"], "Dekopon/Shiranui" -> two words)."""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _WORD.findall(text.lower().replace("'", ""))
+
+
+def _trigrams(word: str) -> set[str]:
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A ranked search result."""
+    cultivar_id: str
+    cultivar_name: str
+    crop_type: str
+    score: float
+    matched_fields: tuple[str, ...]
+
+
+class CultivarSearchIndex:
+    """In-memory trigram index over the cultivars of one database version."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self._cultivars: list[tuple[str, str, str]] = []  # (id, name, crop_type) per doc
+        self._terms: list[str] = []
+        self._term_ids: dict[str, int] = {}
+        self._term_trigram_counts: list[int] = []
+        self._terms_by_trigram: dict[str, list[int]] = {}
+        # term -> {field: docs whose field contains the term}
+        self._postings: list[dict[str, set[int]]] = []
+
+    @classmethod
+    def build(cls, db: CultivarDatabase) -> "CultivarSearchIndex":
+        """Index every cultivar in db (loads any pending cultivar partitions)."""
+        index = cls(db.version)
+        for cultivar in db.cultivars.values():
+            index.add(
+                cultivar.cultivar_id,
+                cultivar.cultivar_name,
+                cultivar.crop_type,
+                flavor_profile=cultivar.flavor_profile,
+            )
+        return index
+
+    def add(self, cultivar_id: str, cultivar_name: str, crop_type: str, flavor_profile: Optional[str] = None) -> None:
+        """Index one cultivar."""
+        doc = len(self._cultivars)
+        self._cultivars.append((cultivar_id, cultivar_name, crop_type))
+
+        aliases = " ".join([cultivar_id.replace("_", " "), *_PARENTHESIZED.findall(cultivar_name)])
+        for field, text in (
+            ("name", _PARENTHESIZED.sub(" ", cultivar_name)),
+            ("alias", aliases),
+            ("crop_type", crop_type.replace("_", " ")),
+            ("flavor", flavor_profile),
+        ):
+            for word in _words(text):
+                self._postings[self._term_id(word)].setdefault(field, set()).add(doc)
+
+    def _term_id(self, word: str) -> int:
+        term_id = self._term_ids.get(word)
+        if term_id is None:
+            term_id = self._term_ids[word] = len(self._terms)
+            self._terms.append(word)
+            trigrams = _trigrams(word)
+            self._term_trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._terms_by_trigram.setdefault(trigram, []).append(term_id)
+            self._postings.append({})
+        return term_id
+
+    def __len__(self) -> int:
+        return len(self._cultivars)
+
+    def _similar_terms(self, word: str) -> dict[int, float]:
+        """Terms at least MIN_SIMILARITY similar to word, with their similarity."""
+        trigrams = _trigrams(word)
+        shared: dict[int, int] = {}
+        for trigram in trigrams:
+            for term_id in self._terms_by_trigram.get(trigram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        terms = self._terms
+        counts = self._term_trigram_counts
+        similar = {}
+        for term_id, common in shared.items():
+            similarity = 2 * common / (len(trigrams) + counts[term_id])
+            if similarity < PREFIX_SIMILARITY and terms[term_id].startswith(word):
+                similarity = PREFIX_SIMILARITY
+            if similarity >= MIN_SIMILARITY:
+                similar[term_id] = similarity
+        return similar
+
+    def search(self, query: str, limit: int = 10, crop_type: Optional[str] = None) -> list[SearchHit]:
+        """Best matches for query, highest score first."""
+        words = list(dict.fromkeys(_words(query)))
+        if not words:
+            return []
+
+        totals: dict[int, float] = {}
+        similar_by_word = []
+        for word in words:
+            similar = self._similar_terms(word)
+            similar_by_word.append(similar)
+
+            # Each doc's best similarity x weight for this word: merging the
+            # (term, field) groups lowest score first lets higher scores win
+            groups = sorted(
+                (
+                    (similarity * FIELD_WEIGHTS[field], docs)
+                    for term_id, similarity in similar.items()
+                    for field, docs in self._postings[term_id].items()
+                ),
+                key=lambda group: group[0],
+            )
+            best: dict[int, float] = {}
+            for score, docs in groups:
+                best.update(dict.fromkeys(docs, score))
+
+            if not totals:
+                totals = best
+            else:
+                for doc, score in best.items():
+                    totals[doc] = totals.get(doc, 0.0) + score
+
+        if crop_type is not None:
+            totals = {doc: score for doc, score in totals.items() if self._cultivars[doc][2] == crop_type}
+        top = heapq.nlargest(limit, totals.items(), key=itemgetter(1))
+        top.sort(key=lambda item: (-item[1], item[0]))
+
+        scale = len(words) * _MAX_WEIGHT
+        hits = []
+        for doc, score in top:
+            cultivar_id, cultivar_name, doc_crop_type = self._cultivars[doc]
+            fields = {
+                field
+                for similar in similar_by_word
+                for term_id in similar
+                for field, docs in self._postings[term_id].items()
+                if doc in docs
+            }
+            hits.append(SearchHit(
+                cultivar_id=cultivar_id,
+                cultivar_name=cultivar_name,
+                crop_type=doc_crop_type,
+                score=round(score / scale, 3),
+                matched_fields=tuple(field for field in FIELD_WEIGHTS if field in fields),
+            ))
+        return hits
+
+    def suggest(self, text: str, limit: int = 5, crop_type: Optional[str] = None) -> list[str]:
+        """cultivar_ids closest to a mistyped id or name (none when nothing is close)."""
+        hits = self.search(text, limit=limit, crop_type=crop_type)
+        return [hit.cultivar_id for hit in hits if hit.score >= SUGGESTION_MIN_SCORE]
@@ -22,6 +22,7 @@ import json
 from pathlib import Path
 
 from fielder.models.cultivar_database import (
+    CatalogPartition,
     CultivarDatabase,
     CultivarResearch,
     RegionalBloomData,
@@ -50,6 +51,32 @@ class DataLoadResult:
         return len(self.errors) == 0
 
 
+# Lazy catalog partitions: (loader method, kind). Within each kind the
+# order matches load_all(), which decides ties and list order. Which crops
+# and ids each one holds comes from running it (see catalog_snapshot's
+# build_manifest), not from this table.
+CATALOG_PARTITIONS = (
+    ("load_citrus_cultivars", "cultivars"),
+    ("load_peach_cultivars", "cultivars"),
+    ("load_cherry_cultivars", "cultivars"),
+    ("load_apple_cultivars", "cultivars"),
+    ("load_pear_cultivars", "cultivars"),
+    ("load_mango_cultivars", "cultivars"),
+    ("load_pomegranate_cultivars", "cultivars"),
+    ("load_pecan_cultivars", "cultivars"),
+    ("load_strawberry_cultivars", "cultivars"),
+    ("load_blueberry_cultivars", "cultivars"),
+    ("load_tomato_cultivars", "cultivars"),
+    ("load_florida_regional_data", "regional_data"),
+    ("load_strawberry_regional_data", "regional_data"),
+    ("load_citrus_rootstocks", "rootstocks"),
+    ("load_peach_rootstocks", "rootstocks"),
+    ("load_apple_rootstocks", "rootstocks"),
+    ("load_pear_rootstocks", "rootstocks"),
+    ("load_cherry_rootstocks", "rootstocks"),
+)
+
+
 class DataLoader:
     """
     Load research data into the cultivar database.
@@ -62,6 +89,28 @@ class DataLoader:
     def __init__(self, database: CultivarDatabase):
         self.db = database
 
+    def register_partitions(self, manifest: dict) -> int:
+        """
+        Register the load_* methods as lazy partitions instead of loading them.
+
+        manifest maps each partition name (the method without "load_") to
+        its {"crop_types": [...], "ids": [...]}, as written by
+        catalog_snapshot.build_manifest() from a run of these methods.
+        Each crop's data is then built the first time it is looked up.
+        Returns the number of partitions registered.
+        """
+        for method, kind in CATALOG_PARTITIONS:
+            name = method[len("load_"):]
+            entry = manifest[name]
+            self.db.register_partition(CatalogPartition(
+                name=name,
+                kind=kind,
+                crop_types=tuple(entry["crop_types"]),
+                load=lambda db, method=method: getattr(DataLoader(db), method)(),
+                ids=frozenset(entry["ids"]),
+            ))
+        return len(CATALOG_PARTITIONS)
+
     def load_citrus_cultivars(self) -> DataLoadResult:
         """
         Load citrus cultivar research data.
@@ -0,0 +1,85 @@
+"""
+Day Cache - Memoize values that only change when the date changes.
+
+Season helpers (current-season bloom, what's in season) depend on static
+crop/region data plus today's date, yet were recomputed on every call.
+DayMemo caches results per calendar day:
+
+    bloom_memo = DayMemo(compute_bloom)          # compute_bloom(crop, region, as_of)
+    bloom_memo("navel_orange", "indian_river")   # as_of defaults to today
+    bloom_memo.warm(pairs, days=2)               # precompute today + tomorrow
+
+Entries for past days are dropped the first time the memo is used after
+midnight, so memory stays bounded to the days actually requested.
+"""
+
+import threading
+from datetime import date, timedelta
+from typing import Callable, Hashable, Iterable, Optional
+
+from . import metrics
+
+
+class DayMemo:
+    """
+    Per-day memoization of fn(*args, as_of).
+
+    fn must be deterministic given its arguments and the date, and its
+    arguments hashable. Hits and misses are counted under name in /metrics.
+    """
+
+    def __init__(self, fn: Callable, name: str = "day", today: Callable[[], date] = date.today):
+        self.fn = fn
+        self.name = name
+        self._today = today
+        self._days: dict[date, dict[tuple, object]] = {}
+        self._current_day: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def _evict_past_days(self, today: date) -> None:
+        with self._lock:
+            if self._current_day == today:
+                return
+            for day in [d for d in tuple(self._days) if d < today]:
+                del self._days[day]
+            self._current_day = today
+
+    def __call__(self, *args: Hashable, as_of: Optional[date] = None):
+        today = self._today()
+        if today != self._current_day:
+            self._evict_past_days(today)
+        if as_of is None:
+            as_of = today
+
+        day = self._days.get(as_of)
+        if day is None:
+            # Under the lock so eviction never sees _days change size mid-iteration
+            with self._lock:
+                day = self._days.setdefault(as_of, {})
+
+        try:
+            value = day[args]
+        except KeyError:
+            metrics.record_cache(self.name, hit=False)
+            value = day[args] = self.fn(*args, as_of=as_of)
+            return value
+        metrics.record_cache(self.name, hit=True)
+        return value
+
+    def warm(self, keys: Iterable[tuple], days: int = 1, start: Optional[date] = None) -> int:
+        """Precompute fn for each key over `days` days from start (today). Returns entries computed."""
+        start = start or self._today()
+        keys = list(keys)
+        for offset in range(days):
+            as_of = start + timedelta(days=offset)
+            for key in keys:
+                self(*key, as_of=as_of)
+        return len(keys) * days
+
+    def clear(self) -> None:
+        """Drop every cached day."""
+        with self._lock:
+            self._days.clear()
+
+    def __len__(self) -> int:
+        return sum(len(day) for day in tuple(self._days.values()))
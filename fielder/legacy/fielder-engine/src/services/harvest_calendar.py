@@ -0,0 +1,235 @@
+"""
+Harvest Calendar - Harvest windows for the whole catalog across many years.
+
+CultivarDatabase.predict_harvest_window() answers one (cultivar, region,
+year) at a time with date arithmetic per call. Multi-year planning needs
+every pair for every year, so HarvestCalendar computes them in one pass:
+
+- Each cultivar x region pair reduces to a method, a year shift (maturity
+  rolling into the next year) and four day offsets from January 1st -
+  window start/end and peak start/end - exactly as predict_harvest_window
+  derives them from bloom DOY + days to maturity, or from historical DOYs
+- A year's dates are then just Jan 1 (as a date ordinal) plus those
+  offsets, broadcast over pairs x years
+
+The result is a column table, one row per pair and year, with dates as
+proleptic ordinals (date.fromordinal) and cultivars, regions and quality
+tiers as small ints indexing cultivar_ids, region_ids and QUALITY_TIERS.
+With NumPy installed the table is a structured array (see .table) and the
+pass is vectorized; without it the same columns are stdlib arrays filled
+by a plain loop.
+
+    calendar = HarvestCalendar.build(db, range(2026, 2031))
+    calendar.window("washington_navel", "indian_river", 2027)
+    rows = calendar.rows_in_window(date(2027, 12, 15), peak=True)
+
+/api/whats-in-season/cultivars answers "which cultivars are in their
+window on this day" from it (AppServices.harvest_calendar);
+test_harvest_calendar.py checks both build paths against
+predict_harvest_window().
+
+Optional dependency: numpy (detected at import time).
+"""
+
+from array import array
+from datetime import date
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..models.cultivar_database import CultivarDatabase, QualityTier
+
+
+# How a row's window was derived
+METHOD_BLOOM = 1       # avg bloom peak DOY + cultivar days to maturity
+METHOD_HISTORICAL = 2  # historical harvest/peak DOYs
+
+QUALITY_TIERS = tuple(tier.value for tier in QualityTier)
+
+_DATE_COLUMNS = ("window_start", "window_end", "peak_start", "peak_end")
+
+# (column, NumPy dtype, array typecode)
+COLUMNS = (
+    ("cultivar", "i4", "i"),
+    ("region", "i4", "i"),
+    ("year", "i2", "h"),
+    ("method", "u1", "B"),
+    ("window_start", "i4", "i"),
+    ("window_end", "i4", "i"),
+    ("peak_start", "i4", "i"),
+    ("peak_end", "i4", "i"),
+    ("expected_peak_brix", "f8", "d"),  # NaN when not researched
+    ("quality_tier", "u1", "B"),
+)
+
+
+def _pair_offsets(cultivar, regional) -> Optional[tuple[int, int, tuple[int, int, int, int]]]:
+    """(method, year shift, date offsets from Jan 1) for a pair, or None without a window."""
+    if regional.avg_bloom_peak_doy and cultivar.days_to_maturity:
+        maturity_doy = regional.avg_bloom_peak_doy + cultivar.days_to_maturity
+        shift = 0
+        if maturity_doy > 365:
+            shift = 1
+            maturity_doy -= 365
+        day = maturity_doy - 1
+        return METHOD_BLOOM, shift, (day - 15, day + 30, day - 5, day + 15)
+
+    start_doy = regional.historical_harvest_start_doy
+    end_doy = regional.historical_harvest_end_doy
+    if start_doy and end_doy:
+        peak_start_doy = regional.historical_peak_start_doy or start_doy
+        peak_end_doy = regional.historical_peak_end_doy or end_doy
+        return METHOD_HISTORICAL, 0, (start_doy - 1, end_doy - 1, peak_start_doy - 1, peak_end_doy - 1)
+
+    return None
+
+
+class HarvestCalendar:
+    """Harvest windows for every cultivar x region pair over a range of years."""
+
+    def __init__(
+        self,
+        columns: dict,
+        cultivar_ids: list[str],
+        region_ids: list[str],
+        pairs: list[tuple[str, str]],
+        years: list[int],
+        table=None,
+        version: int = 0
+    ):
+        self.version = version  # Database version the calendar was built from
+        self.columns = columns
+        self.cultivar_ids = cultivar_ids
+        self.region_ids = region_ids
+        self.years = years
+        self.table = table  # Structured array when built with NumPy
+        # First row of each (cultivar, region) pair; its years follow in order
+        self._pair_rows = {pair: i * len(years) for i, pair in enumerate(pairs)}
+
+    @classmethod
+    def build(cls, db: CultivarDatabase, years: Iterable[int]) -> "HarvestCalendar":
+        years = sorted(set(years))
+        cultivar_ids: list[str] = []
+        region_ids: list[str] = []
+        cultivar_index: dict[str, int] = {}
+        region_index: dict[str, int] = {}
+        tiers = {tier: i for i, tier in enumerate(QualityTier)}
+
+        # Pack the per-pair inputs
+        pairs, pair_cols = [], []
+        for regional in db.regional_data.values():
+            cultivar = db.get_cultivar(regional.cultivar_id)
+            offsets = _pair_offsets(cultivar, regional) if cultivar else None
+            if offsets is None:
+                continue
+            method, shift, day_offsets = offsets
+            if regional.cultivar_id not in cultivar_index:
+                cultivar_index[regional.cultivar_id] = len(cultivar_ids)
+                cultivar_ids.append(regional.cultivar_id)
+            if regional.region_id not in region_index:
+                region_index[regional.region_id] = len(region_ids)
+                region_ids.append(regional.region_id)
+            brix = cultivar.research_peak_brix
+            pairs.append((regional.cultivar_id, regional.region_id))
+            pair_cols.append((
+                cultivar_index[regional.cultivar_id],
+                region_index[regional.region_id],
+                method,
+                shift,
+                day_offsets,
+                float("nan") if brix is None else brix,
+                tiers[cultivar.quality_tier],
+            ))
+
+        # Jan 1 ordinals for every year a window can fall in (maturity may roll over)
+        jan1 = [date(year, 1, 1).toordinal() for year in range(years[0], years[-1] + 2)] if years else []
+        year_slots = [year - years[0] for year in years]
+
+        if np is not None:
+            columns, table = cls._build_numpy(pair_cols, years, year_slots, jan1)
+        else:
+            columns, table = cls._build_arrays(pair_cols, years, year_slots, jan1), None
+        return cls(columns, cultivar_ids, region_ids, pairs, years, table, version=db.version)
+
+    @staticmethod
+    def _build_numpy(pair_cols, years, year_slots, jan1):
+        count, year_count = len(pair_cols), len(years)
+        table = np.empty(count * year_count, dtype=[(name, dtype) for name, dtype, _ in COLUMNS])
+        if count and year_count:
+            cultivar, region, method, shift, offsets, brix, tier = (list(col) for col in zip(*pair_cols))
+            offsets = np.array(offsets, dtype=np.int32)                              # pairs x 4
+            slots = np.array(year_slots)[None, :] + np.array(shift)[:, None]        # pairs x years
+            base = np.array(jan1, dtype=np.int32)[slots]
+            for i, name in enumerate(_DATE_COLUMNS):
+                table[name] = (base + offsets[:, i:i + 1]).ravel()
+            table["year"] = np.tile(np.array(years, dtype=np.int16), count)
+            for name, values in (
+                ("cultivar", cultivar), ("region", region), ("method", method),
+                ("expected_peak_brix", brix), ("quality_tier", tier),
+            ):
+                table[name] = np.repeat(np.array(values), year_count)
+        return {name: table[name] for name, _, _ in COLUMNS}, table
+
+    @staticmethod
+    def _build_arrays(pair_cols, years, year_slots, jan1):
+        columns = {name: array(typecode) for name, _, typecode in COLUMNS}
+        append = {name: column.append for name, column in columns.items()}
+        for cultivar, region, method, shift, offsets, brix, tier in pair_cols:
+            window_start, window_end, peak_start, peak_end = offsets
+            for year, slot in zip(years, year_slots):
+                base = jan1[slot + shift]
+                append["cultivar"](cultivar)
+                append["region"](region)
+                append["year"](year)
+                append["method"](method)
+                append["window_start"](base + window_start)
+                append["window_end"](base + window_end)
+                append["peak_start"](base + peak_start)
+                append["peak_end"](base + peak_end)
+                append["expected_peak_brix"](brix)
+                append["quality_tier"](tier)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.columns["year"])
+
+    def row(self, index: int) -> dict:
+        """One row with ids and dates decoded."""
+        columns = self.columns
+        brix = float(columns["expected_peak_brix"][index])
+        return {
+            "cultivar_id": self.cultivar_ids[columns["cultivar"][index]],
+            "region_id": self.region_ids[columns["region"][index]],
+            "year": int(columns["year"][index]),
+            "method": int(columns["method"][index]),
+            **{name: date.fromordinal(int(columns[name][index])) for name in _DATE_COLUMNS},
+            "expected_peak_brix": None if brix != brix else brix,
+            "quality_tier": QUALITY_TIERS[columns["quality_tier"][index]],
+        }
+
+    def window(self, cultivar_id: str, region_id: str, year: int) -> Optional[dict]:
+        """Same result as CultivarDatabase.predict_harvest_window() for a year in the calendar."""
+        first = self._pair_rows.get((cultivar_id, region_id))
+        if first is None or year not in self.years:
+            return None
+        row = self.row(first + self.years.index(year))
+        return {
+            "window_start": row["window_start"],
+            "window_end": row["window_end"],
+            "peak_start": row["peak_start"],
+            "peak_end": row["peak_end"],
+            "expected_peak_brix": row["expected_peak_brix"],
+            "quality_tier": row["quality_tier"],
+        }
+
+    def rows_in_window(self, day: date, peak: bool = False) -> list[int]:
+        """Indexes of rows whose harvest (or peak) window contains day."""
+        start, end = ("peak_start", "peak_end") if peak else ("window_start", "window_end")
+        ordinal = day.toordinal()
+        starts, ends = self.columns[start], self.columns[end]
+        if self.table is not None:
+            return np.flatnonzero((starts <= ordinal) & (ends >= ordinal)).tolist()
+        return [i for i in range(len(starts)) if starts[i] <= ordinal <= ends[i]]
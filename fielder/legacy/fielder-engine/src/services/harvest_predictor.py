@@ -12,6 +12,7 @@ from typing import Optional
 from ..models.crop import Cultivar, Rootstock, CITRUS_ROOTSTOCKS
 from ..models.weather import GDDAccumulation, DailyWeather, CITRUS_GDD_TARGETS
 from ..models.harvest import HarvestWindow
+from ..models.tree_age import age_brix_modifier
 
 
 @dataclass
@@ -56,23 +57,10 @@ class HarvestPredictor:
         - 8-18 yrs: 0.0 (prime - genetic potential realized)
         - 19-25 yrs: -0.2
         - >25 yrs: -0.3
+
+        Unknown ages assume prime (see models.tree_age).
         """
-        if tree_age_years is None:
-            return 0.0  # Assume prime if unknown
-
-        age = tree_age_years
-        if age <= 2:
-            return -0.8
-        elif age <= 4:
-            return -0.5
-        elif age <= 7:
-            return -0.2
-        elif age <= 18:
-            return 0.0  # Prime
-        elif age <= 25:
-            return -0.2
-        else:
-            return -0.3
+        return age_brix_modifier(tree_age_years)
 
     def calculate_timing_modifier(
         self,
@@ -0,0 +1,101 @@
+"""
+HTTP Response Cache - Precomputed bodies for catalog endpoints.
+
+Catalog data (regions, rootstocks, cultivars) only changes when the cultivar
+database or region registry is reloaded, yet every page load used to
+re-serialize it in full. This cache keeps the serialized body for each
+filter combination together with a content-versioned ETag, so repeated
+browser and CDN fetches cost a dict lookup (or a 304 with no body at all).
+
+Entries are keyed by (endpoint, filters) and tagged with the data version
+they were built from. A version change rebuilds the entry on next access.
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Hashable
+
+from . import metrics
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A serialized response body and its validators."""
+    body: bytes
+    etag: str
+    last_modified: datetime
+    version: Hashable
+    cache_name: str = field(default="response", compare=False, repr=False)
+    _variants: dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    def encoded(self, encoding: str, compress: Callable[[bytes, str], bytes]) -> bytes:
+        """Body compressed with the given Content-Encoding, computed once."""
+        body = self._variants.get(encoding)
+        metrics.record_cache(f"{self.cache_name}_compressed", hit=body is not None)
+        if body is None:
+            body = compress(self.body, encoding)
+            self._variants[encoding] = body
+        return body
+
+
+class ResponseBodyCache:
+    """
+    Version-aware cache of serialized response bodies.
+
+    Bounded to max_entries; the oldest entry is evicted first, which keeps
+    arbitrary query-string combinations from growing memory without limit.
+    Hits and misses are counted under the given cache name in /metrics.
+    """
+
+    def __init__(self, max_entries: int = 256, name: str = "response"):
+        self.max_entries = max_entries
+        self.name = name
+        self._entries: dict[Hashable, CachedBody] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        version: Hashable,
+        last_modified: datetime,
+        build: Callable[[], bytes]
+    ) -> CachedBody:
+        """
+        Return the cached body for key, building it if missing or stale.
+
+        build() is called without holding the lock; concurrent misses may
+        build twice, which is harmless since the result is identical.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            metrics.record_cache(self.name, hit=True)
+            return entry
+
+        metrics.record_cache(self.name, hit=False)
+        body = build()
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = CachedBody(
+            body=body,
+            etag=f"v{version}-{digest}",
+            last_modified=last_modified,
+            version=version,
+            cache_name=self.name,
+        )
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached body."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,201 @@
+"""
+Stage Timing Instrumentation - Where did the time go?
+
+When a prediction is slow we want to know whether the time went to
+phenology lookup, weather fetch, climatology fallback, the quality model
+or serialization. Code marks stages with a context manager:
+
+    with span("weather_fetch"):
+        observations = provider.get_historical(...)
+
+Spans are recorded against the timing for the current request (tracked
+with a ContextVar, so it is thread- and async-safe). Outside a timed
+request span() returns a shared no-op, so instrumented code costs one
+ContextVar lookup when timing is disabled.
+
+Finished request timings are folded into per-stage histograms that
+dashboards can read via stage_histograms().
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+STAGE_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class RequestTiming:
+    """Stage durations recorded during one request."""
+
+    __slots__ = ("stages", "started")
+
+    def __init__(self):
+        self.stages: dict[str, list] = {}  # name -> [total_seconds, count]
+        self.started = time.perf_counter()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one span's duration to a stage."""
+        stage = self.stages.get(name)
+        if stage is None:
+            self.stages[name] = [seconds, 1]
+        else:
+            stage[0] += seconds
+            stage[1] += 1
+
+    def total_ms(self) -> float:
+        """Wall time since the request started."""
+        return (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> dict:
+        """Stage timings for the debug response field."""
+        result = {
+            name: {"ms": round(seconds * 1000, 3), "count": count}
+            for name, (seconds, count) in self.stages.items()
+        }
+        result["total"] = {"ms": round(self.total_ms(), 3), "count": 1}
+        return result
+
+    def server_timing_header(self) -> str:
+        """Format as a Server-Timing header value."""
+        parts = [
+            f"{name};dur={seconds * 1000:.2f}"
+            for name, (seconds, _count) in self.stages.items()
+        ]
+        parts.append(f"total;dur={self.total_ms():.2f}")
+        return ", ".join(parts)
+
+
+class _Span:
+    """Times one stage and records it on exit."""
+
+    __slots__ = ("timing", "name", "start")
+
+    def __init__(self, timing: RequestTiming, name: str):
+        self.timing = timing
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timing.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoopSpan:
+    """Shared do-nothing span used when timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "fielder_request_timing", default=None
+)
+
+
+def span(name: str):
+    """Context manager timing a stage of the current request."""
+    timing = _current_timing.get()
+    if timing is None:
+        return _NOOP_SPAN
+    return _Span(timing, name)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """The timing for the current request, if one is being recorded."""
+    return _current_timing.get()
+
+
+def start_timing() -> Token:
+    """Begin recording stage timings for the current request."""
+    return _current_timing.set(RequestTiming())
+
+
+def finish_timing(token: Token) -> Optional[RequestTiming]:
+    """Stop recording, fold the stages into the histograms and return them."""
+    timing = _current_timing.get()
+    _current_timing.reset(token)
+    if timing is not None:
+        for name, (seconds, _count) in timing.stages.items():
+            _get_histogram(name).observe(seconds * 1000)
+    return timing
+
+
+# =============================================================================
+# AGGREGATED HISTOGRAMS
+# =============================================================================
+
+class StageHistogram:
+    """Cumulative-bucket histogram of one stage's per-request duration (ms)."""
+
+    def __init__(self, buckets: tuple = STAGE_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Final slot is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        """Record one observation."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum_ms += value_ms
+
+    def snapshot(self) -> dict:
+        """Cumulative bucket counts, Prometheus-style."""
+        with self._lock:
+            counts = list(self.counts)
+            count, sum_ms = self.count, self.sum_ms
+
+        cumulative = []
+        running = 0
+        for bound, n in zip(list(self.buckets) + ["+Inf"], counts):
+            running += n
+            cumulative.append({"le": bound, "count": running})
+
+        return {
+            "count": count,
+            "sum_ms": round(sum_ms, 3),
+            "mean_ms": round(sum_ms / count, 3) if count else 0.0,
+            "buckets": cumulative,
+        }
+
+
+_histograms: dict[str, StageHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def _get_histogram(name: str) -> StageHistogram:
+    histogram = _histograms.get(name)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(name, StageHistogram())
+    return histogram
+
+
+def stage_histograms() -> dict[str, dict]:
+    """Snapshot of every stage histogram, keyed by stage name."""
+    return {name: h.snapshot() for name, h in sorted(_histograms.items())}
+
+
+def reset_histograms() -> None:
+    """Clear aggregated histograms (for tests/benchmarks)."""
+    with _histograms_lock:
+        _histograms.clear()
@@ -0,0 +1,328 @@
+"""
+Metrics Registry - Counters and histograms in Prometheus text format.
+
+The app runs behind a load balancer with no other visibility into how
+often we call Open-Meteo, how long those calls take, how often caches
+hit, or how often predictions fall back to climatology. Services record
+into the module-level metrics below and app.py serves render() at
+/metrics.
+
+Recording is a tuple build plus a short critical section per call, cheap
+enough for the prediction hot path. Label values must come from small,
+fixed sets (route rules, cache tier names, HTTP statuses) - never from
+user input.
+"""
+
+import threading
+from typing import Optional
+
+from . import instrumentation
+
+
+# Latency bucket upper bounds in seconds (last bucket is +Inf)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    """Render {name="value",...} (empty string when there are no labels)."""
+    parts = [
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(labelnames, values)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Shared label handling for every metric type."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(labels[name] for name in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def total(self) -> float:
+        """Sum across every label combination."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (last write wins)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> Optional[float]:
+        return self._values.get(self._key(labels))
+
+    render = Counter.render
+
+
+class Histogram(_Metric):
+    """Bucketed distribution with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [per-bucket counts (+Inf last), count, sum]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            state[0][index] += 1
+            state[1] += 1
+            state[2] += value
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, ([*counts], count, total)) for key, (counts, count, total) in self._values.items())
+
+        lines = self.header()
+        for key, (counts, count, total) in items:
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {running}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Every registered metric in Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        lines.extend(_render_stage_histograms())
+        return "\n".join(lines) + "\n"
+
+
+def _render_stage_histograms() -> list[str]:
+    """Expose the per-stage timing histograms (recorded in ms) in seconds."""
+    stages = instrumentation.stage_histograms()
+    if not stages:
+        return []
+
+    name = "fielder_stage_duration_seconds"
+    lines = [
+        f"# HELP {name} Time spent in each prediction stage per request.",
+        f"# TYPE {name} histogram",
+    ]
+    for stage, snapshot in stages.items():
+        for bucket in snapshot["buckets"]:
+            le = "+Inf" if bucket["le"] == "+Inf" else _format_value(bucket["le"] / 1000)
+            lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {bucket["count"]}')
+        lines.append(f'{name}_sum{{stage="{stage}"}} {_format_value(snapshot["sum_ms"] / 1000)}')
+        lines.append(f'{name}_count{{stage="{stage}"}} {snapshot["count"]}')
+    return lines
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+
+# =============================================================================
+# FIELDER METRICS
+# =============================================================================
+
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "fielder_upstream_requests_total",
+    "Calls to upstream weather APIs by endpoint and status.",
+    ("endpoint", "status"),
+)
+
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    "fielder_upstream_request_duration_seconds",
+    "Upstream weather API call latency.",
+    ("endpoint",),
+)
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "fielder_cache_requests_total",
+    "Cache lookups by cache tier and result (hit/miss).",
+    ("cache", "result"),
+)
+
+WEATHER_FALLBACKS = REGISTRY.counter(
+    "fielder_weather_fallback_total",
+    "Predictions that could not use observed weather (climatology/unavailable).",
+    ("predictor", "path"),
+)
+
+PREDICTIONS = REGISTRY.counter(
+    "fielder_predictions_total",
+    "Harvest predictions computed, by predictor.",
+    ("predictor",),
+)
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "fielder_http_requests_total",
+    "HTTP requests served by route, method and status code.",
+    ("route", "method", "status"),
+)
+
+HTTP_LATENCY = REGISTRY.histogram(
+    "fielder_http_request_duration_seconds",
+    "Time to produce a response, by route.",
+    ("route",),
+)
+
+CULTIVAR_DB_LOAD_SECONDS = REGISTRY.gauge(
+    "fielder_cultivar_db_load_seconds",
+    "Time taken by the last cultivar database load.",
+)
+
+CULTIVAR_DB_IMAGE_BYTES = REGISTRY.gauge(
+    "fielder_cultivar_db_image_bytes",
+    "Size of the shared cultivar database image (when enabled).",
+)
+
+CULTIVAR_DB_RECORDS = REGISTRY.gauge(
+    "fielder_cultivar_db_records",
+    "Records in the loaded cultivar database by kind.",
+    ("kind",),
+)
+
+CULTIVAR_DB_VERSION = REGISTRY.gauge(
+    "fielder_cultivar_db_version",
+    "Version number of the cultivar database in service.",
+)
+
+CULTIVAR_DB_RELOADS = REGISTRY.counter(
+    "fielder_cultivar_db_reloads_total",
+    "Cultivar database reloads by outcome (swapped/unchanged/rejected/failed).",
+    ("outcome",),
+)
+
+CULTIVAR_DB_IMPORTS = REGISTRY.counter(
+    "fielder_cultivar_db_imports_total",
+    "Research file imports into the cultivar database by outcome (swapped/unchanged/rejected/failed).",
+    ("outcome",),
+)
+
+STATUS_SUBSCRIBERS = REGISTRY.gauge(
+    "fielder_status_stream_subscribers",
+    "Open harvest status stream connections.",
+)
+
+STATUS_TRANSITIONS = REGISTRY.counter(
+    "fielder_status_transitions_total",
+    "Harvest status transitions published to the status stream.",
+)
+
+RATE_LIMITED = REGISTRY.counter(
+    "fielder_rate_limited_total",
+    "Requests rejected with 429 by the per-client rate limiter, by budget.",
+    ("budget",),
+)
+
+OUTBOUND_IN_FLIGHT = REGISTRY.gauge(
+    "fielder_outbound_weather_in_flight",
+    "Upstream weather fetches currently holding an outbound slot.",
+)
+
+OUTBOUND_REJECTED = REGISTRY.counter(
+    "fielder_outbound_weather_rejected_total",
+    "Upstream weather fetches refused by the outbound cap (queue_full/timeout).",
+    ("reason",),
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one lookup against a cache tier."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
@@ -0,0 +1,128 @@
+"""
+Full-Catalog Prediction Export.
+
+Downstream consumers (the TypeScript app, n8n workflows, analytics) want
+every cultivar x region prediction daily. Rather than building one giant
+list in memory, predictions are yielded one at a time as newline-delimited
+JSON (NDJSON). Memory holds one record at a time plus the sorted list of
+"cultivar_id:region_id" keys, so it grows with the number of pairs rather
+than with the size of the export.
+
+Each record carries a resume token. Passing the last token seen back in
+restarts the export immediately after that record, so an interrupted
+download can pick up where it left off.
+"""
+
+import base64
+import binascii
+from datetime import date
+from typing import Any, Callable, Iterator, Optional
+
+from ..models.cultivar_database import CultivarDatabase
+from ..models.region import US_GROWING_REGIONS
+from . import serialization
+from .cultivar_predictor import CultivarPredictor
+
+
+def encode_resume_token(cultivar_id: str, region_id: str) -> str:
+    """Encode a (cultivar, region) position as an opaque resume token."""
+    key = f"{cultivar_id}:{region_id}"
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_resume_token(token: str) -> str:
+    """
+    Decode a resume token back to its "cultivar_id:region_id" key.
+
+    Raises ValueError for malformed tokens.
+    """
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        key = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid resume token: {token}") from e
+    if ":" not in key:
+        raise ValueError(f"Invalid resume token: {token}")
+    return key
+
+
+class PredictionExporter:
+    """
+    Streams regional-average predictions for every cultivar x region pair.
+
+    Pairs are visited in sorted "cultivar_id:region_id" order so that
+    resume tokens stay valid across database reloads: resuming skips
+    every key at or before the token, even if that record was removed.
+    """
+
+    def __init__(
+        self,
+        database: CultivarDatabase,
+        predictor: Optional[CultivarPredictor] = None
+    ):
+        self.db = database
+        self.predictor = predictor or CultivarPredictor()
+
+    def iter_predictions(
+        self,
+        crop_type: Optional[str] = None,
+        region_id: Optional[str] = None,
+        cultivar_id: Optional[str] = None,
+        resume_token: Optional[str] = None,
+        today: Optional[date] = None,
+        fields: Optional[frozenset] = None,
+        compact: bool = False
+    ) -> Iterator[dict]:
+        """
+        Yield one prediction dict per cultivar x region pair.
+
+        Filters are applied before any prediction work is done. Pairs whose
+        cultivar or region is unknown are skipped, matching the errors
+        /predict/cultivar would return for them. fields and compact select
+        a sparse record as in CultivarPredictor.predict (the resume token
+        is always included).
+        """
+        if today is None:
+            today = date.today()
+        resume_after = decode_resume_token(resume_token) if resume_token else None
+
+        # The sorted key list is the one per-pair allocation of the export
+        for key in sorted(self.db.regional_data):
+            if resume_after is not None and key <= resume_after:
+                continue
+
+            regional = self.db.regional_data[key]
+            if cultivar_id and regional.cultivar_id != cultivar_id:
+                continue
+            if region_id and regional.region_id != region_id:
+                continue
+
+            cultivar = self.db.get_cultivar(regional.cultivar_id)
+            region = US_GROWING_REGIONS.get(regional.region_id)
+            if cultivar is None or region is None:
+                continue
+            if crop_type and cultivar.crop_type != crop_type:
+                continue
+
+            record = self.predictor.predict(
+                cultivar, regional, region, today=today, fields=fields, compact=compact
+            )
+            record["resume_token"] = encode_resume_token(
+                regional.cultivar_id, regional.region_id
+            )
+            yield record
+
+    def iter_ndjson(
+        self,
+        default: Optional[Callable[[Any], Any]] = None,
+        sort_keys: bool = True,
+        **filters
+    ) -> Iterator[bytes]:
+        """
+        Yield predictions as newline-terminated UTF-8 JSON lines.
+
+        Encoded with serialization.dumps, like API responses: pass the app's
+        JSON default hook so dates in a record come out as they do there.
+        """
+        for record in self.iter_predictions(**filters):
+            yield serialization.dumps(record, sort_keys=sort_keys, default=default) + b"\n"
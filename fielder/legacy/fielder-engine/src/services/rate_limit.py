@@ -0,0 +1,160 @@
+"""
+Rate Limiting - Per-client admission control and an outbound weather cap.
+
+Our Open-Meteo budget is shared by every client. One integration partner
+looping over /predict/cultivar with many planting dates could exhaust it
+and make everyone else wait behind their upstream calls.
+
+Two layers:
+
+- RateLimiter: token buckets per (client, budget). Requests that can be
+  answered from cached data and requests that need upstream weather draw
+  from separate budgets, so catalog browsing is not throttled by the
+  client's own prediction traffic (or the other way round).
+- OutboundLimiter: one process-wide cap on concurrent upstream weather
+  fetches. Callers queue for a slot up to a wait timeout; when the queue
+  is already full they fail immediately with UpstreamBusy, which the app
+  turns into a 429 instead of letting latency climb for everyone.
+
+    limiter = RateLimiter({"cached": (20, 40), "upstream": (2, 10)})
+    retry_after = limiter.check(client_id, "upstream", cost=3)  # None = admitted
+
+    outbound = OutboundLimiter(max_concurrent=8, max_waiting=32)
+    with outbound.slot():
+        fetch()
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from . import metrics
+
+
+class UpstreamBusy(Exception):
+    """Raised when no outbound weather slot is available in time."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Upstream weather capacity exhausted")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Refills at rate tokens/second up to burst; starts full."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, cost: float, now: float) -> float:
+        """Take cost tokens. Returns 0 when admitted, else seconds until enough tokens."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (cost - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Token buckets per (client, budget).
+
+    budgets maps a budget name to (tokens per second, burst). Buckets for
+    the least recently seen clients are dropped beyond max_clients (a
+    dropped client simply starts again with a full bucket).
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, tuple[float, float]],
+        max_clients: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.budgets = dict(budgets)
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, client: str, budget: str, cost: float = 1) -> Optional[float]:
+        """
+        Charge cost to client's budget. Returns None if admitted, else Retry-After seconds.
+
+        Costs above the burst are capped to it, so one large request needs a
+        full bucket rather than never being admitted.
+        """
+        rate, burst = self.budgets[budget]
+        cost = min(cost, burst)
+        key = (client, budget)
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst, now)
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            wait = bucket.take(cost, now)
+
+        if wait:
+            metrics.RATE_LIMITED.inc(budget=budget)
+            return wait
+        return None
+
+
+class OutboundLimiter:
+    """Process-wide cap on concurrent upstream calls with a bounded wait queue."""
+
+    def __init__(self, max_concurrent: int = 8, max_waiting: int = 32, wait_timeout: float = 2.0):
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._in_flight = 0
+
+    @contextmanager
+    def slot(self):
+        """Hold one outbound slot; raises UpstreamBusy if the queue is full or the wait times out."""
+        with self._lock:
+            if self._waiting >= self.max_waiting:
+                metrics.OUTBOUND_REJECTED.inc(reason="queue_full")
+                raise UpstreamBusy(self.wait_timeout)
+            self._waiting += 1
+        try:
+            acquired = self._slots.acquire(timeout=self.wait_timeout)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        if not acquired:
+            metrics.OUTBOUND_REJECTED.inc(reason="timeout")
+            raise UpstreamBusy(self.wait_timeout)
+
+        with self._lock:
+            self._in_flight += 1
+            metrics.OUTBOUND_IN_FLIGHT.set(self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                metrics.OUTBOUND_IN_FLIGHT.set(self._in_flight)
+            self._slots.release()
+
+    def status(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+        }
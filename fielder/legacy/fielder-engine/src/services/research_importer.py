@@ -0,0 +1,715 @@
+"""
+Research Importer - Cultivar records from the research JSON files.
+
+DataLoader only knows the cultivars written into it by hand. The files in
+data/research (extension-service cultivar lists, seed-company catalogs,
+the knowledge graphs) describe many more. ResearchImporter maps them into
+CultivarResearch / RegionalBloomData records and applies them to a
+database incrementally:
+
+- Each file is read whole and parsed with json.loads (the largest, the
+  v3 knowledge graph, is about 4 MB); an adapter then maps the parsed
+  document to partial records. A file whose content hash is the same as
+  at the last import is hashed but not parsed again
+- Partial records for the same cultivar (same crop, same name) merge in
+  RESEARCH_SOURCES order: the first source to give a field wins, list
+  fields are unioned
+- diff(db) compares the content hash of each merged record with the
+  record in db; ImportDiff.apply() adds or replaces only the records that
+  differ and removes imported records that no file provides any more
+
+Imported records are recognized by their source ("research/<file name>"
+in research_sources / data_source). Hand-curated DataLoader records
+always win: an incoming record that collides with one is reported and
+left out. Source crop groups map to engine crop ids (UF/IFAS "grapefruit"
+-> grapefruit, sweet oranges -> valencia_orange / navel_orange, ...), and
+records of crops the engine doesn't know (no region grows them, no
+curated cultivar has them) are skipped and counted, never imported as a
+new crop type. Generic listings ("Strawberries (general)", "Satsuma",
+sprout/microgreen seed) are not cultivars and are dropped. A file that fails to parse keeps contributing what it gave at
+its last successful parse, and records only it provided are not removed.
+
+Regional data is only produced for engine regions (US_GROWING_REGIONS).
+The sources are Florida-focused, so USDA zones 9 and 10 stand for
+central_florida and south_florida.
+
+    importer = ResearchImporter("fielder/data/research")
+    diff = importer.diff(db)
+    diff.apply(db)
+"""
+
+import calendar
+import hashlib
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from ..models.cultivar_database import (
+    CultivarDatabase,
+    CultivarResearch,
+    QualityTier,
+    RegionalBloomData,
+)
+from ..models.region import US_GROWING_REGIONS
+
+
+# research_sources / data_source entry of an imported record: prefix + file name
+IMPORT_SOURCE_PREFIX = "research/"
+
+# USDA zone -> engine region, for the Florida sources
+FLORIDA_ZONE_REGIONS = {"9": "central_florida", "10": "south_florida"}
+
+# Crop and category names in the files -> engine crop types
+_CROP_TYPES = {
+    "tomatoes": "tomato",
+    "peppers": "pepper",
+    "beans": "bean",
+    "beets": "beet",
+    "carrots": "carrot",
+    "melons": "melon",
+    # UF/IFAS citrus groups. Round sweet oranges (Hamlin, Valencia types)
+    # are the engine's valencia_orange; navels and satsumas are picked out
+    # by name (_CITRUS_NAME_CROP_TYPES)
+    "sweet_oranges": "valencia_orange",
+    "grapefruit": "grapefruit",
+    "mandarins": "tangerine",
+    "tangelos": "tangerine",
+    "lemons_limes": "lemon_lime",
+}
+
+# Word in a citrus cultivar's name -> its engine crop ("Owari Satsuma")
+_CITRUS_NAME_CROP_TYPES = {"navel": "navel_orange", "satsuma": "satsuma"}
+
+# Crops every region can be asked about; with the curated crops, the crops
+# an import may add cultivars to
+REGION_CROP_TYPES = frozenset(
+    crop for region in US_GROWING_REGIONS.values() for crop in region.viable_crops
+)
+
+_TIMING_CLASSES = {"early_season": "early", "midseason": "mid", "late_season": "late"}
+
+_HERITAGE_INTENTS = {"true_heritage", "heirloom_quality"}
+
+_CULTIVAR_FIELDS = {f.name for f in fields(CultivarResearch)}
+_REGIONAL_FIELDS = {f.name for f in fields(RegionalBloomData)}
+
+_WORD = re.compile(r"[a-z0-9]+")
+_PARENTHESIZED = re.compile(r"\([^)]*\)")
+_LEADING_QUALIFIER = re.compile(r"^\([^)]*\)\s*(?:-\s*)?")  # "(Hard Neck) ", "(Soft Neck) - "
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_MONTH_NAMES = sorted(
+    {name.lower() for name in calendar.month_name[1:]} | {name.lower() for name in calendar.month_abbr[1:]} | {"sept"},
+    key=len,
+    reverse=True,
+)
+_MONTH = re.compile(r"\b(" + "|".join(_MONTH_NAMES) + r")\b\.?(?:\s+(\d{1,2})\b)?", re.I)
+_MONTH_DAYS = re.compile(_MONTH.pattern + r"\s*[-–]\s*(\d{1,2})\b", re.I)
+_RANGE_SEPARATOR = re.compile(r"\s+(?:[-–—]|to)\s+|[–—]")
+
+_MONTHS = {name[:3].lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+
+# =============================================================================
+# FIELD PARSING
+# =============================================================================
+
+def _slug(text: str) -> str:
+    """"Sugar Belle (LB8-9)" -> "sugar_belle_lb8_9"."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return "_".join(_WORD.findall(text.lower().replace("'", "")))
+
+
+def _name_key(name: str) -> str:
+    """Key two sources' names of one cultivar share ("Sugar Belle (LB8-9)" -> "sugar_belle")."""
+    return _slug(_PARENTHESIZED.sub(" ", name)) or _slug(name)
+
+
+def _crop_type(name: str) -> str:
+    slug = _slug(name)
+    return _CROP_TYPES.get(slug, slug)
+
+
+def _is_listing(record: dict) -> bool:
+    """A generic listing rather than a cultivar ("Strawberries (general)", "Satsuma", "Tangelo")."""
+    name = record["cultivar_name"]
+    name_key = _name_key(name)
+    return (
+        "general" in name.lower()
+        or name_key in ("", record["crop_type"])
+        or name_key in _CITRUS_NAME_CROP_TYPES  # Only names a crop
+        or f"{name_key}s" in _CROP_TYPES  # A source group, singular
+    )
+
+
+def _region_id(text: Optional[str]) -> Optional[str]:
+    """Engine region named by text ("South Florida" -> "south_florida"), if any."""
+    if not isinstance(text, str):
+        return None
+    region_id = _slug(text)
+    return region_id if region_id in US_GROWING_REGIONS else None
+
+
+def _zone_region(zone: str) -> Optional[str]:
+    """Engine region of a Florida USDA zone ("zone:10", "10b" -> "south_florida")."""
+    match = re.search(r"\d+", str(zone))
+    return FLORIDA_ZONE_REGIONS.get(match.group()) if match else None
+
+
+def _range(value) -> Optional[tuple[float, float]]:
+    """(low, high) from 80, "53-55" or "70-75 days" (None without a number)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value, value
+    if isinstance(value, dict):
+        return _range(value.get("consensus"))
+    numbers = [float(n) for n in _NUMBER.findall(value)] if isinstance(value, str) else []
+    if not numbers:
+        return None
+    return numbers[0], numbers[1] if len(numbers) > 1 else numbers[0]
+
+
+def _days_fields(value) -> dict:
+    days = _range(value)
+    if days is None:
+        return {}
+    low, high = int(days[0]), int(days[1])
+    if low == high:
+        return {"days_to_maturity": low}
+    return {"days_to_maturity": round((low + high) / 2), "days_to_maturity_range": (low, high)}
+
+
+def _brix_fields(value) -> dict:
+    brix = _range(value)
+    if brix is None:
+        return {}
+    low, high = float(brix[0]), float(brix[1])
+    return {
+        "research_brix_range": (low, high),
+        "research_peak_brix": high,
+        "research_avg_brix": round((low + high) / 2, 1),
+    }
+
+
+def _quality_tier(value) -> Optional[QualityTier]:
+    try:
+        return QualityTier(str(value).lower())
+    except ValueError:
+        return None
+
+
+def _timing_class(text) -> Optional[str]:
+    """"early-season producer" -> "early" ("late midseason" is late)."""
+    if not isinstance(text, str):
+        return None
+    text = text.lower()
+    for timing_class in ("early", "late", "mid"):
+        if timing_class in text:
+            return timing_class
+    return None
+
+
+def _doy(month: int, day: int) -> int:
+    return sum(calendar.mdays[1:month]) + day  # Non-leap year, like the curated DOYs
+
+
+def _month_end(month: int) -> int:
+    return _doy(month, calendar.mdays[month])
+
+
+def _window(text) -> Optional[tuple[int, int]]:
+    """
+    (start DOY, end DOY) of the first date range in text, or None.
+
+    "September 25 - October 25", "Aug - Sept; Jan - Feb" (first range only),
+    "October 10-20", "December" (the whole month). A window may wrap past
+    the new year (start > end), as curated windows do.
+    """
+    if not isinstance(text, str):
+        return None
+    segment = text.split(";")[0]
+    match = _MONTH_DAYS.search(segment)
+    if match:
+        month = _MONTHS[match.group(1)[:3].lower()]
+        return _doy(month, int(match.group(2))), _doy(month, int(match.group(3)))
+
+    ends = [_MONTH.search(part) for part in _RANGE_SEPARATOR.split(segment, maxsplit=1)]
+    if not all(ends):
+        return None
+    start, end = ends[0], ends[-1]
+    start_month, end_month = _MONTHS[start.group(1)[:3].lower()], _MONTHS[end.group(1)[:3].lower()]
+    return (
+        _doy(start_month, int(start.group(2) or 1)),
+        _doy(end_month, int(end.group(2))) if end.group(2) else _month_end(end_month),
+    )
+
+
+def _month_window(months: list) -> Optional[tuple[int, int]]:
+    """(start DOY, end DOY) of the first run of consecutive months (numbers or names)."""
+    numbers = [m if isinstance(m, int) else _MONTHS.get(str(m)[:3].lower()) for m in months]
+    numbers = [m for m in numbers if m]
+    if not numbers:
+        return None
+    end = numbers[0]
+    for month in numbers[1:]:
+        if month != end % 12 + 1:
+            break
+        end = month
+    return _doy(numbers[0], 1), _month_end(end)
+
+
+def _window_fields(window: Optional[tuple[int, int]], start: str, end: str) -> dict:
+    return {start: window[0], end: window[1]} if window else {}
+
+
+def _heritage_fields(intent) -> dict:
+    return {"is_heritage": True} if intent in _HERITAGE_INTENTS else {}
+
+
+# =============================================================================
+# SOURCE ADAPTERS
+# =============================================================================
+
+# Each adapter takes a parsed file and yields partial records: dicts with
+# cultivar_name, crop_type, any other CultivarResearch fields, and
+# "regions" mapping region_id -> RegionalBloomData fields.
+
+
+def _entries(node, key: str) -> Iterator[dict]:
+    """Every dict under node that has key."""
+    if isinstance(node, dict):
+        if key in node:
+            yield node
+            return
+        node = list(node.values())
+    if isinstance(node, list):
+        for item in node:
+            yield from _entries(item, key)
+
+
+def ufifas_records(doc: dict) -> Iterator[dict]:
+    """UF/IFAS Florida cultivar recommendations (cultivar_data -> crop -> nested groups)."""
+    for crop, data in doc.get("cultivar_data", {}).items():
+        planting = data.get("planting_windows", {})
+        yield from _ufifas_walk(data.get("cultivars"), _crop_type(crop), planting, {})
+
+
+def _ufifas_walk(node, crop_type: str, planting: dict, context: dict) -> Iterator[dict]:
+    if isinstance(node, list):
+        for item in node:
+            if isinstance(item, str) and context.get("names"):
+                yield _ufifas_cultivar({"name": item}, crop_type, planting, context)
+            else:
+                yield from _ufifas_walk(item, crop_type, planting, context)
+        return
+    if not isinstance(node, dict):
+        return
+    if isinstance(node.get("name"), str):
+        yield _ufifas_cultivar(node, crop_type, planting, context)
+        return
+
+    if isinstance(node.get("region"), str):
+        context = {**context, "region": node["region"]}
+    for key, value in node.items():
+        if key == "rootstock_recommendations":
+            continue
+        sub_context = {**context, "names": key.endswith("varieties")}
+        if key in _TIMING_CLASSES:
+            sub_context["timing_class"] = _TIMING_CLASSES[key]
+        if key == "heirloom_varieties":
+            sub_context["is_heirloom"] = True
+        sub_crop_type = _CROP_TYPES.get(key, crop_type) if crop_type == "citrus" else crop_type
+        sub_context["citrus"] = context.get("citrus") or crop_type == "citrus"
+        yield from _ufifas_walk(value, sub_crop_type, planting, sub_context)
+
+
+def _ufifas_cultivar(entry: dict, crop_type: str, planting: dict, context: dict) -> dict:
+    if context.get("citrus"):
+        words = _name_key(entry["name"]).split("_")
+        crop_type = next((crop for word, crop in _CITRUS_NAME_CROP_TYPES.items() if word in words), crop_type)
+    record = {"cultivar_name": entry["name"], "crop_type": crop_type}
+    timing_class = context.get("timing_class") or _timing_class(entry.get("maturity"))
+    if timing_class:
+        record["timing_class"] = timing_class
+    if "day" in str(entry.get("maturity", "")):
+        record.update(_days_fields(entry["maturity"]))
+    if context.get("is_heirloom"):
+        record["is_heirloom"] = True
+    if isinstance(entry.get("flavor_profile"), str):
+        record["flavor_profile"] = entry["flavor_profile"]
+    if isinstance(entry.get("release_year"), int):
+        record["year_introduced"] = entry["release_year"]
+
+    region_id = _region_id(entry.get("best_region")) or _region_id(context.get("region"))
+    if region_id:
+        plant = _window(entry.get("planting_window")) or _window(planting.get(region_id))
+        regional = {
+            **_window_fields(plant, "recommended_plant_start_doy", "recommended_plant_end_doy"),
+            **_window_fields(_window(entry.get("harvest_timing")),
+                             "historical_harvest_start_doy", "historical_harvest_end_doy"),
+            **_window_fields(_window(entry.get("peak_harvest")),
+                             "historical_peak_start_doy", "historical_peak_end_doy"),
+        }
+        if regional:
+            record["regions"] = {region_id: regional}
+    return record
+
+
+def cornell_records(doc: dict) -> Iterator[dict]:
+    """Cornell vegetable variety trials (cultivars -> category -> entries)."""
+    for category, node in doc.get("cultivars", {}).items():
+        for entry in _entries(node, "cultivarName"):
+            record = {"cultivar_name": entry["cultivarName"], "crop_type": _crop_type(category)}
+            record.update(_days_fields(entry.get("daysToMaturity")))
+            record.update(_heritage_fields(entry.get("heritageIntent")))
+            tier = _quality_tier(entry.get("qualityTier"))
+            if tier:
+                record["quality_tier"] = tier
+            yield record
+
+
+def knowledge_graph_records(doc: dict) -> Iterator[dict]:
+    """Knowledge graph cultivars, their Florida zone timings and SeedsNow listings."""
+    entities = doc.get("entities") or {}
+    records = {}
+    for entry in (entities.get("cultivars") or {}).values():
+        quality = entry.get("qualityPotential") or {}
+        growing = entry.get("growingRequirements") or {}
+        attributes = entry.get("attributes") or {}
+        record = {"cultivar_name": entry["name"], "crop_type": _crop_type(entry["product"])}
+        record.update(_brix_fields(quality.get("brixRange")))
+        record.update(_days_fields(growing.get("daysToMaturity")))
+        record.update(_heritage_fields(entry.get("heritageIntent")))
+        tier = _quality_tier(quality.get("qualityTier"))
+        if tier:
+            record["quality_tier"] = tier
+        if attributes.get("isHeirloom"):
+            record["is_heirloom"] = True
+        if isinstance(attributes.get("flavor"), str):
+            record["flavor_profile"] = attributes["flavor"]
+        if isinstance(growing.get("gddRequirement"), int):
+            record["gdd_to_maturity"] = growing["gddRequirement"]
+        records[entry.get("id")] = record
+
+    for timing in ((doc.get("relationships") or {}).get("cultivarTiming") or {}).values():
+        record = records.get(timing.get("cultivar"))
+        region_id = _zone_region(timing.get("zone", ""))
+        if record is None or region_id is None:
+            continue
+        planting = (timing.get("plantingWindow") or {}).get("windows") or [{}]
+        harvest = (timing.get("harvestWindow") or {}).get("windows") or [{}]
+        regional = {
+            **_window_fields(_month_window(planting[0].get("months", [])),
+                             "recommended_plant_start_doy", "recommended_plant_end_doy"),
+            **_window_fields(_month_window(harvest[0].get("months", [])),
+                             "historical_harvest_start_doy", "historical_harvest_end_doy"),
+            **_window_fields(_month_window(harvest[0].get("peakMonths", [])),
+                             "historical_peak_start_doy", "historical_peak_end_doy"),
+        }
+        if regional:
+            record.setdefault("regions", {}).setdefault(region_id, regional)
+    yield from records.values()
+
+    for entry in (entities.get("seedsnowCultivars") or {}).values():
+        if entry.get("isFlower") or entry.get("cropType") in ("other", "flower", None):
+            continue
+        name = "".join(ch for ch in entry["commonName"] if unicodedata.category(ch) != "So")  # Emoji badges
+        name = re.sub(r"\s+seeds$", "", name.strip(), flags=re.I)
+        product, separator, variety = name.partition(" - ")  # "Tomato - Roma (Determinate)"
+        if separator:
+            name = variety
+        if "microgreen" in product.lower() or "sprouting" in str(entry.get("productType")).lower():
+            continue  # Sprouting seed, named after the crop it sprouts
+        crop_type = entry["cropType"]
+        if crop_type == "sprouts":
+            crop_type = product  # "Brussels Sprouts - Long Island Catskill"
+        record = {
+            "cultivar_name": _LEADING_QUALIFIER.sub("", name).strip(),
+            "crop_type": _crop_type(crop_type),
+            "optimal_usda_zones": list(entry.get("zones") or []),
+        }
+        record.update(_days_fields(entry.get("daysToMaturity")))
+        yield record
+
+
+def knowledge_graph_sample_records(doc: dict) -> Iterator[dict]:
+    """Sample knowledge graph (sample_entities.cultivars with flat properties)."""
+    for entry in (doc.get("sample_entities") or {}).get("cultivars", {}).values():
+        properties = entry.get("properties") or {}
+        record = {"cultivar_name": entry["name"], "crop_type": _crop_type(properties["productType"])}
+        record.update(_brix_fields(properties.get("brixRange")))
+        record.update(_days_fields(properties.get("daysToMaturity")))
+        record.update(_heritage_fields(properties.get("heritageIntent")))
+        tier = _quality_tier(properties.get("qualityTier"))
+        if tier:
+            record["quality_tier"] = tier
+        if isinstance(properties.get("flavorProfile"), str):
+            record["flavor_profile"] = properties["flavorProfile"]
+        if isinstance(properties.get("gddRequirement"), int):
+            record["gdd_to_maturity"] = properties["gddRequirement"]
+        yield record
+
+
+def seed_company_records(doc: dict) -> Iterator[dict]:
+    """Seed-company Florida catalogs (Burpee zone windows, Mary's Florida timings, Johnny's)."""
+    for entry in doc.get("cultivars", []):
+        record = {"cultivar_name": entry["cultivarName"], "crop_type": _crop_type(entry["crop"])}
+        record.update(_days_fields(entry.get("daysToMaturity")))
+        if entry.get("isHeirloom"):
+            record["is_heirloom"] = True
+
+        regions = {}
+        for zone, timing in (entry.get("zones") or {}).items():
+            region_id = _zone_region(zone)
+            if region_id is None:
+                continue
+            plant = timing.get("plantingWindow") or {}
+            harvest = timing.get("harvestWindow") or {}
+            regions[region_id] = {
+                **_window_fields(_window(f"{plant.get('start')} - {plant.get('end')}"),
+                                 "recommended_plant_start_doy", "recommended_plant_end_doy"),
+                **_window_fields(_window(f"{harvest.get('start')} - {harvest.get('end')}"),
+                                 "historical_harvest_start_doy", "historical_harvest_end_doy"),
+            }
+        for timing in entry.get("floridaTimings") or []:
+            region_id = _region_id(timing.get("region"))
+            if region_id is not None:
+                regions.setdefault(region_id, _window_fields(
+                    _month_window(timing.get("plantingMonths") or []),
+                    "recommended_plant_start_doy", "recommended_plant_end_doy",
+                ))
+        regions = {region_id: regional for region_id, regional in regions.items() if regional}
+        if regions:
+            record["regions"] = regions
+        yield record
+
+
+# (file name, adapter), highest precedence first. Not imported: the raw
+# SeedsNow export (the v3 knowledge graph carries it normalized), the
+# perennial species lists (species, not cultivars) and measurement files.
+RESEARCH_SOURCES: tuple[tuple[str, Callable[[dict], Iterator[dict]]], ...] = (
+    ("extension-ufifas-florida-cultivars.json", ufifas_records),
+    ("extension-cornell-cultivars.json", cornell_records),
+    ("knowledge-graph-integrated-v3.json", knowledge_graph_records),
+    ("knowledge-graph-integrated-v2.json", knowledge_graph_records),
+    ("knowledge-graph-integrated.json", knowledge_graph_records),
+    ("knowledge-graph-sample.json", knowledge_graph_sample_records),
+    ("seed-company-burpee-florida.json", seed_company_records),
+    ("seed-company-johnnys-florida.json", seed_company_records),
+    ("seed-company-marys-florida.json", seed_company_records),
+)
+
+
+# =============================================================================
+# DIFF / APPLY
+# =============================================================================
+
+def _frozen(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return tuple(sorted((k, _frozen(v)) for k, v in value.items()))
+    return value
+
+
+def content_hash(record: Union[CultivarResearch, RegionalBloomData]) -> str:
+    """Digest of a record's values (equal for a dataclass and its compact or packed copy)."""
+    record_type = RegionalBloomData if hasattr(record, "region_id") else CultivarResearch
+    values = tuple(_frozen(getattr(record, f.name)) for f in fields(record_type))
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _imported_from(sources) -> set[str]:
+    return {source for source in sources if source and source.startswith(IMPORT_SOURCE_PREFIX)}
+
+
+@dataclass
+class ImportDiff:
+    """What an import would change in a database."""
+    added: list = field(default_factory=list)    # New CultivarResearch / RegionalBloomData records
+    changed: list = field(default_factory=list)  # Imported records whose content changed
+    unchanged: int = 0
+    removed_cultivars: list[str] = field(default_factory=list)
+    removed_regional_data: list[tuple[str, str]] = field(default_factory=list)  # (cultivar_id, region_id)
+    curated: list[str] = field(default_factory=list)  # Curated keys the import left alone
+    skipped_crops: dict[str, int] = field(default_factory=dict)  # Unknown crop -> cultivars not imported
+    errors: dict[str, str] = field(default_factory=dict)  # File name -> why it was not imported
+
+    @property
+    def changes(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed_cultivars) + len(self.removed_regional_data)
+
+    def apply(self, db: CultivarDatabase) -> int:
+        """Make the changes in db (cultivars before their regional data). Returns how many."""
+        for cultivar_id in self.removed_cultivars:
+            db.remove_cultivar(cultivar_id)
+        for cultivar_id, region_id in self.removed_regional_data:
+            db.remove_regional_data(cultivar_id, region_id)
+        records = self.added + self.changed
+        for record in records:
+            if isinstance(record, CultivarResearch):
+                db.add_cultivar(record)
+        for record in records:
+            if isinstance(record, RegionalBloomData):
+                db.add_regional_data(record)
+        return self.changes
+
+    def summary(self) -> dict:
+        def keys(records):
+            return [
+                f"{r.cultivar_id}:{r.region_id}" if isinstance(r, RegionalBloomData) else r.cultivar_id
+                for r in records
+            ]
+
+        return {
+            "added": keys(self.added),
+            "changed": keys(self.changed),
+            "unchanged": self.unchanged,
+            "removed": self.removed_cultivars + [f"{c}:{r}" for c, r in self.removed_regional_data],
+            "curated": self.curated,
+            "skipped_crops": self.skipped_crops,
+            "errors": self.errors,
+        }
+
+
+class ResearchImporter:
+    """Incremental import of the research JSON files into a CultivarDatabase."""
+
+    def __init__(self, research_dir: str, sources=RESEARCH_SOURCES):
+        self.research_dir = Path(research_dir)
+        self.sources = sources
+        # File name -> (content digest, partial records) of the last parse
+        self._parsed: dict[str, tuple[bytes, list[dict]]] = {}
+
+    def source_paths(self) -> list[Path]:
+        return [self.research_dir / file_name for file_name, _ in self.sources]
+
+    def _file_records(self, file_name: str, adapter) -> list[dict]:
+        """Partial records of one file (the whole file is loaded and parsed at once)."""
+        data = (self.research_dir / file_name).read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        cached = self._parsed.get(file_name)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        source = IMPORT_SOURCE_PREFIX + file_name
+        records = []
+        for record in adapter(json.loads(data)):
+            if _is_listing(record):
+                continue
+            record["research_sources"] = [source]
+            for regional in record.get("regions", {}).values():
+                regional["data_source"] = source
+            records.append(record)
+        self._parsed[file_name] = (digest, records)
+        return records
+
+    def read(self) -> tuple[dict[tuple[str, str], dict], dict[str, str]]:
+        """Merged partial records by (crop_type, name key), and errors by file name."""
+        merged: dict[tuple[str, str], dict] = {}
+        errors = {}
+        for file_name, adapter in self.sources:
+            try:
+                records = self._file_records(file_name, adapter)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                errors[file_name] = f"{type(e).__name__}: {e}"
+                # Keep what the file gave last time it parsed
+                records = self._parsed.get(file_name, (None, []))[1]
+            for record in records:
+                key = (record["crop_type"], _name_key(record["cultivar_name"]))
+                _merge(merged.setdefault(key, {"regions": {}}), record)
+        return merged, errors
+
+    def diff(self, db: CultivarDatabase) -> ImportDiff:
+        """Compare the research files with db (loads any pending partitions)."""
+        merged, errors = self.read()
+        failed = {IMPORT_SOURCE_PREFIX + file_name for file_name in errors}
+        diff = ImportDiff(errors=errors)
+
+        # Incoming cultivars resolve to the db cultivar of the same crop and
+        # name (or id); new ones get their name's slug, suffixed with the
+        # crop when another crop already uses it
+        existing: dict[tuple[str, str], str] = {}
+        for cultivar in db.cultivars.values():
+            existing.setdefault((cultivar.crop_type, _name_key(cultivar.cultivar_name)), cultivar.cultivar_id)
+            existing.setdefault((cultivar.crop_type, cultivar.cultivar_id), cultivar.cultivar_id)
+        claimed = set(db.cultivars)
+        crop_types = REGION_CROP_TYPES | {
+            cultivar.crop_type for cultivar in db.cultivars.values()
+            if not _imported_from(cultivar.research_sources)
+        }
+
+        seen = set()
+        for (crop_type, name_key), values in merged.items():
+            if crop_type not in crop_types:
+                diff.skipped_crops[crop_type] = diff.skipped_crops.get(crop_type, 0) + 1
+                continue
+            cultivar_id = existing.get((crop_type, name_key))
+            if cultivar_id in seen:
+                continue  # Another name of a cultivar already compared
+            if cultivar_id is None:
+                cultivar_id = name_key if name_key not in claimed else f"{name_key}_{crop_type}"
+                claimed.add(cultivar_id)
+
+            cultivar = CultivarResearch(
+                cultivar_id=cultivar_id,
+                **{name: value for name, value in values.items() if name in _CULTIVAR_FIELDS},
+            )
+            self._compare(diff, cultivar_id, db.get_cultivar(cultivar_id), cultivar, "research_sources")
+            seen.add(cultivar_id)
+
+            for region_id, regional_values in values["regions"].items():
+                key = f"{cultivar_id}:{region_id}"
+                regional = RegionalBloomData(cultivar_id=cultivar_id, region_id=region_id, **regional_values)
+                self._compare(diff, key, db.get_regional_data(cultivar_id, region_id), regional, "data_source")
+                seen.add(key)
+
+        for cultivar in db.cultivars.values():
+            imported = _imported_from(cultivar.research_sources)
+            if imported and cultivar.cultivar_id not in seen and not imported & failed:
+                diff.removed_cultivars.append(cultivar.cultivar_id)
+        removed = set(diff.removed_cultivars)
+        for key, regional in db.regional_data.items():
+            imported = _imported_from([regional.data_source])
+            if imported and key not in seen and not imported & failed and regional.cultivar_id not in removed:
+                diff.removed_regional_data.append((regional.cultivar_id, regional.region_id))
+        return diff
+
+    @staticmethod
+    def _compare(diff: ImportDiff, key: str, current, record, source_field: str) -> None:
+        if current is None:
+            diff.added.append(record)
+            return
+        sources = getattr(current, source_field)
+        if not _imported_from(sources if isinstance(sources, (list, tuple)) else [sources]):
+            diff.curated.append(key)
+        elif content_hash(current) != content_hash(record):
+            diff.changed.append(record)
+        else:
+            diff.unchanged += 1
+
+    def apply(self, db: CultivarDatabase) -> ImportDiff:
+        """diff(db), applied to db."""
+        diff = self.diff(db)
+        diff.apply(db)
+        return diff
+
+
+def _merge(into: dict, record: dict) -> None:
+    """Fold a partial record into a merged one (first value wins, lists union, flags or)."""
+    for name, value in record.items():
+        if name == "regions":
+            for region_id, regional in value.items():
+                target = into["regions"].setdefault(region_id, {})
+                for field_name, field_value in regional.items():
+                    if field_name in _REGIONAL_FIELDS:
+                        target.setdefault(field_name, field_value)
+        elif isinstance(value, bool):
+            into[name] = into.get(name, False) or value
+        elif isinstance(value, list):
+            items = into.setdefault(name, [])
+            items.extend(item for item in value if item not in items)
+        else:
+            into.setdefault(name, value)
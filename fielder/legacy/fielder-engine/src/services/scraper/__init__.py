@@ -13,18 +13,31 @@ Data sources:
 - Oregon State: Pears, cherries
 """
 
-from .base import ExtensionScraper, ScrapedData, DataSource
-from .ufifas import UFIFASScraper
-from .ucdavis import UCDavisScraper
-from .msu import MSUScraper
-from .tamu import TAMUScraper
-
-__all__ = [
-    "ExtensionScraper",
-    "ScrapedData",
-    "DataSource",
-    "UFIFASScraper",
-    "UCDavisScraper",
-    "MSUScraper",
-    "TAMUScraper",
-]
+from importlib import import_module
+
+# Exported name -> submodule defining it (imported on first access, see
+# fielder.services)
+_EXPORTS = {
+    "ExtensionScraper": ".base",
+    "ScrapedData": ".base",
+    "DataSource": ".base",
+    "UFIFASScraper": ".ufifas",
+    "UCDavisScraper": ".ucdavis",
+    "MSUScraper": ".msu",
+    "TAMUScraper": ".tamu",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,144 @@
+"""
+Response Serialization - Fast JSON encoding and payload compression.
+
+Prediction responses carry many floats and formatted dates, and
+multi-planting / batch responses get large. This module keeps the
+hot path cheap:
+
+- Date display strings come from memoized formatters instead of strftime
+  (the same handful of harvest dates are formatted over and over)
+- JSON encoding uses orjson when it is installed, stdlib json otherwise
+- Bodies can be gzip (or brotli, when installed) compressed for clients
+  that accept it
+
+Optional dependencies: orjson, brotli. Both are detected at import time
+and everything works without them.
+"""
+
+import gzip
+import json
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+# =============================================================================
+# DATE FORMATTING
+# =============================================================================
+# Equivalent to strftime("%B ...") in the C/English locale the API has
+# always used, without the per-call locale and format parsing overhead.
+
+MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+MONTH_ABBRS = tuple(name[:3] for name in MONTH_NAMES)
+
+
+@lru_cache(maxsize=4096)
+def format_month(d: date) -> str:
+    """'November' - same as strftime('%B')."""
+    return MONTH_NAMES[d.month]
+
+
+@lru_cache(maxsize=4096)
+def format_month_day(d: date) -> str:
+    """'November 05' - same as strftime('%B %d')."""
+    return f"{MONTH_NAMES[d.month]} {d.day:02d}"
+
+
+@lru_cache(maxsize=4096)
+def format_month_day_year(d: date) -> str:
+    """'November 05, 2025' - same as strftime('%B %d, %Y')."""
+    return f"{MONTH_NAMES[d.month]} {d.day:02d}, {d.year}"
+
+
+@lru_cache(maxsize=4096)
+def format_month_year(d: date) -> str:
+    """'November 2025' - same as strftime('%B %Y')."""
+    return f"{MONTH_NAMES[d.month]} {d.year}"
+
+
+@lru_cache(maxsize=4096)
+def format_short_month_day_year(d: date) -> str:
+    """'Nov 05, 2025' - same as strftime('%b %d, %Y')."""
+    return f"{MONTH_ABBRS[d.month]} {d.day:02d}, {d.year}"
+
+
+# =============================================================================
+# JSON ENCODING
+# =============================================================================
+
+def dumps(
+    obj: Any,
+    sort_keys: bool = False,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Uses orjson when available. Dates are passed through to default (when
+    given) so both encoders format them the same way.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=default,
+    ).encode("utf-8")
+
+
+def serializer_name() -> str:
+    """Name of the JSON encoder in use (for diagnostics/benchmarks)."""
+    return "orjson" if orjson is not None else "json"
+
+
+# =============================================================================
+# COMPRESSION
+# =============================================================================
+
+COMPRESS_MIN_BYTES = 1024  # Smaller bodies aren't worth the CPU or headers
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "text/html",
+    "text/plain",
+}
+
+
+def supported_encodings() -> list[str]:
+    """Content-Encodings we can produce, most preferred first."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress body with the given Content-Encoding ("br" or "gzip")."""
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
@@ -0,0 +1,223 @@
+"""
+Harvest Status Stream - Push status transitions instead of being polled.
+
+Clients that want to know when a crop flips to "Optimal harvest NOW!" used
+to poll /predict all day, each poll a full prediction whose answer only
+changes when a new weather day arrives.
+
+StatusBroadcaster keeps a materialized status table: one entry per
+(kind, region_id, subject_id), where kind is "crop" or "cultivar". The
+table is rebuilt at most once per day; the new table is diffed against
+the previous one and only the entries whose status changed are fanned
+out to subscribers whose keys match. Subscribers hold a bounded queue and
+are drained by the SSE endpoint (see format_sse).
+
+A rebuild runs a prediction per key (an upstream weather fetch each), so
+it happens on the broadcaster's own thread (start()), never in a
+subscriber's request: subscribers only read the published table. A failed
+rebuild is logged and retried on the next tick.
+
+    broadcaster = StatusBroadcaster(build_table)   # build_table(as_of) -> {key: entry}
+    broadcaster.start(interval_seconds=60)         # refresh(): cheap unless the day changed
+    subscription = broadcaster.subscribe({("crop", "indian_river", "navel_orange")})
+    event = subscription.queue.get(timeout=15)     # None: resend broadcaster.snapshot()
+
+A subject of "*" subscribes to every crop/cultivar of that kind in a region.
+"""
+
+import json
+import logging
+import queue
+import threading
+from datetime import date
+from typing import Callable, Iterable, Optional
+
+from . import metrics
+
+
+StatusKey = tuple[str, str, str]  # (kind, region_id, subject_id)
+
+WILDCARD = "*"
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(data: dict, event: Optional[str] = None, event_id: Optional[str] = None) -> str:
+    """One Server-Sent Events message."""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    """A client's keys plus the queue of transitions waiting to be sent."""
+
+    def __init__(self, keys: Iterable[StatusKey], max_pending: int = 256):
+        self.keys = frozenset(keys)
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        # Set when the client missed transitions (queue overflow) or had no
+        # table to start from; it should be sent a fresh snapshot
+        self.needs_snapshot = False
+
+    def matches(self, key: StatusKey) -> bool:
+        kind, region_id, _ = key
+        return key in self.keys or (kind, region_id, WILDCARD) in self.keys
+
+    def push(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.needs_snapshot = True
+
+    def request_snapshot(self) -> None:
+        """Flag the subscription for a fresh snapshot and wake its reader (a None event)."""
+        self.needs_snapshot = True
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass  # The reader is behind anyway and will see the flag
+
+
+class StatusBroadcaster:
+    """Materialized per-day status table with transition fan-out."""
+
+    def __init__(
+        self,
+        build_table: Callable[[date], dict[StatusKey, dict]],
+        today: Callable[[], date] = date.today,
+        max_pending: int = 256
+    ):
+        self._build_table = build_table
+        self._today = today
+        self._max_pending = max_pending
+        self._table: dict[StatusKey, dict] = {}
+        self._as_of: Optional[date] = None
+        self._subscribers: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_error: Optional[str] = None
+
+    @property
+    def as_of(self) -> Optional[date]:
+        """Day the current table was computed for."""
+        return self._as_of
+
+    def refresh(self) -> list[dict]:
+        """
+        Rebuild the table if the day changed and publish transitions.
+
+        Concurrent callers wait for a single rebuild. Returns the
+        transitions published (empty when the table was already current).
+        """
+        today = self._today()
+        if today == self._as_of:
+            return []
+        with self._build_lock:
+            if today == self._as_of:
+                return []
+            table = self._build_table(today)
+            previous, first_build = self._table, self._as_of is None
+            transitions = [] if first_build else self._diff(previous, table, today)
+
+            with self._lock:
+                self._table = table
+                self._as_of = today
+                subscribers = list(self._subscribers)
+
+        if first_build:
+            # Subscribed before there was anything to send
+            for subscription in subscribers:
+                subscription.request_snapshot()
+        for event in transitions:
+            key = (event["kind"], event["region_id"], event["subject_id"])
+            for subscription in subscribers:
+                if subscription.matches(key):
+                    subscription.push(event)
+        metrics.STATUS_TRANSITIONS.inc(len(transitions))
+        return transitions
+
+    def start(self, interval_seconds: float = 60.0) -> threading.Thread:
+        """
+        Refresh on a daemon thread every interval_seconds (no-op if running).
+
+        Safe to call per request: after a fork the parent's thread is gone
+        and the first call in the child starts a new one.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._stop.is_set():
+                self._stop = threading.Event()  # A stopping thread keeps its own event
+                self._thread = threading.Thread(
+                    target=self._run, args=(interval_seconds, self._stop), name="status-refresh", daemon=True
+                )
+                self._thread.start()
+            return self._thread
+
+    def stop(self) -> None:
+        """Stop the refresh thread after its current tick."""
+        self._stop.set()
+
+    def _run(self, interval_seconds: float, stop: threading.Event) -> None:
+        while True:
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.exception("Harvest status table rebuild failed; retrying in %ss", interval_seconds)
+            if stop.wait(interval_seconds):
+                return
+
+    @staticmethod
+    def _diff(previous: dict, table: dict, as_of: date) -> list[dict]:
+        transitions = []
+        for key, entry in table.items():
+            old = previous.get(key)
+            old_status = old["status"] if old else None
+            if old_status != entry["status"]:
+                transitions.append(StatusBroadcaster._event(key, entry, as_of, old_status))
+        return transitions
+
+    @staticmethod
+    def _event(key: StatusKey, entry: dict, as_of: date, previous_status: Optional[str] = None) -> dict:
+        kind, region_id, subject_id = key
+        return {
+            "kind": kind,
+            "region_id": region_id,
+            "subject_id": subject_id,
+            "previous_status": previous_status,
+            "as_of": as_of.isoformat(),
+            **entry,
+        }
+
+    def snapshot(self, subscription: Subscription) -> list[dict]:
+        """Current entry for every table key the subscription matches."""
+        with self._lock:
+            table, as_of = self._table, self._as_of
+        return [
+            self._event(key, entry, as_of)
+            for key, entry in table.items()
+            if subscription.matches(key)
+        ]
+
+    def subscribe(self, keys: Iterable[StatusKey]) -> Subscription:
+        subscription = Subscription(keys, self._max_pending)
+        with self._lock:
+            self._subscribers.append(subscription)
+            metrics.STATUS_SUBSCRIBERS.set(len(self._subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+            metrics.STATUS_SUBSCRIBERS.set(len(self._subscribers))
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
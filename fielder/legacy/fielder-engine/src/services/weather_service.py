@@ -20,10 +20,15 @@ from datetime import date, timedelta
 from typing import Optional
 import math
 import json
-import urllib.request
+import time
+from contextlib import nullcontext
 import urllib.parse
 from functools import lru_cache
 
+from . import metrics
+from .instrumentation import span
+from .rate_limit import OutboundLimiter, UpstreamBusy
+
 
 # Location coordinates for our growing regions
 # Maps region_id to (latitude, longitude)
@@ -233,13 +238,20 @@ class OpenMeteoProvider(WeatherProvider):
     - Forecast: api.open-meteo.com/v1/forecast
 
     Good option for MVP - no rate limits for reasonable usage.
+
+    With an OutboundLimiter every HTTP call holds one of its slots, and
+    raises UpstreamBusy when none frees up in time.
     """
 
-    def __init__(self):
+    def __init__(self, outbound: Optional[OutboundLimiter] = None):
         self.historical_url = "https://archive-api.open-meteo.com/v1/archive"
         self.forecast_url = "https://api.open-meteo.com/v1/forecast"
+        self.outbound = outbound
         self._climatology_cache: dict[tuple[str, int], dict] = {}
 
+    def _outbound_slot(self):
+        return self.outbound.slot() if self.outbound else nullcontext()
+
     def _get_coordinates(self, location_id: str) -> tuple[float, float]:
         """Get lat/lon for a location ID."""
         if location_id in REGION_COORDINATES:
@@ -252,18 +264,36 @@ class OpenMeteoProvider(WeatherProvider):
 
     def _fetch_json(self, url: str, params: dict) -> dict:
         """Fetch JSON from URL with query parameters."""
+        # Deferred: urllib.request drags in http.client, email and ssl, which
+        # processes that never call Open-Meteo shouldn't pay for at startup
+        import urllib.error
+        import urllib.request
+
         query_string = urllib.parse.urlencode(params)
         full_url = f"{url}?{query_string}"
+        endpoint = "archive" if url == self.historical_url else "forecast"
+        status = "error"
 
-        try:
-            with urllib.request.urlopen(full_url, timeout=30) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.URLError as e:
-            print(f"Weather API error: {e}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e}")
-            return {}
+        with self._outbound_slot():
+            started = time.perf_counter()
+            try:
+                with span("open_meteo_http"), urllib.request.urlopen(full_url, timeout=30) as response:
+                    status = str(response.status)
+                    return json.loads(response.read().decode('utf-8'))
+            except urllib.error.HTTPError as e:
+                status = str(e.code)
+                print(f"Weather API error: {e}")
+                return {}
+            except urllib.error.URLError as e:
+                print(f"Weather API error: {e}")
+                return {}
+            except json.JSONDecodeError as e:
+                status = "invalid_json"
+                print(f"JSON decode error: {e}")
+                return {}
+            finally:
+                metrics.UPSTREAM_REQUESTS.inc(endpoint=endpoint, status=status)
+                metrics.UPSTREAM_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint)
 
     def get_historical(
         self,
@@ -396,13 +426,30 @@ class OpenMeteoProvider(WeatherProvider):
         """
         cache_key = (location_id, month)
         if cache_key in self._climatology_cache:
+            metrics.record_cache("climatology", hit=True)
             return self._climatology_cache[cache_key]
 
+        metrics.record_cache("climatology", hit=False)
+        with span("climatology_build"):
+            return self._build_climatology(location_id, month, cache_key)
+
+    def _build_climatology(self, location_id: str, month: int, cache_key: tuple) -> dict:
+        """
+        Compute climatology for a month (cache miss path).
+
+        Only a result built from every year is cached - the cache lives as
+        long as the process, so one built from missing years or defaults
+        (an upstream outage) would outlast the outage. UpstreamBusy (our own
+        outbound cap is saturated) propagates instead of counting as a
+        missing year.
+        """
         # Get last 5 years of data for this month
         current_year = date.today().year
+        years = range(current_year - 5, current_year)
         all_observations = []
+        years_sampled = 0
 
-        for year in range(current_year - 5, current_year):
+        for year in years:
             # First and last day of the month
             if month == 12:
                 start = date(year, month, 1)
@@ -413,16 +460,18 @@ class OpenMeteoProvider(WeatherProvider):
 
             try:
                 obs = self.get_historical(location_id, start, end)
-                all_observations.extend(obs)
+            except UpstreamBusy:
+                raise
             except Exception:
-                # Skip years with missing data
-                continue
+                obs = []
+            if not obs:
+                continue  # Skip years with missing data
+            all_observations.extend(obs)
+            years_sampled += 1
 
         if not all_observations:
             # Return reasonable defaults based on month and location
-            result = self._get_default_climatology(location_id, month)
-            self._climatology_cache[cache_key] = result
-            return result
+            return self._get_default_climatology(location_id, month)
 
         # Calculate averages
         avg_high = sum(o.temp_high for o in all_observations) / len(all_observations)
@@ -442,10 +491,11 @@ class OpenMeteoProvider(WeatherProvider):
             "avg_daily_gdd_50": round(avg_gdd_50, 1),
             "avg_daily_gdd_55": round(avg_gdd_55, 1),
             "observation_count": len(all_observations),
-            "years_sampled": 5
+            "years_sampled": years_sampled
         }
 
-        self._climatology_cache[cache_key] = result
+        if years_sampled == len(years):
+            self._climatology_cache[cache_key] = result
         return result
 
     def _get_default_climatology(self, location_id: str, month: int) -> dict:
@@ -498,6 +548,63 @@ class OpenMeteoProvider(WeatherProvider):
         }
 
 
+class OfflineWeatherProvider(OpenMeteoProvider):
+    """
+    Open-Meteo stand-in that never touches the network.
+
+    Answers archive and forecast requests with Open-Meteo-shaped JSON built
+    from the default regional climatology (plus a small deterministic daily
+    wobble), so parsing, GDD math and caching all run exactly as in
+    production. Used for load testing and offline development.
+
+    latency_ms simulates upstream round-trip time per call.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, outbound: Optional[OutboundLimiter] = None):
+        super().__init__(outbound)
+        self.latency_ms = latency_ms
+        self._locations = {coords: loc for loc, coords in REGION_COORDINATES.items()}
+
+    def _fetch_json(self, url: str, params: dict) -> dict:
+        """Synthesize an Open-Meteo daily response for the requested range."""
+        endpoint = "archive" if url == self.historical_url else "forecast"
+
+        with self._outbound_slot(), span("open_meteo_http"):
+            started = time.perf_counter()
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+
+            location_id = self._locations[(params["latitude"], params["longitude"])]
+            if "start_date" in params:
+                start = date.fromisoformat(params["start_date"])
+                days = (date.fromisoformat(params["end_date"]) - start).days + 1
+            else:
+                start = date.today()
+                days = params.get("forecast_days", 7)
+
+            times, highs, lows = [], [], []
+            for offset in range(max(days, 0)):
+                day = start + timedelta(days=offset)
+                normals = self._get_default_climatology(location_id, day.month)
+                wobble = 3.0 * math.sin(day.toordinal() * 0.7)
+                times.append(day.isoformat())
+                highs.append((normals["avg_high"] + wobble - 32) * 5 / 9)
+                lows.append((normals["avg_low"] + wobble - 32) * 5 / 9)
+
+        metrics.UPSTREAM_REQUESTS.inc(endpoint=endpoint, status="offline")
+        metrics.UPSTREAM_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint)
+
+        return {
+            "daily": {
+                "time": times,
+                "temperature_2m_max": highs,
+                "temperature_2m_min": lows,
+                "precipitation_sum": [0.1] * len(times),
+                "precipitation_probability_max": [10] * len(times),
+            }
+        }
+
+
 class WeatherService:
     """
     Main weather service for Fielder.
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Catalog Reload Check
+
+AppServices.reload_cultivar_database() builds a new catalog version,
+validates it and swaps it in. A catalog that fails validation must be
+rejected with CatalogRejected while the version in service keeps serving
+unchanged; a valid one must get a higher version, bumping only the crops
+whose records changed.
+
+Run: python test_catalog_reload.py   (or: pytest test_catalog_reload.py)
+"""
+
+import dataclasses
+import os
+import sys
+import tempfile
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services import DataLoader
+from fielder.services.app_services import AppServices, CatalogRejected
+from fielder.services.catalog_snapshot import write_snapshot
+
+CHANGED_CULTIVAR = "florida_radiance"
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    return db
+
+
+def with_peak_brix(cultivar_id: str, peak_brix: float) -> CultivarDatabase:
+    """The loader's catalog with one cultivar's research peak Brix replaced."""
+    db = load_database()
+    db.add_cultivar(dataclasses.replace(db.get_cultivar(cultivar_id), research_peak_brix=peak_brix))
+    return db
+
+
+def assert_rejected(services: AppServices, path: str, db: CultivarDatabase):
+    """Reloading db from path raises CatalogRejected and leaves the served version alone."""
+    current = services.cultivar_database
+    version, crop_versions = current.version, dict(current.crop_versions)
+    search = services.cultivar_search
+
+    write_snapshot(db, path)
+    try:
+        services.reload_cultivar_database()
+    except CatalogRejected as e:
+        assert e.problems, "rejected without problems"
+        problems = e.problems
+    else:
+        raise AssertionError("invalid catalog was swapped in")
+
+    assert services.cultivar_database is current, "database in service replaced"
+    assert current.version == version
+    assert dict(current.crop_versions) == crop_versions
+    assert services.cultivar_search is search, "search index rebuilt"
+    assert services.reload_error and "Catalog rejected" in services.reload_error
+    return problems
+
+
+def test_rejected_reload_keeps_the_old_version():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        write_snapshot(load_database(), path)
+        services = AppServices(catalog_snapshot=path)
+        original = services.cultivar_database
+        peak_brix = original.get_cultivar(CHANGED_CULTIVAR).research_peak_brix
+
+        problems = assert_rejected(services, path, with_peak_brix(CHANGED_CULTIVAR, -1.0))
+        assert services.cultivar_database.get_cultivar(CHANGED_CULTIVAR).research_peak_brix == peak_brix
+        print(f"  negative peak Brix: rejected ({problems[0]}), version {original.version} kept")
+
+        assert_rejected(services, path, CultivarDatabase())
+        print(f"  empty catalog: rejected, version {original.version} kept")
+
+
+def test_valid_reload_swaps_in_a_new_version():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        write_snapshot(load_database(), path)
+        services = AppServices(catalog_snapshot=path)
+        original = services.cultivar_database
+        crop_type = original.get_cultivar(CHANGED_CULTIVAR).crop_type
+        peak_brix = original.get_cultivar(CHANGED_CULTIVAR).research_peak_brix
+
+        write_snapshot(with_peak_brix(CHANGED_CULTIVAR, peak_brix + 0.5), path)
+        result = services.reload_cultivar_database()
+        reloaded = services.cultivar_database
+        assert result["swapped"] and result["changed_crops"] == [crop_type], result
+        assert reloaded.version > original.version
+        assert reloaded.get_cultivar(CHANGED_CULTIVAR).research_peak_brix == peak_brix + 0.5
+        assert reloaded.crop_version(crop_type) == reloaded.version
+        for other in {c.crop_type for c in reloaded.cultivars.values()} - {crop_type}:
+            assert reloaded.crop_version(other) == original.crop_version(other), other
+        assert services.reload_error is None
+        print(f"  changed {crop_type}: version {original.version} -> {reloaded.version}, other crops kept theirs")
+
+        # A later bad file can't roll the new version back or replace it
+        assert_rejected(services, path, with_peak_brix(CHANGED_CULTIVAR, 0.0))
+        assert services.cultivar_database is reloaded
+        print(f"  then zero peak Brix: rejected, version {reloaded.version} kept")
+
+
+def main():
+    print_header("CATALOG RELOAD")
+    test_rejected_reload_keeps_the_old_version()
+    test_valid_reload_swaps_in_a_new_version()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
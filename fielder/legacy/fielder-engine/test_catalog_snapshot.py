@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot Check
+
+build_catalog_snapshot.py writes DataLoader.load_all() as a binary
+snapshot the app maps at startup. A snapshot must give back exactly the
+loader's records, and a damaged one (truncated, bytes flipped, wrong
+magic, built from other sources) must be rejected so the app falls back
+to the loader instead of failing on its first read.
+
+Run: python test_catalog_snapshot.py   (or: pytest test_catalog_snapshot.py)
+"""
+
+import os
+import sys
+import tempfile
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services import DataLoader
+from fielder.services.app_services import AppServices
+from fielder.services.catalog_snapshot import materialize, open_snapshot, write_snapshot
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    return db
+
+
+def snapshot_bytes(db: CultivarDatabase) -> bytes:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        write_snapshot(db, path)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def corruptions(data: bytes) -> dict[str, bytes]:
+    """Damaged copies of a snapshot, by what was done to them."""
+    def flipped(offset: int) -> bytes:
+        damaged = bytearray(data)
+        damaged[offset] ^= 0xFF
+        return bytes(damaged)
+
+    return {
+        "empty": b"",
+        "header only": data[:72],
+        "truncated in the tables": data[:1000],
+        "truncated in the records": data[:len(data) // 2],
+        "last byte missing": data[:-1],
+        "trailing garbage": data + b"\0" * 16,
+        "wrong magic": flipped(0),
+        "other sources": flipped(8),
+        "byte flipped in the tables": flipped(200),
+        "byte flipped in the records": flipped(len(data) // 2),
+    }
+
+
+def test_snapshot_matches_loader():
+    db = load_database()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        write_snapshot(db, path)
+        image = open_snapshot(path)
+        assert image is not None, "fresh snapshot rejected"
+        restored = materialize(image)
+        assert dict(restored.cultivars) == db.cultivars
+        assert dict(restored.regional_data) == db.regional_data
+        assert dict(restored.rootstocks) == db.rootstocks
+    print(f"  snapshot: {len(db.cultivars)} cultivars, {len(db.regional_data)} regional, "
+          f"{len(db.rootstocks)} rootstocks match the loader")
+
+
+def test_corrupted_snapshot_is_rejected():
+    data = snapshot_bytes(load_database())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        assert open_snapshot(path) is None, "missing file"
+        for name, damaged in corruptions(data).items():
+            with open(path, "wb") as f:
+                f.write(damaged)
+            assert open_snapshot(path) is None, f"{name}: not rejected"
+            print(f"  {name}: rejected")
+
+
+def test_services_fall_back_to_loader():
+    db = load_database()
+    data = snapshot_bytes(db)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.snapshot")
+        with open(path, "wb") as f:
+            f.write(data[:len(data) // 2])
+        services = AppServices(catalog_snapshot=path)
+        served = services.cultivar_database
+        assert services.cultivar_db_source == "loader", services.cultivar_db_source
+        assert served.cultivars == db.cultivars
+    print("  AppServices: corrupted snapshot ignored, loader used")
+
+
+def main():
+    print_header("CATALOG SNAPSHOT")
+    test_snapshot_matches_loader()
+    test_corrupted_snapshot_is_rejected()
+    test_services_fall_back_to_loader()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compact Cultivar Database Check
+
+CompactCultivarDatabase stores cultivars and regional data as slotted,
+interned records. It must hold the same catalog as CultivarDatabase:
+every record equal field for field (to_record() gives back the
+dataclass), in the same order, with the same indexes and query results,
+whether it is loaded directly or copied with from_database().
+
+Run: python test_compact_cultivar_database.py   (or: pytest test_compact_cultivar_database.py)
+"""
+
+import sys
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.compact_cultivar_database import (
+    CompactCultivar,
+    CompactCultivarDatabase,
+    CompactRegionalData,
+)
+from fielder.models.cultivar_database import INDEX_NAMES, CultivarDatabase, QualityTier
+from fielder.services import DataLoader
+
+YEAR = 2026
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load(db: CultivarDatabase) -> CultivarDatabase:
+    DataLoader(db).load_all()
+    return db
+
+
+def as_record(record):
+    return record.to_record() if hasattr(record, "to_record") else record
+
+
+def assert_same_catalog(compact: CultivarDatabase, reference: CultivarDatabase):
+    """Record-for-record, index and query equality."""
+    for name in ("cultivars", "regional_data", "rootstocks"):
+        mapping, expected = getattr(compact, name), getattr(reference, name)
+        assert list(mapping) == list(expected), f"{name}: keys or order differ"
+        for key, record in expected.items():
+            assert as_record(mapping[key]) == record, f"{name}[{key}] differs"
+    for cultivar in compact.cultivars.values():
+        assert isinstance(cultivar, CompactCultivar), cultivar.cultivar_id
+    for regional in compact.regional_data.values():
+        assert isinstance(regional, CompactRegionalData), regional.cultivar_id
+
+    for name in INDEX_NAMES:
+        assert getattr(compact, name) == getattr(reference, name), f"index {name} differs"
+
+    def ids(records):
+        return [record.cultivar_id for record in records]
+
+    crop_types = {cultivar.crop_type for cultivar in reference.cultivars.values()}
+    for crop_type in crop_types:
+        assert ids(compact.get_cultivars_by_crop_type(crop_type)) == ids(reference.get_cultivars_by_crop_type(crop_type))
+        assert ids(compact.get_heritage_cultivars(crop_type)) == ids(reference.get_heritage_cultivars(crop_type))
+        for tier in QualityTier:
+            assert (ids(compact.get_cultivars_by_quality_tier(crop_type, tier))
+                    == ids(reference.get_cultivars_by_quality_tier(crop_type, tier)))
+        for timing_class in ("early", "mid", "late"):
+            assert (ids(compact.get_cultivars_by_timing_class(crop_type, timing_class))
+                    == ids(reference.get_cultivars_by_timing_class(crop_type, timing_class)))
+        assert compact.get_rootstocks(crop_type) == reference.get_rootstocks(crop_type)
+
+    zones = {zone for cultivar in reference.cultivars.values() for zone in cultivar.optimal_usda_zones}
+    for zone in zones:
+        assert ids(compact.get_cultivars_for_usda_zone(zone)) == ids(reference.get_cultivars_for_usda_zone(zone))
+
+    for regional in reference.regional_data.values():
+        cultivar_id, region_id = regional.cultivar_id, regional.region_id
+        assert compact.get_regions_for_cultivar(cultivar_id) == reference.get_regions_for_cultivar(cultivar_id)
+        assert compact.get_cultivars_for_region(region_id) == reference.get_cultivars_for_region(region_id)
+        assert (compact.predict_harvest_window(cultivar_id, region_id, YEAR)
+                == reference.predict_harvest_window(cultivar_id, region_id, YEAR))
+
+
+def test_loaded_compact_database_matches():
+    reference = load(CultivarDatabase())
+    compact = load(CompactCultivarDatabase())
+    assert_same_catalog(compact, reference)
+    print(f"  loaded: {len(compact.cultivars)} cultivars, {len(compact.regional_data)} regional, "
+          f"{len(compact.rootstocks)} rootstocks match")
+
+
+def test_copied_compact_database_matches():
+    reference = load(CultivarDatabase())
+    compact = CompactCultivarDatabase.from_database(reference)
+    assert_same_catalog(compact, reference)
+    assert compact.version == reference.version
+    assert compact.last_modified == reference.last_modified
+    print("  from_database(): records, indexes and version match")
+
+
+def main():
+    print_header("COMPACT CULTIVAR DATABASE vs CultivarDatabase")
+    test_loaded_compact_database_matches()
+    test_copied_compact_database_matches()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
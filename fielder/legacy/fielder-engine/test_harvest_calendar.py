@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Harvest Calendar Check
+
+HarvestCalendar precomputes predict_harvest_window() for every
+cultivar x region pair, with NumPy when it is installed and stdlib arrays
+otherwise. Both build paths must give the same window, peak and Brix as
+CultivarDatabase.predict_harvest_window() for every pair and year,
+including windows that roll into the next year.
+
+Run: python test_harvest_calendar.py   (or: pytest test_harvest_calendar.py)
+"""
+
+from datetime import date
+import sys
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase
+from fielder.services import DataLoader
+from fielder.services import harvest_calendar
+from fielder.services.app_services import HARVEST_CALENDAR_YEARS, AppServices
+from fielder.services.harvest_calendar import HarvestCalendar
+
+YEARS = range(2024, 2029)
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    return db
+
+
+def check_calendar(db: CultivarDatabase, calendar: HarvestCalendar) -> int:
+    """Compare every pair and year with predict_harvest_window(); return the number checked."""
+    checked = 0
+    for regional in db.regional_data.values():
+        for year in YEARS:
+            expected = db.predict_harvest_window(regional.cultivar_id, regional.region_id, year)
+            actual = calendar.window(regional.cultivar_id, regional.region_id, year)
+            assert actual == expected, (regional.cultivar_id, regional.region_id, year, actual, expected)
+            checked += 1
+    assert checked and len(calendar), "no pairs in the calendar"
+    return checked
+
+
+def check_rows_in_window(calendar: HarvestCalendar):
+    """rows_in_window() returns exactly the rows whose window contains the day."""
+    for day in (date(2025, 1, 15), date(2026, 6, 1), date(2027, 12, 15)):
+        for peak in (False, True):
+            start, end = ("peak_start", "peak_end") if peak else ("window_start", "window_end")
+            expected = [
+                i for i in range(len(calendar))
+                if calendar.row(i)[start] <= day <= calendar.row(i)[end]
+            ]
+            assert calendar.rows_in_window(day, peak=peak) == expected, (day, peak)
+
+
+def test_stdlib_calendar_matches_predict_harvest_window():
+    db = load_database()
+    numpy = harvest_calendar.np
+    harvest_calendar.np = None
+    try:
+        calendar = HarvestCalendar.build(db, YEARS)
+    finally:
+        harvest_calendar.np = numpy
+    assert calendar.table is None
+    checked = check_calendar(db, calendar)
+    check_rows_in_window(calendar)
+    print(f"  stdlib arrays: {checked} windows match")
+
+
+def test_numpy_calendar_matches_predict_harvest_window():
+    if harvest_calendar.np is None:
+        print("  numpy: not installed, skipped")
+        return
+    db = load_database()
+    calendar = HarvestCalendar.build(db, YEARS)
+    assert calendar.table is not None
+    checked = check_calendar(db, calendar)
+    check_rows_in_window(calendar)
+    print(f"  numpy: {checked} windows match")
+
+
+def test_app_services_caches_calendar_per_year():
+    services = AppServices()
+    calendar_2026 = services.harvest_calendar(2026)
+    calendar_2027 = services.harvest_calendar(2027)
+    assert calendar_2026.years == [2025, 2026] and calendar_2027.years == [2026, 2027]
+    assert services.harvest_calendar(2026) is calendar_2026, "alternating years rebuilt the calendar"
+    for year in range(2000, 2000 + HARVEST_CALENDAR_YEARS):
+        services.harvest_calendar(year)
+    assert services.harvest_calendar(2026) is not calendar_2026, "cache is not bounded"
+    print(f"  AppServices: calendars cached per year, at most {HARVEST_CALENDAR_YEARS}")
+
+
+def main():
+    print_header("HARVEST CALENDAR vs predict_harvest_window()")
+    test_stdlib_calendar_matches_predict_harvest_window()
+    test_numpy_calendar_matches_predict_harvest_window()
+    test_app_services_caches_calendar_per_year()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
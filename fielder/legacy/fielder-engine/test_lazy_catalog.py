@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Lazy Catalog Check
+
+With a partition manifest (build_catalog_snapshot.py --manifest) a lazy
+CultivarDatabase loads only the DataLoader partitions a lookup needs: a
+lookup by id loads the partition the manifest names for it, an unknown id
+loads nothing, and once everything is loaded the catalog equals
+DataLoader.load_all().
+
+Run: python test_lazy_catalog.py   (or: pytest test_lazy_catalog.py)
+"""
+
+import sys
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import INDEX_NAMES, CultivarDatabase
+from fielder.services import DataLoader
+from fielder.services.catalog_snapshot import build_manifest
+from fielder.services.data_loader import CATALOG_PARTITIONS
+
+MANIFEST = build_manifest()
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def lazy_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).register_partitions(MANIFEST)
+    assert len(db.pending_partitions) == len(CATALOG_PARTITIONS)
+    return db
+
+
+def loaded(db: CultivarDatabase) -> set[str]:
+    pending = set(db.pending_partitions)
+    return {method[len("load_"):] for method, _ in CATALOG_PARTITIONS} - pending
+
+
+def partitions_of(kind: str, key: str) -> set[str]:
+    """Partitions holding key (all of them: a later one replaces the record)."""
+    names = {name for name, entry in MANIFEST.items() if entry["kind"] == kind and key in entry["ids"]}
+    assert names, (kind, key)
+    return names
+
+
+def test_lookup_loads_only_its_partition():
+    full = CultivarDatabase()
+    DataLoader(full).load_all()
+    for cultivar_id, cultivar in full.cultivars.items():
+        db = lazy_database()
+        assert db.get_cultivar(cultivar_id) == cultivar, cultivar_id
+        assert loaded(db) == partitions_of("cultivars", cultivar_id), (cultivar_id, loaded(db))
+    for key, regional in full.regional_data.items():
+        db = lazy_database()
+        assert db.get_regional_data(regional.cultivar_id, regional.region_id) == regional, key
+        assert loaded(db) == partitions_of("regional_data", key), (key, loaded(db))
+    print(f"  {len(full.cultivars)} cultivar and {len(full.regional_data)} regional lookups "
+          f"loaded only the partitions holding their id")
+
+
+def test_unknown_id_loads_nothing():
+    db = lazy_database()
+    version = db.version
+    assert db.get_cultivar("no_such_cultivar") is None
+    assert db.get_regional_data("no_such_cultivar", "central_florida") is None
+    assert db.get_rootstock("no_such_rootstock") is None
+    assert not loaded(db), loaded(db)
+    assert db.version == version
+    print("  unknown ids: nothing loaded")
+
+
+def test_fully_loaded_equals_load_all():
+    full = CultivarDatabase()
+    DataLoader(full).load_all()
+    db = lazy_database()
+    db.get_cultivar("florida_radiance")  # Load one partition out of order first
+    db.load_partitions()
+    assert not db.pending_partitions
+    for name in ("cultivars", "regional_data", "rootstocks"):
+        assert list(getattr(db, name).items()) == list(getattr(full, name).items()), name
+    for name in INDEX_NAMES:
+        assert getattr(db, name) == getattr(full, name), f"index {name} differs"
+    print("  fully loaded: records, order and indexes equal load_all()")
+
+
+def main():
+    print_header("LAZY CATALOG PARTITIONS")
+    test_lookup_loads_only_its_partition()
+    test_unknown_id_loads_nothing()
+    test_fully_loaded_equals_load_all()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
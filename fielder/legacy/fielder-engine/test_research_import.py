@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Research Import Check
+
+ResearchImporter adds cultivars from the research JSON files to the
+catalog. Hand-curated DataLoader records always win: an import may add,
+replace and remove only records it imported itself, and an incoming
+record that collides with a curated one is reported in ImportDiff.curated
+and left out. Source crop groups must land on the engine's crop ids, so
+a curated cultivar is never imported again under another crop, and
+cultivars of crops the engine doesn't know are skipped.
+
+Run: python test_research_import.py   (or: pytest test_research_import.py)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import CultivarDatabase, CultivarResearch
+from fielder.models.region import US_GROWING_REGIONS
+from fielder.services import DataLoader
+from fielder.services.research_importer import ResearchImporter, _name_key, cornell_records
+
+RESEARCH_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "data", "research"
+))
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    return db
+
+
+def curated_records(db: CultivarDatabase) -> dict:
+    """Every DataLoader record of db by key (cultivar id or "cultivar:region")."""
+    return {**dict(db.cultivars), **dict(db.regional_data)}
+
+
+def changed_keys(diff) -> set[str]:
+    """Keys the diff would add, replace or remove."""
+    summary = diff.summary()
+    return set(summary["added"]) | set(summary["changed"]) | set(summary["removed"])
+
+
+def assert_curated_unchanged(db: CultivarDatabase, curated: dict):
+    for key, record in curated.items():
+        current = db.get_regional_data(*key.split(":")) if ":" in key else db.get_cultivar(key)
+        assert current == record, f"curated record {key} changed"
+
+
+def predictable_crops(db: CultivarDatabase) -> set[str]:
+    """Crops the engine has regions or curated cultivars for."""
+    crops = {crop for region in US_GROWING_REGIONS.values() for crop in region.viable_crops}
+    return crops | {cultivar.crop_type for cultivar in db.cultivars.values()}
+
+
+def test_research_files_leave_curated_records_alone():
+    db = load_database()
+    curated = curated_records(db)
+    curated_names = {(c.crop_type, _name_key(c.cultivar_name)) for c in db.cultivars.values()}
+    crops = predictable_crops(db)
+    importer = ResearchImporter(RESEARCH_DIR)
+
+    diff = importer.diff(db)
+    assert not diff.errors, diff.errors
+    assert diff.curated, "no collisions with curated records"
+    assert {"ruby_red", "valencia"} <= set(diff.curated), diff.curated
+    assert not changed_keys(diff) & curated.keys(), changed_keys(diff) & curated.keys()
+
+    added = [record for record in diff.added if isinstance(record, CultivarResearch)]
+    assert added, "nothing imported"
+    for cultivar in added:
+        key = (cultivar.crop_type, _name_key(cultivar.cultivar_name))
+        assert key not in curated_names, f"{cultivar.cultivar_id} duplicates a curated cultivar"
+        assert cultivar.crop_type in crops, f"{cultivar.cultivar_id}: unknown crop {cultivar.crop_type}"
+        assert cultivar.cultivar_id not in crops, f"{cultivar.cultivar_id}: a crop name, not a cultivar"
+        assert not cultivar.cultivar_name.startswith("("), cultivar.cultivar_name
+        assert "general" not in cultivar.cultivar_name.lower(), cultivar.cultivar_name
+    assert diff.skipped_crops, "no unknown crops reported"
+    assert not set(diff.skipped_crops) & crops, diff.skipped_crops
+    diff.apply(db)
+    assert_curated_unchanged(db, curated)
+    print(f"  {len(added)} cultivars added to known crops, {len(diff.curated)} curated collisions left alone, "
+          f"{sum(diff.skipped_crops.values())} of unknown crops skipped")
+
+    again = importer.diff(db)
+    assert again.changes == 0, again.summary()
+    assert sorted(again.curated) == sorted(diff.curated)
+    print("  second import: no changes")
+
+
+def test_colliding_record_is_reported_not_applied():
+    db = load_database()
+    curated = curated_records(db)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trial.json")
+        importer = ResearchImporter(tmp, sources=(("trial.json", cornell_records),))
+
+        def write(entries: dict, peppers: dict = None):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"cultivars": {"strawberry": entries, "peppers": peppers or {}}}, f)
+
+        write({
+            "radiance": {"cultivarName": "Florida Radiance", "daysToMaturity": 999, "qualityTier": "commodity"},
+            "trial": {"cultivarName": "Trial Berry", "daysToMaturity": 90},
+            "general": {"cultivarName": "Strawberries (general for Zones 9-10)", "daysToMaturity": 90},
+        }, peppers={"aji": {"cultivarName": "Aji Trial", "daysToMaturity": 80}})
+        diff = importer.diff(db)
+        assert "florida_radiance" in diff.curated, diff.summary()
+        assert diff.summary()["added"] == ["trial_berry"], diff.summary()
+        assert diff.skipped_crops == {"pepper": 1}, diff.skipped_crops
+        diff.apply(db)
+        assert_curated_unchanged(db, curated)
+        assert db.get_cultivar("trial_berry").research_sources == ["research/trial.json"]
+        print("  trial file: Florida Radiance reported as curated, general listing and pepper skipped")
+
+        # The file drops both entries: only the imported record goes
+        write({})
+        diff = importer.diff(db)
+        assert diff.removed_cultivars == ["trial_berry"], diff.summary()
+        diff.apply(db)
+        assert db.get_cultivar("trial_berry") is None
+        assert_curated_unchanged(db, curated)
+        assert set(db.cultivars) == {key for key in curated if ":" not in key}
+        print("  entries dropped from the file: imported record removed, curated kept")
+
+
+def main():
+    print_header("RESEARCH IMPORT vs CURATED RECORDS")
+    test_research_files_leave_curated_records_alone()
+    test_colliding_record_is_reported_not_applied()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Shared Cultivar Database Check
+
+SharedCultivarDatabase serves the catalog from a packed, read-only image
+that forked workers share. Reading through it must give the same catalog
+as CultivarDatabase: every record equal, in the same order, with the same
+indexes and query results, whether the image is in memory, in a shared
+mapping read by a forked worker, or in a memory-mapped file.
+
+Run: python test_shared_cultivar_database.py   (or: pytest test_shared_cultivar_database.py)
+"""
+
+import os
+import sys
+import tempfile
+
+# Add project to path
+sys.path.insert(0, '/home/alex/projects/fielder_project')
+
+from fielder.models.cultivar_database import INDEX_NAMES, CultivarDatabase, QualityTier
+from fielder.models.shared_cultivar_database import SharedCultivarDatabase, write_image
+from fielder.services import DataLoader
+
+YEAR = 2026
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def load_database() -> CultivarDatabase:
+    db = CultivarDatabase()
+    DataLoader(db).load_all()
+    return db
+
+
+def assert_same_catalog(shared: CultivarDatabase, reference: CultivarDatabase):
+    """Record-for-record, index and query equality."""
+    for name in ("cultivars", "regional_data", "rootstocks"):
+        mapping, expected = getattr(shared, name), getattr(reference, name)
+        assert list(mapping) == list(expected), f"{name}: keys or order differ"
+        assert len(mapping) == len(expected), name
+        for key, record in expected.items():
+            assert key in mapping, f"{name}[{key}] missing"
+            assert mapping[key] == record, f"{name}[{key}] differs"
+        assert list(mapping.values()) == list(expected.values()), f"{name}: values() differ"
+    assert "no_such_cultivar" not in shared.cultivars
+    assert shared.get_cultivar("no_such_cultivar") is None
+
+    for name in INDEX_NAMES:
+        index, expected = getattr(shared, name), getattr(reference, name)
+        assert {key: list(ids) for key, ids in index.items()} == expected, f"index {name} differs"
+
+    def ids(records):
+        return [record.cultivar_id for record in records]
+
+    crop_types = {cultivar.crop_type for cultivar in reference.cultivars.values()}
+    for crop_type in crop_types:
+        assert ids(shared.get_cultivars_by_crop_type(crop_type)) == ids(reference.get_cultivars_by_crop_type(crop_type))
+        assert ids(shared.get_heritage_cultivars(crop_type)) == ids(reference.get_heritage_cultivars(crop_type))
+        for tier in QualityTier:
+            assert (ids(shared.get_cultivars_by_quality_tier(crop_type, tier))
+                    == ids(reference.get_cultivars_by_quality_tier(crop_type, tier)))
+        assert shared.get_rootstocks(crop_type) == reference.get_rootstocks(crop_type)
+    assert shared.get_rootstocks() == reference.get_rootstocks()
+
+    for regional in reference.regional_data.values():
+        cultivar_id, region_id = regional.cultivar_id, regional.region_id
+        assert shared.get_regions_for_cultivar(cultivar_id) == reference.get_regions_for_cultivar(cultivar_id)
+        assert shared.get_cultivars_for_region(region_id) == reference.get_cultivars_for_region(region_id)
+        assert (shared.predict_harvest_window(cultivar_id, region_id, YEAR)
+                == reference.predict_harvest_window(cultivar_id, region_id, YEAR))
+
+
+def test_in_memory_image_matches():
+    reference = load_database()
+    shared = SharedCultivarDatabase.from_database(reference, shared=False)
+    assert_same_catalog(shared, reference)
+    assert shared.version == reference.version
+    print(f"  in memory: {len(reference.cultivars)} cultivars, {len(reference.regional_data)} regional, "
+          f"{len(reference.rootstocks)} rootstocks match ({shared.image_size:,} byte image)")
+
+
+def test_forked_worker_reads_the_same_catalog():
+    reference = load_database()
+    shared = SharedCultivarDatabase.from_database(reference, shared=True)
+    if not hasattr(os, "fork"):
+        assert_same_catalog(shared, reference)
+        print("  shared mapping: matches (fork not available, checked in-process)")
+        return
+
+    pid = os.fork()
+    if pid == 0:  # Worker: report through the exit status
+        try:
+            assert_same_catalog(shared, reference)
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0, "forked worker read a different catalog"
+    print("  shared mapping: a forked worker reads the same catalog")
+
+
+def test_mapped_file_matches():
+    reference = load_database()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.image")
+        write_image(reference, path)
+        shared = SharedCultivarDatabase.open(path)
+        assert_same_catalog(shared, reference)
+        del shared
+    print("  mapped file: matches")
+
+
+def test_image_is_read_only():
+    reference = load_database()
+    shared = SharedCultivarDatabase.from_database(reference, shared=False)
+    cultivar = next(iter(reference.cultivars.values()))
+    for method, argument in (
+        (shared.add_cultivar, cultivar),
+        (shared.remove_cultivar, cultivar.cultivar_id),
+    ):
+        try:
+            method(argument)
+        except TypeError:
+            continue
+        raise AssertionError(f"{method.__name__} did not raise TypeError")
+    assert list(shared.cultivars) == list(reference.cultivars)
+    print("  add/remove raise TypeError")
+
+
+def main():
+    print_header("SHARED CULTIVAR DATABASE vs CultivarDatabase")
+    test_in_memory_image_matches()
+    test_forked_worker_reads_the_same_catalog()
+    test_mapped_file_matches()
+    test_image_is_read_only()
+    print("\n  All checks passed.")
+
+
+if __name__ == "__main__":
+    main()